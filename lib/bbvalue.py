@@ -3,16 +3,23 @@
    a string."""
 
 import re
+import threading
+import weakref
 from collections import deque
 from itertools import chain
+from cache import LRUCache, MetadataCache
 import bb.data
 from bb import msg, utils
 
 class RecursionError(RuntimeError):
-    def __init__(self, variable):
+    def __init__(self, variable, path=None):
         self.variable = variable
+        self.path = path
 
     def __str__(self):
+        if self.path:
+            return "Recursive variable reference for '%s' (%s)" % \
+                   (self.variable, " -> ".join(self.path))
         return "Recursive variable reference for '%s'" % self.variable
 
 class PythonExpansionError(Exception):
@@ -62,6 +69,9 @@ class Vistor(object):
 class Value(object):
     """A simple value that is meant as a base class for all other values."""
 
+    # Values are created in huge numbers, so none of them carry a __dict__.
+    __slots__ = ("metadata",)
+
     def __init__(self, metadata):
         self.metadata = metadata
 
@@ -78,10 +88,36 @@ class Value(object):
     def __str__(self):
         return self.resolve()
 
+    def __getstate__(self):
+        return dict((name, getattr(self, name))
+                    for name in _slot_names(self.__class__)
+                    if hasattr(self, name))
+
+    def __setstate__(self, state):
+        for name, value in state.iteritems():
+            setattr(self, name, value)
+
+def _slot_names(cls):
+    """Return the names of the slots of cls and all of its bases"""
+
+    try:
+        return _slot_names.memory[cls]
+    except KeyError:
+        names = []
+        for klass in cls.__mro__:
+            names.extend(name for name in klass.__dict__.get("__slots__", ())
+                         if name != "__weakref__")
+        _slot_names.memory[cls] = names
+        return names
+
+_slot_names.memory = {}
+
 class Literal(Value):
     """A simple value that resolves to whatever string it was initialized
        with."""
 
+    __slots__ = ("value",)
+
     def __init__(self, metadata, value):
         Value.__init__(self, metadata)
         self.value = value
@@ -103,6 +139,10 @@ class Compound(Value):
        and literals.  The value of a compound value resolves to the
        concatenation of all its component values."""
 
+    # Weakly referenceable, so bbvalue can hand back the same value while
+    # it is still in use.
+    __slots__ = ("field_components", "__weakref__")
+
     def __init__(self, metadata, components=[]):
         Value.__init__(self, metadata)
         self.field_components = components[:]
@@ -142,7 +182,7 @@ class Compound(Value):
             self.append(value)
 
     def resolve(self):
-        return "".join(c.resolve() for c in self.field_components)
+        return evaluate(self)
 
 class LazyCompound(Compound):
     """A Compound value which composes 3 independent lists of components:
@@ -151,6 +191,8 @@ class LazyCompound(Compound):
        end of the processing.  In this implementation, they're applied at
        resolve time."""
 
+    __slots__ = ("field_prepend", "field_append")
+
     def __init__(self, metadata, components=[], append=[], prepend=[]):
         Compound.__init__(self, metadata, components)
         self.field_prepend = prepend[:]
@@ -180,77 +222,282 @@ class LazyCompound(Compound):
         return self._append(value, self.field_append)
 
     def resolve(self):
-        components = chain(self.field_prepend, self.field_components,
-                           self.field_append)
-        return "".join(c.resolve() for c in components)
+        return evaluate(self)
 
 class PythonValue(Compound):
     """A compound value that represents a value to be evaluated in Python.
        The resolution of a PythonValue takes the resolution of its
        components and returns that resolution as evaluated by Python."""
 
+    __slots__ = ()
+
     def code(self):
-        return super(PythonValue, self).resolve()
+        return evaluate(self, _JOIN)
 
     def resolve(self):
-        codeobj = compile(self.code().strip(), "<expansion>", "eval")
-        try:
-            value = str(utils.better_eval(codeobj, {"d": self.metadata}))
-        except Exception, exc:
-            raise PythonExpansionError(exc, self)
-        return bbparse(value, self.metadata).resolve()
+        return evaluate(self)
 
 class VariableRef(Compound):
     """A compound value which holds a reference to another value.  The
        resolution of a CompundValue dereferences the value referenced and
        returns the resolution of the dereferenced value."""
 
-    def __init__(self, metadata, components=[]):
-        Compound.__init__(self, metadata, components)
-        self.locked = False
+    __slots__ = ()
 
     def referred(self):
         """Returns the name of the value being referred to."""
 
-        return super(VariableRef, self).resolve()
+        return evaluate(self, _JOIN)
 
     def resolve(self):
-        refname = self.referred()
-        if self.locked:
-            raise RecursionError(refname)
-
-        newvalue = bbvalue(refname, self.metadata)
-
-        self.locked = True
-        if newvalue:
-            retvalue = newvalue.resolve()
-        else:
-            retvalue = "${%s}" % refname
-        self.locked = False
+        return evaluate(self)
 
-        return retvalue
+# The resolved values of variables, along with the dependencies which
+# determine when they're out of date.
+VariableRef.memory = MetadataCache(maxsize=100000, maxbytes=64 * 1024 * 1024,
+                                   sizeof=lambda varname, entry: len(entry[0]))
 
 class ShellSnippet(Compound):
     """A compound value which holds shell code"""
 
+    __slots__ = ()
+
 class PythonSnippet(Compound):
     """A compound value which holds python code"""
 
+    __slots__ = ()
+
 class Conditional(Compound):
     """A Compound which resolves to its components only when the associated
        condition is true.  The condition is a function which is passed the
        metadata instance, and returns a boolean result.  A condition of 'None'
        is equivalent to an unconditional value."""
 
+    __slots__ = ("condition",)
+
     def __init__(self, metadata, condition=None, components=[]):
         super(Conditional, self).__init__(metadata, components)
         self.condition = condition
 
     def resolve(self):
-        if self.condition is None or self.condition(self.metadata):
-            return super(Conditional, self).resolve()
-        else:
-            return ""
+        return evaluate(self)
+
+class Dependencies(dict):
+    """The unexpanded values of the variables consulted while resolving a
+       variable, keyed by name.  A resolved value remains valid for as long
+       as these are unchanged in the metadata.  If something was consulted
+       which can't be tracked this way, such as inline python, the
+       dependencies are not cacheable."""
+
+    cacheable = True
+
+    def current(self, metadata):
+        """Determine if none of the dependencies have changed"""
+
+        for varname, strvalue in self.iteritems():
+            if metadata.getVar(varname, False) != strvalue:
+                return False
+        return True
+
+class _Resolving(threading.local):
+    """Per thread state of the variables currently being resolved: the
+       chain of variable names, for cycle detection, and the Dependencies
+       being collected for each of them."""
+
+    def __init__(self):
+        self.path = []
+        self.names = set()
+        self.collecting = []
+
+_resolving = _Resolving()
+
+def _depend(deps):
+    """Record deps as dependencies of the variable being resolved"""
+
+    collecting = _resolving.collecting
+    if collecting:
+        outer = collecting[-1]
+        outer.update(deps)
+        if not deps.cacheable:
+            outer.cacheable = False
+
+def _uncacheable():
+    """Mark the variable being resolved as not cacheable"""
+
+    collecting = _resolving.collecting
+    if collecting:
+        collecting[-1].cacheable = False
+
+# The ways in which evaluate handles a value.  A frame on its stack is a list
+# of the handling, the value, an iterator over the components yet to be
+# resolved, the resolved components, and, for a dereference, the variable name
+# and its Dependencies.
+_JOIN, _LAZY, _CONDITIONAL, _PYTHON, _REFERENCE, _DEREFERENCE = range(6)
+
+_handling = {
+    Compound: _JOIN,
+    ShellSnippet: _JOIN,
+    PythonSnippet: _JOIN,
+    LazyCompound: _LAZY,
+    Conditional: _CONDITIONAL,
+    PythonValue: _PYTHON,
+    VariableRef: _REFERENCE,
+}
+
+def _handling_for(cls):
+    """Determine how evaluate should handle values of type cls.  Subclasses
+       are handled like their base unless they override resolve, in which
+       case None is returned, and their resolve is called instead."""
+
+    try:
+        return _handling[cls]
+    except KeyError:
+        handling = None
+        for base in cls.__mro__[1:]:
+            if base in _handling:
+                if base.resolve == cls.resolve:
+                    handling = _handling[base]
+                break
+        _handling[cls] = handling
+        return handling
+
+def _start(value, stack, handling=None):
+    """Begin resolving value.  Returns its resolution if that is immediately
+       available, otherwise pushes a frame for it and returns None."""
+
+    cls = value.__class__
+    if cls is Literal:
+        return str(value.value)
+
+    if handling is None:
+        handling = _handling_for(cls)
+        if handling is None:
+            return value.resolve()
+
+    if handling == _LAZY:
+        components = chain(value.field_prepend, value.field_components,
+                           value.field_append)
+    elif handling == _CONDITIONAL:
+        if value.condition is not None:
+            # What a condition consults can't be tracked
+            _uncacheable()
+            if not value.condition(value.metadata):
+                return ""
+        components = value.field_components
+    elif handling == _PYTHON:
+        # The python may consult anything at all, so its result can't be
+        # validated by the values of the variables we know about.
+        _uncacheable()
+        components = value.field_components
+    else:
+        components = value.field_components
+
+    stack.append([handling, value, iter(components), [], None])
+
+def _finish(frame, stack):
+    """Complete the resolution of the value of a frame whose components are
+       all resolved.  Returns the resolution, or None if another frame had
+       to be pushed to obtain it."""
+
+    handling, value, _, parts, extra = frame
+    if handling == _PYTHON:
+        codeobj = compile_expression("".join(parts).strip())
+        try:
+            result = str(utils.better_eval(codeobj, {"d": value.metadata}))
+        except Exception, exc:
+            raise PythonExpansionError(exc, value)
+        return _start(bbparse(result, value.metadata), stack)
+    elif handling == _REFERENCE:
+        return _dereference(value, "".join(parts), stack)
+    elif handling == _DEREFERENCE:
+        refname, deps = extra
+        retvalue = "".join(parts)
+        _resolving.path.pop()
+        _resolving.names.remove(refname)
+        _resolving.collecting.pop()
+        if deps.cacheable:
+            VariableRef.memory.store(value.metadata, refname, (retvalue, deps))
+        _depend(deps)
+        return retvalue
+    else:
+        return "".join(parts)
+
+def _dereference(value, refname, stack):
+    """Begin resolving the variable refname, referred to by value."""
+
+    if refname in _resolving.names:
+        path = _resolving.path
+        raise RecursionError(refname, path[path.index(refname):] + [refname])
+
+    metadata = value.metadata
+    cached = VariableRef.memory.lookup(metadata, refname)
+    if cached is not None:
+        retvalue, deps = cached
+        if deps.current(metadata):
+            _depend(deps)
+            return retvalue
+
+    deps = Dependencies()
+    deps[refname] = metadata.getVar(refname, False)
+    newvalue = bbvalue(refname, metadata)
+    if not newvalue:
+        VariableRef.memory.store(metadata, refname, ("${%s}" % refname, deps))
+        _depend(deps)
+        return "${%s}" % refname
+
+    _resolving.path.append(refname)
+    _resolving.names.add(refname)
+    _resolving.collecting.append(deps)
+    stack.append([_DEREFERENCE, value, iter([newvalue]), [], (refname, deps)])
+
+def compile_expression(code):
+    """Compile the source of an inline python expression.  The same
+       expressions turn up throughout the metadata, so the code objects are
+       kept for reuse."""
+
+    codeobj = compile_expression.cache.get(code)
+    if codeobj is None:
+        codeobj = compile(code, "<expansion>", "eval")
+        compile_expression.cache[code] = codeobj
+    return codeobj
+
+compile_expression.cache = LRUCache(maxsize=10000)
+
+def evaluate(value, handling=None):
+    """Resolve a value to a string without python recursion, by keeping the
+       values being resolved on an explicit stack.  Variable references are
+       followed, with cycles reported as a RecursionError including the full
+       chain of references.  The handling argument overrides the way in which
+       value itself is handled; _JOIN obtains the plain concatenation of its
+       components, as used for the name of a VariableRef or the code of a
+       PythonValue."""
+
+    stack = []
+    depth = len(_resolving.path)
+    try:
+        result = _start(value, stack, handling)
+        while stack:
+            frame = stack[-1]
+            if result is not None:
+                frame[3].append(result)
+                result = None
+
+            for component in frame[2]:
+                result = _start(component, stack)
+                if result is None:
+                    break
+                frame[3].append(result)
+                result = None
+            else:
+                stack.pop()
+                result = _finish(frame, stack)
+        return result
+    finally:
+        if len(_resolving.path) > depth:
+            for refname in _resolving.path[depth:]:
+                _resolving.names.discard(refname)
+            del _resolving.path[depth:]
+            del _resolving.collecting[depth:]
 
 def bbvalue(varname, metadata):
     """Constructs a new value from a variable defined in the BitBake
@@ -263,68 +510,133 @@ def bbvalue(varname, metadata):
     if not isinstance(strvalue, basestring):
         return Literal(metadata, strvalue)
 
-    sigtup = (varname, strvalue, id(metadata))
-
-    if sigtup in bbvalue.memory:
-        return bbvalue.memory[sigtup]
-
-    value = bbparse(strvalue, metadata)
-    if metadata.getVarFlag(varname, "func"):
-        if metadata.getVarFlag(varname, "python"):
-            value = PythonSnippet(metadata, [value])
+    sigtup = (varname, strvalue)
+    boundkey = (sigtup, id(metadata))
+    value = bbvalue.bound.get(boundkey)
+    if value is not None and value.metadata is metadata:
+        return value
+
+    entry = bbvalue.memory.lookup(metadata, sigtup)
+    if entry is None:
+        if metadata.getVarFlag(varname, "func"):
+            if metadata.getVarFlag(varname, "python"):
+                snippet = PythonSnippet
+            else:
+                snippet = ShellSnippet
         else:
-            value = ShellSnippet(metadata, [value])
-
-    bbvalue.memory[sigtup] = value
-
+            snippet = None
+        entry = (snippet, _skeleton(strvalue))
+        bbvalue.memory.store(metadata, sigtup, entry)
+
+    snippet, skeleton = entry
+    value = bind(skeleton, metadata)
+    if snippet is not None:
+        value = snippet(metadata, [value])
+    bbvalue.bound[boundkey] = value
     return value
 
-bbvalue.memory = {}
+# The kind of snippet each variable is, and the skeleton of its value, which
+# is bound to the metadata on lookup.  Nothing cached refers to the metadata,
+# so it can still be garbage collected, dropping its entries.  The entries are
+# bounded both in count and in the total length of the strings they were
+# parsed from, which is a reasonable proxy for their size.
+bbvalue.memory = MetadataCache(maxsize=100000, maxbytes=64 * 1024 * 1024,
+                               sizeof=lambda sigtup, entry: len(sigtup[1]))
+
+# The values bound from those entries, for as long as they're in use.
+bbvalue.bound = weakref.WeakValueDictionary()
 
 def bbparse(str, metadata):
     """Parses a metadata string into a value Abstract Syntax Tree (AST) which
        represents the structure of that string."""
 
-    class Tokenizer(object):
-        variable_ref = re.compile(r"(\$\{@|\$\{|\})")
-
-        def __init__(self, str):
-            self.tokens = [var for var in Tokenizer.variable_ref.split(str)                                    if var]
-            self.i = 0
-
-        def next(self):
-            self.i += 1
-            return self
-
-        @property
-        def current(self):
-            if self.i < len(self.tokens):
-                return self.tokens[self.i]
-            else:
-                return None
-
-    def _parse(toker, parent):
-        clsmap = { '${': VariableRef, '${@': PythonValue }
-        while toker.current:
-            token = toker.current
-            if token in clsmap:
-                # Attempt to specutively parse the reference.  If the
-                # reference never closes, then revert to a literal.
-                value = _parse(toker.next(), clsmap[token](metadata))
-                if toker.current == "}":
-                    parent.append(value)
-                else:
-                    parent.extend(
-                        [Literal(metadata, token)] + value.field_components)
-            elif toker.current == "}" and \
-                 isinstance(parent, (VariableRef, PythonValue)):
-                return parent
-            else:
-                parent.append(Literal(metadata, toker.current))
-            toker.next()
-        return parent
-
-    return _parse(Tokenizer(str), Compound(metadata))
+    return bind(_skeleton(str), metadata)
+
+def _skeleton(str):
+    """Return the parse skeleton of str, from bbparse.cache if enabled"""
+
+    if bbparse.cache is None:
+        return parse_skeleton(str)
+
+    skeleton = bbparse.cache.get(str)
+    if skeleton is None:
+        skeleton = parse_skeleton(str)
+        bbparse.cache[str] = skeleton
+    return skeleton
+
+# The parse skeletons are independent of the metadata, so a single cache is
+# shared by every datastore.  Set this to None to disable it.
+bbparse.cache = LRUCache(maxsize=100000, maxbytes=64 * 1024 * 1024,
+                         sizeof=lambda str, skeleton: len(str))
+
+_reference_token = re.compile(r"\$\{@|\$\{|\}")
+_reference_classes = {"${": VariableRef, "${@": PythonValue}
+
+def _append_part(parts, part):
+    """Append a part to a skeleton, coalescing adjacent literal strings"""
+
+    if parts and not isinstance(part, tuple) and \
+       not isinstance(parts[-1], tuple):
+        parts[-1] += part
+    else:
+        parts.append(part)
+
+def parse_skeleton(str):
+    """Parses a metadata string into the metadata independent skeleton of
+       its AST.  The skeleton is a tuple of parts, each of which is either a
+       string, for a Literal, or a tuple of a class (VariableRef or
+       PythonValue) and its own tuple of parts.  Adjacent literal strings
+       are always coalesced.
+
+       The string is scanned once, keeping the references which have been
+       opened but not yet closed on a stack."""
+
+    parts = []
+    stack = []
+    pos = 0
+    for match in _reference_token.finditer(str):
+        start, end = match.span()
+        if start > pos:
+            _append_part(parts, str[pos:start])
+        pos = end
+
+        token = match.group()
+        if token != "}":
+            stack.append((token, parts))
+            parts = []
+        elif stack:
+            token, outer = stack.pop()
+            outer.append((_reference_classes[token], tuple(parts)))
+            parts = outer
+        else:
+            _append_part(parts, token)
+
+    if pos < len(str):
+        _append_part(parts, str[pos:])
+
+    # References are parsed speculatively.  Those which never close revert
+    # to literals.
+    while stack:
+        token, outer = stack.pop()
+        _append_part(outer, token)
+        for part in parts:
+            _append_part(outer, part)
+        parts = outer
+
+    return tuple(parts)
+
+def bind(skeleton, metadata, cls=Compound):
+    """Constructs a new value AST of type cls, bound to the supplied
+       metadata, from a skeleton as returned by parse_skeleton."""
+
+    value = cls(metadata)
+    components = value.field_components
+    for part in skeleton:
+        if isinstance(part, tuple):
+            components.append(bind(part[1], metadata, part[0]))
+        else:
+            components.append(Literal(metadata, part))
+    return value
 
 def shparse(str, metadata):
     """Constructs a new shell value from a variable defined in the BitBake
@@ -0,0 +1,265 @@
+"""Bounded caches used to memoize parsing and analysis results.
+
+   The caches here are deliberately simple: a dict for lookups and a circular
+   doubly linked list to track recency, so they work on any python version
+   bitbake supports.  They may be shared between threads."""
+
+import threading
+import weakref
+
+_PREV, _NEXT, _KEY, _VALUE, _SIZE = range(5)
+
+class LRUCache(object):
+    """A mapping which holds at most maxsize entries, and at most maxbytes
+       worth of entries, as measured by the sizeof callable, which is passed
+       the key and the value.  When either bound is exceeded, the least
+       recently used entries are evicted.  A bound of None is unlimited.
+
+       The hits, misses and evictions counters are kept for tuning.  Every
+       operation holds a lock, which the evicted hook is called with."""
+
+    def __init__(self, maxsize=None, maxbytes=None, sizeof=None):
+        if maxbytes is not None and sizeof is None:
+            raise ValueError("a byte budget requires a sizeof function")
+
+        self._lock = threading.Lock()
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.sizeof = sizeof
+        self.clear()
+
+    def __len__(self):
+        return len(self._map)
+
+    def __contains__(self, key):
+        return key in self._map
+
+    def __repr__(self):
+        return "%s(maxsize=%s, maxbytes=%s)" % (self.__class__.__name__,
+                                                self.maxsize, self.maxbytes)
+
+    def clear(self):
+        """Drop every entry and reset the statistics."""
+
+        with self._lock:
+            self._map = {}
+            self._root = root = []
+            root[:] = [root, root, None, None, 0]
+            self.bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        """Return a dict of the current statistics."""
+
+        return {"entries": len(self._map), "bytes": self.bytes,
+                "hits": self.hits, "misses": self.misses,
+                "evictions": self.evictions}
+
+    def get(self, key, default=None):
+        """Return the value for key, marking it as most recently used."""
+
+        with self._lock:
+            link = self._map.get(key)
+            if link is None:
+                self.misses += 1
+                return default
+
+            self.hits += 1
+            self._unlink(link)
+            self._link(link)
+            return link[_VALUE]
+
+    def __getitem__(self, key):
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        if self.sizeof is not None:
+            size = self.sizeof(key, value)
+        else:
+            size = 0
+
+        with self._lock:
+            if key in self._map:
+                self._remove(self._map[key])
+
+            self._insert([None, None, key, value, size])
+            self._shrink()
+
+    def __delitem__(self, key):
+        with self._lock:
+            self._remove(self._map[key])
+
+    def pop(self, key, default=None):
+        """Remove key, returning its value, or default if it is absent."""
+
+        with self._lock:
+            link = self._map.get(key)
+            if link is None:
+                return default
+            self._remove(link)
+            return link[_VALUE]
+
+    def resize(self, maxsize=None, maxbytes=None):
+        """Change the bounds, evicting entries as necessary."""
+
+        if maxbytes is not None and self.sizeof is None:
+            raise ValueError("a byte budget requires a sizeof function")
+
+        with self._lock:
+            self.maxsize = maxsize
+            self.maxbytes = maxbytes
+            self._shrink()
+
+    def evicted(self, key, value):
+        """Called when an entry is evicted to make room.  Subclasses may
+           override this to release associated resources, but must not use
+           the cache, whose lock is held."""
+
+    def _link(self, link):
+        root = self._root
+        last = root[_PREV]
+        link[_PREV] = last
+        link[_NEXT] = root
+        last[_NEXT] = root[_PREV] = link
+
+    @staticmethod
+    def _unlink(link):
+        prev, next = link[_PREV], link[_NEXT]
+        prev[_NEXT] = next
+        next[_PREV] = prev
+
+    def _insert(self, link):
+        self._map[link[_KEY]] = link
+        self._link(link)
+        self.bytes += link[_SIZE]
+
+    def _remove(self, link):
+        self._unlink(link)
+        del self._map[link[_KEY]]
+        self.bytes -= link[_SIZE]
+
+    def _overfull(self):
+        if self.maxsize is not None and len(self._map) > self.maxsize:
+            return True
+        if self.maxbytes is not None and self.bytes > self.maxbytes:
+            return True
+        return False
+
+    def _shrink(self):
+        while self._map and self._overfull():
+            link = self._root[_NEXT]
+            self._remove(link)
+            self.evictions += 1
+            self.evicted(link[_KEY], link[_VALUE])
+
+class MetadataCache(LRUCache):
+    """An LRUCache whose entries belong to a particular metadata instance.
+
+       Only a weak reference to the metadata is held, and it is checked on
+       lookup, so an entry is never handed back for a different datastore
+       which happens to have been allocated at the same address.  Once the
+       metadata is garbage collected, its entries are dropped, the next time
+       the cache is used, as the collection may happen while the lock is
+       held.  The values stored must not refer to the metadata themselves,
+       or it will never be collected.
+
+       The keys of each metadata's entries are kept together, so dropping
+       them costs no more than the number of entries it has."""
+
+    def __init__(self, maxsize=None, maxbytes=None, sizeof=None):
+        self._refs = {}
+        self._keys = {}
+        self._collected_idents = []
+        if sizeof is not None:
+            measure = sizeof
+            sizeof = lambda mapkey, entry: measure(mapkey[0], entry[1])
+        LRUCache.__init__(self, maxsize, maxbytes, sizeof)
+
+    def __len__(self):
+        self._purge()
+        return LRUCache.__len__(self)
+
+    def clear(self):
+        LRUCache.clear(self)
+        self._refs.clear()
+        self._keys.clear()
+
+    def lookup(self, metadata, key, default=None):
+        """Return the value stored for key in metadata."""
+
+        self._purge()
+        mapkey = (key, id(metadata))
+        entry = self.get(mapkey)
+        if entry is None:
+            return default
+
+        ref, value = entry
+        if ref() is not metadata:
+            self.hits -= 1
+            self.misses += 1
+            self.pop(mapkey)
+            return default
+        return value
+
+    def store(self, metadata, key, value):
+        """Store value for key in metadata.  Metadata which cannot be weakly
+           referenced is not cached at all."""
+
+        self._purge()
+        ident = id(metadata)
+        ref = self._refs.get(ident)
+        if ref is None or ref() is not metadata:
+            try:
+                ref = weakref.ref(metadata, self._collected(ident))
+            except TypeError:
+                return
+            self._refs[ident] = ref
+        self[(key, ident)] = (ref, value)
+
+    def forget(self, metadata):
+        """Drop all entries belonging to metadata."""
+
+        self._forget(id(metadata))
+
+    def _forget(self, ident):
+        self._refs.pop(ident, None)
+        for mapkey in list(self._keys.get(ident, ())):
+            self.pop(mapkey)
+
+    def _insert(self, link):
+        LRUCache._insert(self, link)
+        ident = link[_KEY][1]
+        keys = self._keys.get(ident)
+        if keys is None:
+            keys = self._keys[ident] = set()
+        keys.add(link[_KEY])
+
+    def _remove(self, link):
+        LRUCache._remove(self, link)
+        ident = link[_KEY][1]
+        keys = self._keys.get(ident)
+        if keys is not None:
+            keys.discard(link[_KEY])
+            if not keys:
+                del self._keys[ident]
+
+    def _purge(self):
+        while self._collected_idents:
+            try:
+                ident, ref = self._collected_idents.pop()
+            except IndexError:
+                break
+            if self._refs.get(ident) is ref:
+                self._forget(ident)
+
+    def _collected(self, ident):
+        selfref = weakref.ref(self)
+        def callback(ref):
+            cache = selfref()
+            if cache is not None:
+                cache._collected_idents.append((ident, ref))
+        return callback
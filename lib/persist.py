@@ -0,0 +1,114 @@
+"""Persistent caches, stored in a single sqlite database file, for results
+   which are worth keeping from one build to the next."""
+
+import os
+import sqlite3
+import threading
+import cPickle as pickle
+from bb import msg
+
+class PersistentCache(object):
+    """A mapping of string keys to picklable values, stored on disk.
+
+    The version identifies the format and meaning of the values.  When the
+    version stored in the file doesn't match, every entry is dropped.  Errors
+    from the database, such as another process holding it locked for too
+    long, are reported and otherwise treated as misses, as a cache must never
+    break a build.  Writes are committed in batches, and by sync and close.
+    The cache may be shared between threads.
+    """
+
+    batch = 100
+
+    def __init__(self, path, version, timeout=30):
+        self.path = path
+        self.version = str(version)
+        self.pending = 0
+        self.hits = self.misses = 0
+
+        directory = os.path.dirname(path)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        self._lock = threading.Lock()
+        self.connection = sqlite3.connect(path, timeout=timeout,
+                                          check_same_thread=False)
+        self.connection.text_factory = str
+        with self.connection:
+            self.connection.execute("CREATE TABLE IF NOT EXISTS meta "
+                                    "(key TEXT PRIMARY KEY, value TEXT)")
+            self.connection.execute("CREATE TABLE IF NOT EXISTS entries "
+                                    "(key TEXT PRIMARY KEY, value BLOB)")
+            row = self.connection.execute("SELECT value FROM meta WHERE "
+                                          "key = 'version'").fetchone()
+            if row is None or row[0] != self.version:
+                self.connection.execute("DELETE FROM entries")
+                self.connection.execute("INSERT OR REPLACE INTO meta "
+                                        "VALUES ('version', ?)",
+                                        (self.version,))
+
+    def __repr__(self):
+        return "%s(%r, %r)" % (self.__class__.__name__, self.path,
+                               self.version)
+
+    def get(self, key, default=None):
+        """Return the value stored for key"""
+
+        try:
+            with self._lock:
+                row = self.connection.execute("SELECT value FROM entries "
+                                              "WHERE key = ?",
+                                              (key,)).fetchone()
+        except sqlite3.Error, exc:
+            msg.debug(1, None, "Unable to read from %s: %s" % (self.path, exc))
+            row = None
+
+        if row is None:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        return pickle.loads(str(row[0]))
+
+    def __setitem__(self, key, value):
+        data = sqlite3.Binary(pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+        with self._lock:
+            try:
+                self.connection.execute("INSERT OR REPLACE INTO entries "
+                                        "VALUES (?, ?)", (key, data))
+            except sqlite3.Error, exc:
+                msg.debug(1, None, "Unable to write to %s: %s" %
+                                   (self.path, exc))
+                return
+
+            self.pending += 1
+            if self.pending >= self.batch:
+                self._sync()
+
+    def __len__(self):
+        with self._lock:
+            return self.connection.execute("SELECT COUNT(*) FROM "
+                                           "entries").fetchone()[0]
+
+    def stats(self):
+        """Return a dict of the statistics for this session"""
+
+        return {"hits": self.hits, "misses": self.misses}
+
+    def sync(self):
+        """Commit pending writes to disk"""
+
+        with self._lock:
+            self._sync()
+
+    def _sync(self):
+        try:
+            self.connection.commit()
+        except sqlite3.Error, exc:
+            msg.debug(1, None, "Unable to write to %s: %s" % (self.path, exc))
+        self.pending = 0
+
+    def close(self):
+        with self._lock:
+            self._sync()
+            self.connection.close()
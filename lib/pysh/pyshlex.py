@@ -8,10 +8,6 @@
 # TODO:
 # - review all "char in 'abc'" snippets: the empty string can be matched
 # - test line continuations within quoted/expansion strings
-# - eof is buggy wrt sublexers
-# - the lexer cannot really work in pull mode as it would be required to run
-# PLY in pull mode. It was designed to work incrementally and it would not be
-# that hard to enable pull mode.
 import re
 try:
     s = set()
@@ -131,12 +127,28 @@ class WordLexer:
         "'": set(),
     }
         
+    # Runs of characters the parsing functions skip over, up to the next
+    # separator they have to look at
+    RE_DQUOTE = re.compile(r'[$\\`"]')
+    RE_COMMAND = re.compile(r'[$\\`"\']')
+    RE_SUBSHELL = re.compile(r'[$\\`"\')]')
+    RE_PARAMETER = re.compile(r'[$\\`"\'}]')
+    RE_NAME = re.compile(r'[0-9a-zA-Z_]*')
+        
     def __init__(self, heredoc = False):
-        # _buffer is the unprocessed input characters buffer
-        self._buffer = []
+        # _buffer is the unprocessed input string
+        self._buffer = ''
         # _stack is empty or contains a quoted list being processed
         # (this is the DFS path to the quoted expression being evaluated).
         self._stack = []
+        # True when a sub-expression starts at the next character
+        self._recurse = False
+        # Literal chunks consumed before running out of data, which belong at
+        # the end of the quoted list being processed
+        self._pending = []
+        # Position in the data last passed to parse() of the first character
+        # not consumed yet
+        self.pos = 0
         self._escapable = None
         # True when parsing unquoted here documents
         self._heredoc = heredoc
@@ -147,14 +159,43 @@ class WordLexer:
         tree and the unconsumed data.
         Otherwise, raise NeedMore.
         """
-        self._buffer += list(data)
-        self._parse(eof)
+        self._buffer += data
+        try:
+            result, pos = self.parse(self._buffer, 0, eof)
+        except NeedMore:
+            self._buffer = self._buffer[self.pos:]
+            raise
+        remaining = self._buffer[pos:]
+        self._buffer = ''
+        return result, remaining
         
-        result = self._stack[0]
-        remaining = ''.join(self._buffer)
+    def parse(self, data, pos=0, eof=False):
+        """Delimit the quoted expression starting at data[pos] and return a
+        tuple (expr, end) containing the expression tree and the position
+        following it in data. Raise NeedMore if data ends before the
+        expression does, after storing in self.pos the position of the first
+        character which was not consumed: parsing resumes there once parse()
+        is called again with more data.
+        """
+        result = self._parse(data, pos, eof)
         self._stack = []
-        self._buffer = []
-        return result, remaining
+        self._recurse = False
+        return result
+        
+    def _need_more(self, data, pos):
+        """Keep the literal characters from data[pos] to the end, which
+        cannot contain a separator, and raise NeedMore.
+        """
+        self._pending.append(data[pos:])
+        self.pos = len(data)
+        raise NeedMore()
+        
+    def _append(self, result, s):
+        if self._pending:
+            self._pending.append(s)
+            s = ''.join(self._pending)
+            self._pending = []
+        result[-1] += s
         
     def _is_escapable(self, c, delim=None):
         if delim is None:
@@ -170,121 +211,111 @@ class WordLexer:
         escapables = self.ESCAPABLE.get(delim, None)
         return escapables is None or c in escapables
         
-    def _parse_squote(self, buf, result, eof):
-        if not buf:
-            raise NeedMore()
-        try:
-            pos = buf.index("'")
-        except ValueError:
-            raise NeedMore()
-        result[-1] += ''.join(buf[:pos])
+    def _parse_squote(self, data, pos, result, eof):
+        end = data.find("'", pos)
+        if end==-1:
+            self._need_more(data, pos)
+        self._append(result, data[pos:end])
         result += ["'"]
-        return pos+1, True
+        return end+1, True
         
-    def _parse_bquote(self, buf, result, eof):
-        if not buf:
+    def _parse_bquote(self, data, pos, result, eof):
+        if pos>=len(data):
             raise NeedMore()
             
-        if buf[0]=='\n':
+        c = data[pos]
+        if c=='\n':
             #Remove line continuations
             result[:] = ['', '', '']
-        elif self._is_escapable(buf[0]):
-            result[-1] += buf[0]
+        elif self._is_escapable(c):
+            result[-1] += c
             result += ['']
         else:
             #Keep as such
-            result[:] = ['', '\\'+buf[0], '']
+            result[:] = ['', '\\'+c, '']
         
-        return 1, True
+        return pos+1, True
         
-    def _parse_dquote(self, buf, result, eof):
-        if not buf:
-            raise NeedMore()
-        pos, sep = find_chars(buf, '$\\`"')
-        if pos==-1:
-            raise NeedMore()
+    def _parse_dquote(self, data, pos, result, eof):
+        match = self.RE_DQUOTE.search(data, pos)
+        if match is None:
+            self._need_more(data, pos)
             
-        result[-1] += ''.join(buf[:pos])
-        if sep=='"':
+        end = match.start()
+        self._append(result, data[pos:end])
+        if data[end]=='"':
             result += ['"']
-            return pos+1, True
+            return end+1, True
         else:
             #Keep everything until the separator and defer processing
-            return pos, False
+            return end, False
             
-    def _parse_command(self, buf, result, eof):
-        if not buf:
-            raise NeedMore()
-
-        chars = '$\\`"\''
+    def _parse_command(self, data, pos, result, eof):
         if result[0] == '$(':
-            chars += ')'
-        pos, sep = find_chars(buf, chars)
-        if pos == -1:
-            raise NeedMore()
+            match = self.RE_SUBSHELL.search(data, pos)
+        else:
+            match = self.RE_COMMAND.search(data, pos)
+        if match is None:
+            self._need_more(data, pos)
             
-        result[-1] += ''.join(buf[:pos])
+        end = match.start()
+        sep = data[end]
+        self._append(result, data[pos:end])
         if (result[0]=='$(' and sep==')') or (result[0]=='`' and sep=='`'):
             result += [sep]
-            return pos+1, True
+            return end+1, True
         else:
-            return pos, False
+            return end, False
             
-    def _parse_parameter(self, buf, result, eof):
-        if not buf:
-            raise NeedMore()
+    def _parse_parameter(self, data, pos, result, eof):
+        match = self.RE_PARAMETER.search(data, pos)
+        if match is None:
+            self._need_more(data, pos)
             
-        pos, sep = find_chars(buf, '$\\`"\'}')
-        if pos==-1:
-            raise NeedMore()
-            
-        result[-1] += ''.join(buf[:pos])
-        if sep=='}':
-            result += [sep]
-            return pos+1, True
+        end = match.start()
+        self._append(result, data[pos:end])
+        if data[end]=='}':
+            result += ['}']
+            return end+1, True
         else:
-            return pos, False
+            return end, False
             
-    def _parse_dollar(self, buf, result, eof):
+    def _parse_dollar(self, data, pos, result, eof):
         sep = result[0]
         if sep=='$':            
-            if not buf:
+            if pos>=len(data):
                 #TODO: handle empty $
                 raise NeedMore()
-            if buf[0]=='(':
-                if len(buf)==1:
+            c = data[pos]
+            if c=='(':
+                if pos+1>=len(data):
                     raise NeedMore()
                     
-                if buf[1]=='(':
+                if data[pos+1]=='(':
                     result[0] = '$(('
-                    buf[:2] = []
+                    pos += 2
                 else:
                     result[0] = '$('
-                    buf[:1] = []
+                    pos += 1
                 
-            elif buf[0]=='{':
+            elif c=='{':
                 result[0] = '${'
-                buf[:1] = []
+                pos += 1
             else:
-                if buf[0] in self.SPECIAL_CHARSET:
-                    result[-1] = buf[0]
-                    read = 1
+                if c in self.SPECIAL_CHARSET:
+                    result[-1] = c
+                    end = pos+1
                 else:
-                    for read,c in enumerate(buf):
-                        if c not in self.NAME_CHARSET:
-                            break
-                    else:
-                        if not eof:
-                            raise NeedMore()
-                        read += 1
-                        
-                    result[-1] += ''.join(buf[0:read])
+                    end = self.RE_NAME.match(data, pos).end()
+                    if end==len(data) and not eof:
+                        raise NeedMore()
+                    result[-1] += data[pos:end]
                     
                 if not result[-1]:
                     result[:] = ['', result[0], '']
                 else:
                     result += [''] 
-                return read,True
+                return end,True
         
         sep = result[0]    
         if sep=='$(':
@@ -294,24 +325,28 @@ class WordLexer:
         else:
             raise NotImplementedError()
             
-        pos, closed = parsefunc(buf, result, eof)
-        return pos, closed
+        return parsefunc(data, pos, result, eof)
 
-    def _parse(self, eof):
-        buf = self._buffer
+    def _parse(self, data, pos, eof):
         stack = self._stack
-        recurse = False
+        recurse = self._recurse
     
         while 1:
             if not stack or recurse:
-                if not buf:
+                if pos>=len(data):
+                    self.pos = pos
+                    self._recurse = recurse
                     raise NeedMore()
-                if buf[0] not in ('"\\`$\''):
+                if data[pos] not in ('"\\`$\''):
                     raise ShellSyntaxError('Invalid quoted string sequence')
-                stack.append([buf[0], ''])
-                buf[:1] = []
+                stack.append([data[pos], ''])
+                pos += 1
                 recurse = False
                 
+            # Where to resume if the data ends in the middle of something the
+            # parsing function cannot consume partially
+            self.pos = pos
+            self._recurse = False
             result = stack[-1]
             if result[0]=="'":
                 parsefunc = self._parse_squote
@@ -326,9 +361,8 @@ class WordLexer:
             else:
                 raise NotImplementedError()
                 
-            read, closed = parsefunc(buf, result, eof)
+            pos, closed = parsefunc(data, pos, result, eof)
                 
-            buf[:read] = []
             if closed:
                 if len(stack)>1:
                     #Merge in parent expression
@@ -336,7 +370,7 @@ class WordLexer:
                     stack[-1] += [parsed]
                     stack[-1] += ['']
                 else:
-                    break
+                    return stack[0], pos
             else:
                 recurse = True
 
@@ -364,27 +398,59 @@ def normalize_wordtree(wtree):
     return normalize(wtree)
     
                 
+_RE_WORD_DELIMITER = re.compile(r'[\\$`\'"]')
+_RE_HEREDOC_DELIMITER = re.compile(r'[\\$`]')
+
+# Word trees are memoized by token and here-document flag, the same words
+# coming up again and again in scripts. Callers are free to modify the trees
+# they get, so they get copies of the memoized ones, which are cheaper to make
+# than parsing the token again. Like the re module cache, the memo is simply
+# emptied when full, and dict operations being atomic, it is thread safe.
+_wordtrees = {}
+wordtree_cache_size = 10000
+
+def _copy_wordtree(wtree):
+    return [_copy_wordtree(part) if isinstance(part, list) else part
+            for part in wtree]
+
 def make_wordtree(token, here_document=False):
     """Parse a delimited token and return a tree similar to the ones returned by
     WordLexer. token may contain any combinations of expansion/quoted fields and
     non-ones.
     """    
+    key = (token, here_document)
+    try:
+        wtree, nested = _wordtrees[key]
+    except KeyError:
+        wtree = _make_wordtree(token, here_document)
+        nested = any(isinstance(part, list) for part in wtree)
+        if len(_wordtrees)>=wordtree_cache_size:
+            _wordtrees.clear()
+        _wordtrees[key] = _copy_wordtree(wtree), nested
+        return wtree
+        
+    if nested:
+        return _copy_wordtree(wtree)
+    return list(wtree)
+    
+def _make_wordtree(token, here_document):
     tree = ['']
-    remaining = token
-    delimiters = '\\$`'
-    if not here_document:
-        delimiters += '\'"'
+    pos = 0
+    if here_document:
+        delimiter = _RE_HEREDOC_DELIMITER
+    else:
+        delimiter = _RE_WORD_DELIMITER
     
     while 1:
-        pos, sep = find_chars(remaining, delimiters)
-        if pos==-1:
-            tree += [remaining, '']
+        match = delimiter.search(token, pos)
+        if match is None:
+            tree += [token[pos:], '']
             return normalize_wordtree(tree)
-        tree.append(remaining[:pos])
-        remaining = remaining[pos:]
+        tree.append(token[pos:match.start()])
         
         try:
-            result, remaining = WordLexer(heredoc = here_document).add(remaining, True)
+            result, pos = WordLexer(heredoc = here_document).parse(token,
+                match.start(), True)
         except NeedMore:
             raise ShellSyntaxError('Invalid token "%s"')
         tree.append(result)
@@ -433,45 +499,52 @@ class HereDocLexer:
             
         self._op = op
         self._delim = delim
-        self._buffer = []
+        self._buffer = ''
+        # Lines of the document delimited so far, and the position in the data
+        # last passed to parse() of the first line not delimited yet
         self._token = []
+        self.pos = 0
+        
+    #Match a line up to its first unescaped newline. Quotes may be ignored
+    RE_LINE = re.compile(r'[^\\\n]*(?:\\[\s\S][^\\\n]*)*')
         
     def add(self, data, eof):
         """If the here-document was delimited, return a tuple (content, remaining).
         Raise NeedMore() otherwise.
         """
-        self._buffer += list(data)
-        self._parse(eof)
-        token = ''.join(self._token)
-        remaining = ''.join(self._buffer)
-        self._token, self._remaining = [], []
+        self._buffer += data
+        try:
+            token, pos = self.parse(self._buffer, 0, eof)
+        except NeedMore:
+            self._buffer = self._buffer[self.pos:]
+            raise
+        remaining = self._buffer[pos:]
+        self._buffer = ''
         return token, remaining
     
-    def _parse(self, eof):
+    def parse(self, data, pos=0, eof=False):
+        """Delimit the here-document starting at data[pos] and return a tuple
+        (content, end) where end is the position following the closing
+        delimiter line in data. Raise NeedMore() if it cannot be delimited yet,
+        after storing in self.pos the position of the first line which was not
+        delimited: parsing resumes there once parse() is called again with
+        more data.
+        """
+        token = self._token
         while 1:
-            #Look for first unescaped newline. Quotes may be ignored
-            escaped = False
-            for i,c in enumerate(self._buffer):
-                if escaped:
-                    escaped = False
-                elif c=='\\':
-                    escaped = True
-                elif c=='\n':
-                    break
-            else:
-                i = -1
-                    
-            if i==-1 or self._buffer[i]!='\n':
+            end = self.RE_LINE.match(data, pos).end()
+            if end>=len(data) or data[end]!='\n':
                 if not eof:
+                    self.pos = pos
                     raise NeedMore()
                 #No more data, maybe the last line is closing delimiter
-                line = ''.join(self._buffer)
+                line = data[pos:]
                 eol = ''
-                self._buffer[:] = []
+                pos = len(data)
             else:
-                line = ''.join(self._buffer[:i])
-                eol = self._buffer[i]
-                self._buffer[:i+1] = []
+                line = data[pos:end]
+                eol = '\n'
+                pos = end+1
             
             if self._op=='<<-':
                 line = line.lstrip('\t')
@@ -479,9 +552,11 @@ class HereDocLexer:
             if line==self._delim:
                 break
                 
-            self._token += [line, eol]
-            if i==-1:
+            token += [line, eol]
+            if not eol:
                 break
+        self._token = []
+        return ''.join(token), pos
     
 class Token:
     #TODO: check this is still in use
@@ -549,8 +624,15 @@ class Lexer:
     #Match end of backquote strings
     RE_BACKQUOTE_END = re.compile(r'(?<!\\)(`)')
 
+    #Match runs of characters which can only be appended to the current token
+    RE_ORDINARY = re.compile('[^%s]+' % re.escape(''.join(sorted(
+        set(op[0] for op in _PARTIAL_OPERATORS) | set(' \t\n\\\'"`$')))))
+    RE_BLANKS = re.compile('[ \t]+')
+
     def __init__(self, parent_state = None):
-        self._input = []
+        # _input is the input string, _pos the position of the first character
+        # not processed yet
+        self._input = ''
         self._pos = 0
         
         self._token = ''
@@ -558,9 +640,11 @@ class Lexer:
         
         self._state = self.ST_NORMAL
         self._parent_state = parent_state
-        self._wordlexer = None
         
         self._heredoc = HereDoc(None)
+        
+        # Sublexers kept across calls to add() while they need more data
+        self._wordlexer = None
         self._herelexer = None
         
         ### Following attributes are not used for delimiting token and can safely
@@ -577,10 +661,12 @@ class Lexer:
         is in the middle of a delimiting operation.
         Raise NeedMore otherwise.
         """
-        self._input += list(data)
+        self._input = self._input[self._pos:] + data
+        self._pos = 0
         self._parse(eof)
-        self._input[:self._pos] = []
-        return ''.join(self._input)
+        remaining = self._input[self._pos:]
+        self._input, self._pos = '', 0
+        return remaining
         
     def _parse(self, eof):            
         while self._state:
@@ -632,17 +718,15 @@ class Lexer:
             self._push_token(c)
             
             #Discard blanks
-            self._pos += 1
-        elif self._token:
-            self._token += c
-            self._pos += 1
-        elif c=='#':
+            self._pos = self.RE_BLANKS.match(self._input, self._pos).end()
+        elif self._token or c!='#':
+            match = self.RE_ORDINARY.match(self._input, self._pos)
+            self._token += match.group()
+            self._pos = match.end()
+        else:
             self._state = self.ST_COMMENT
             self._type = TK_COMMENT
             self._pos += 1
-        else:
-            self._pos += 1
-            self._token += c          
                 
     def _parse_op(self, eof):
         assert self._token
@@ -667,36 +751,31 @@ class Lexer:
                 break
                 
     def _parse_comment(self):
-        while 1:
-            if self._pos>=len(self._input):
-                raise NeedMore()
-                
-            c = self._input[self._pos]
-            if c=='\n':
-                #End of comment, do not consume the end of line
-                self._state = self.ST_NORMAL
-                break
-            else:
-                self._token += c
-                self._pos += 1
+        end = self._input.find('\n', self._pos)
+        if end==-1:
+            #The comment ends with the input if eof is set, _parse decides
+            self._token += self._input[self._pos:]
+            self._pos = len(self._input)
+            return
+            
+        #End of comment, do not consume the end of line
+        self._token += self._input[self._pos:end]
+        self._pos = end
+        self._state = self.ST_NORMAL
                 
     def _parse_quoted(self, eof):
         """Precondition: the starting backquote/dollar is still in the input queue."""
-        if not self._wordlexer:
+        #The sublexer works in place and resumes where it stopped when more
+        #data is needed
+        if self._wordlexer is None:
             self._wordlexer = WordLexer()
-        
-        if self._pos<len(self._input):
-             #Transfer input queue character into the subparser
-            input = self._input[self._pos:]
-            self._pos += len(input)
-            
-        wtree, remaining = self._wordlexer.add(input, eof)
+        try:
+            wtree, self._pos = self._wordlexer.parse(self._input, self._pos, eof)
+        except NeedMore:
+            self._pos = self._wordlexer.pos
+            raise
         self._wordlexer = None
         self._token += wordtree_as_string(wtree)
-        
-        #Put unparsed character back in the input queue
-        if remaining:
-            self._input[self._pos:self._pos] = list(remaining)          
         self._state = self.ST_NORMAL
         
     def _parse_heredoc(self, eof):
@@ -704,19 +783,16 @@ class Lexer:
         
         if self._herelexer is None:
             self._herelexer = HereDocLexer(self._heredoc.op, self._heredoc.name)
-        
-        if self._pos<len(self._input):
-             #Transfer input queue character into the subparser
-            input = self._input[self._pos:]
-            self._pos += len(input)
-        
-        self._token, remaining = self._herelexer.add(input, eof)
+        try:
+            self._token, self._pos = self._herelexer.parse(self._input,
+                self._pos, eof)
+        except NeedMore:
+            self._pos = self._herelexer.pos
+            raise
+        self._herelexer = None
         
         #Reset here-document state
-        self._herelexer = None
         heredoc, self._heredoc = self._heredoc, HereDoc(None)
-        if remaining:
-            self._input[self._pos:self._pos] = list(remaining)
         self._state = self.ST_NORMAL
         
         #Push pending tokens
@@ -838,12 +914,22 @@ tokens += _OPERATORS.values()
 tokens += _RESERVEDS.values()
             
 class PLYLexer(Lexer):
-    """Bridge Lexer and PLY lexer interface."""
-    def __init__(self):
+    """Bridge Lexer and PLY lexer interface.
+    
+    In pull mode, source is an iterable of strings, such as a file, which is
+    only lexed as the parser asks for tokens. The tokens already returned are
+    dropped, and the parser passes every top-level command it completes to
+    on_command rather than keeping them.
+    """
+    def __init__(self, source=None, on_command=None):
         Lexer.__init__(self)
         self._tokens = []
         self._current = 0
         self.lineno = 0
+        if source is not None:
+            source = iter(source)
+        self._source = source
+        self.on_command = on_command
 
     def on_token(self, token):
         value, type = token
@@ -858,13 +944,33 @@ class PLYLexer(Lexer):
         
         self._tokens.append(t)
         
+    def _pull(self):
+        """Lex the source until there are tokens to return, or it is
+        exhausted.
+        """
+        while self._source is not None and self._current>=len(self._tokens):
+            self._tokens, self._current = [], 0
+            try:
+                data = self._source.next()
+            except StopIteration:
+                self._source = None
+                self.add('', True)
+            else:
+                try:
+                    self.add(data)
+                except NeedMore:
+                    pass
+        
     def is_empty(self):
-        return not bool(self._tokens)
+        self._pull()
+        return self._current>=len(self._tokens)
         
     #PLY compliant interface
     def token(self):
         if self._current>=len(self._tokens):
-            return None
+            self._pull()
+            if self._current>=len(self._tokens):
+                return None
         t = self._tokens[self._current]
         self._current += 1
         return t      
@@ -7,6 +7,8 @@
 
 """PLY grammar file.
 """
+import copy
+import hashlib
 import os
 import sys
 
@@ -134,7 +136,16 @@ def p_multiple_commands(p):
         else:
             p[0] = []
     else:
-        p[0] = p[1] + [p[2]]
+        #Append in place, copying would make long scripts quadratic
+        p[1].append(p[2])
+        p[0] = p[1]
+
+    on_command = p.lexer.on_command
+    if on_command is not None:
+        #Streaming, hand the completed command over instead of keeping it
+        for command in p[0]:
+            on_command(command)
+        p[0] = []
 
 def p_complete_command(p):
     """complete_command : list separator
@@ -638,31 +649,144 @@ def p_error(p):
     w = msg.append
     w('%r\n' % p)
     w('followed by:\n')
-    for i in range(5):
-        n = yacc.token()
-        if not n:
-            break
-        w('  %r\n' % n)
+    # Read ahead from the token's own lexer rather than yacc.token, which is
+    # global to all parses in progress.
+    if p is not None:
+        for i in range(5):
+            n = p.lexer.token()
+            if not n:
+                break
+            w('  %r\n' % n)
     raise sherrors.ShellSyntaxError(''.join(msg))
 
 # Build the parser
-try:
-    import pyshtables
-except ImportError:
-    outputdir = os.path.dirname(__file__)
-    if not os.access(outputdir, os.W_OK):
-        outputdir = ''
-    yacc.yacc(tabmodule = 'pyshtables', outputdir = outputdir, debug = 0)
-else:
-    yacc.yacc(tabmodule = 'pysh.pyshtables', write_tables = 0, debug = 0)
+#
+# The LALR tables are generated from the grammar above, which is slow, so
+# they are shipped in pyshtables.py, written by write_tables.  When the
+# grammar_signature recorded there matches the grammar, the tables are loaded
+# directly, without ply reflecting upon and validating the grammar.  Otherwise
+# they are generated in memory, with a warning, as pyshtables.py is only
+# written by scripts/build_pyshtables.py, which must be run after changing the
+# grammar.
+
+def grammar_signature():
+    """Return a digest of the tokens and the productions, in the order ply
+    sees them, from which the tables are generated.
+    """
+    digest = hashlib.md5()
+    digest.update('%s\0%s\0' % (yacc.__tabversion__, ' '.join(tokens)))
+    functions = [(f.func_code.co_firstlineno, name, f.__doc__ or '')
+                 for name, f in globals().items()
+                 if name.startswith('p_') and callable(f)]
+    for line, name, doc in sorted(functions):
+        digest.update('%s\0%s\0' % (name, doc))
+    return digest.hexdigest()
+
+def generate_tables():
+    """Generate the tables from the grammar, returning an LRParser"""
+    module = sys.modules[__name__]
+    return yacc.yacc(module = module, tabmodule = 'pysh.pyshtables',
+                     write_tables = 0, debug = 0)
+
+def write_tables(path, parser):
+    """Write the tables of parser, as generated from the grammar, to the
+    module at path.  The output depends only upon the grammar, so the module
+    is the same wherever it is built.
+    """
+    pinfo = yacc.ParserReflect(dict(globals()))
+    pinfo.get_all()
+
+    def write_items(name, table):
+        items = {}
+        for state, actions in table.items():
+            for symbol, value in actions.items():
+                items.setdefault(symbol, []).append((state, value))
+        w('\n_%s_items = {\n' % name)
+        for symbol in sorted(items):
+            states = sorted(items[symbol])
+            w('  %r:(%r,%r),\n' % (symbol, [s for s, _ in states],
+                                  [v for _, v in states]))
+        w('}\n')
+        w('\n_%s = { }\n' % name)
+        w('for _k, _v in _%s_items.items():\n' % name)
+        w('   for _x,_y in zip(_v[0],_v[1]):\n')
+        w('      if not _x in _%s: _%s[_x] = { }\n' % (name, name))
+        w('      _%s[_x][_k] = _y\n' % name)
+        w('del _%s_items\n' % name)
+
+    output = []
+    w = output.append
+    w('# pyshtables.py - LALR tables for the pysh grammar in pyshyacc.py\n')
+    w('# This file is automatically generated by scripts/build_pyshtables.py.'
+      ' Do not edit.\n')
+    w('_tabversion = %r\n\n' % yacc.__tabversion__)
+    w('_lr_method = %r\n\n' % 'LALR')
+    w('_lr_signature = %r\n\n' % pinfo.signature())
+    w('_grammar_signature = %r\n' % grammar_signature())
+    write_items('lr_action', parser.action)
+    write_items('lr_goto', parser.goto)
+    w('\n_lr_productions = [\n')
+    for p in parser.productions:
+        if p.func:
+            w('  (%r,%r,%d,%r,%r,%d),\n' % (p.str, p.name, p.len, p.func,
+                                            os.path.basename(p.file), p.line))
+        else:
+            w('  (%r,%r,%d,None,None,None),\n' % (str(p), p.name, p.len))
+    w(']\n')
+
+    f = open(path, 'w')
+    try:
+        f.write(''.join(output))
+    finally:
+        f.close()
+
+def _load_tables():
+    """Return an LRParser using the shipped tables, or None if they are
+    missing or were generated from a different grammar.
+    """
+    try:
+        import pyshtables
+    except ImportError:
+        return None
+    if getattr(pyshtables, '_tabversion', None) != yacc.__tabversion__ or \
+       getattr(pyshtables, '_grammar_signature', None) != grammar_signature():
+        return None
+
+    lr = yacc.LRTable()
+    lr.read_table(pyshtables)
+    lr.bind_callables(globals())
+    return yacc.LRParser(lr, p_error)
+
+_parser = _load_tables()
+if _parser is None:
+    yacc.PlyLogger(sys.stderr).warning(
+        "pysh/pyshtables.py is missing or out of date, generating the "
+        "tables; run scripts/build_pyshtables.py to update it")
+    _parser = generate_tables()
+
+# An LRParser keeps the state of the parse in progress on itself, so each
+# parse needs a parser of its own.  The tables are read only, so parsers are
+# shallow copies of the one built above, sharing them, and are pooled for
+# reuse.  list.append and list.pop are atomic, so the pool is thread safe.
+_pool = []
+pool_size = 16
+
+def _acquire_parser():
+    try:
+        return _pool.pop()
+    except IndexError:
+        return copy.copy(_parser)
+
+def _release_parser(parser):
+    if len(_pool) < pool_size:
+        _pool.append(parser)
 
 
 def parse(input, eof=False, debug=False):
     """Parse a whole script at once and return the generated AST and unconsumed
     data in a tuple.
     
-    NOTE: eof is probably meaningless for now, the parser being unable to work
-    in pull mode. It should be set to True.
+    NOTE: eof should be set to True, parse_stream is the pull mode version.
     """
     lexer = pyshlex.PLYLexer()
     remaining = lexer.add(input, eof)
@@ -670,7 +794,31 @@ def parse(input, eof=False, debug=False):
         return [], remaining
     if debug:
         debug = 2
-    return yacc.parse(lexer=lexer, debug=debug), remaining
+    parser = _acquire_parser()
+    try:
+        return parser.parse(lexer=lexer, debug=debug), remaining
+    finally:
+        _release_parser(parser)
+
+def parse_stream(source, on_command, debug=False):
+    """Parse a script read from source, an iterable of strings such as a file,
+    calling on_command with the AST of each top-level command as soon as it is
+    parsed.
+    
+    Input is only read as the parser needs tokens, and the commands are not
+    kept, so the memory used is bounded by the largest command rather than by
+    the size of the script.
+    """
+    lexer = pyshlex.PLYLexer(source, on_command)
+    if lexer.is_empty():
+        return
+    if debug:
+        debug = 2
+    parser = _acquire_parser()
+    try:
+        parser.parse(lexer=lexer, debug=debug)
+    finally:
+        _release_parser(parser)
 
 #-------------------------------------------------------------------------------
 # AST rendering helpers
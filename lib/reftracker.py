@@ -1,10 +1,16 @@
 import codegen
 import bbvalue
+import varindex
 import bb.data
 from pysh import pyshyacc, pyshlex
-from fnmatch import fnmatchcase
 from itertools import chain
+from collections import namedtuple
 import ast
+import hashlib
+import os
+import sys
+from cache import LRUCache
+from persist import PersistentCache
 from bb import msg, utils
 
 from pysh.sherrors import ShellSyntaxError
@@ -128,15 +134,10 @@ class RefTracker(bbvalue.Vistor):
         for subnode in node.field_components:
             self.visit(subnode)
 
-        self.execs = self.parse_shell(str(node))
-        for var in node.metadata.keys():
-            flags = node.metadata.getVarFlags(var)
-            if flags:
-                if "export" in flags:
-                    self.references.add(var)
-                elif var in self.execs and \
-                     "func" in flags and "python" not in flags:
-                    self.references.add(var)
+        self.execs = self.analyze_shell(str(node))
+        index = varindex.get(node.metadata)
+        self.references.update(index.exports)
+        self.references.update(self.execs & index.shell_functions)
 
     def visit_VariableRef(self, node):
         for subnode in node.field_components:
@@ -151,16 +152,14 @@ class RefTracker(bbvalue.Vistor):
         if code is None:
             code = self.correct_indent(str(node))
 
-        code_obj = compile(code, "<string>", "exec", ast.PyCF_ONLY_AST)
-
-        self.visitor = self.ValueVisitor(node)
-        self.visitor.visit(code_obj)
-
-        self.references.update(self.visitor.var_references)
-        self.references.update(self.visitor.var_execs)
-        self.calls = self.visitor.direct_func_calls
+        references, execs, calls = self.analyze_python(node, code)
+        self.references.update(references)
+        self.references.update(execs)
+        if self.calls is None:
+            self.calls = set()
+        self.calls.update(calls)
         env = {}
-        for var in self.calls:
+        for var in calls:
             try:
                 func_obj = utils.better_eval(var, env)
                 self.function_references.add((var, func_obj))
@@ -170,6 +169,50 @@ class RefTracker(bbvalue.Vistor):
     def visit_PythonValue(self, node):
         self.visit_PythonSnippet(node, node.code().strip())
 
+    def analyze_python(self, node, code):
+        """Return the variables referenced, the functions executed via
+        bitbake, and the functions called directly by the supplied python
+        code, consulting the persistent cache, if one is open.
+        """
+
+        if persistent_cache is not None:
+            key = cache_key("python", code)
+            result = persistent_cache.get(key)
+            if result is not None:
+                return result
+
+        visitor = self.ValueVisitor(node)
+        visitor.visit(parse_python(code))
+        result = (frozenset(visitor.var_references),
+                  frozenset(visitor.var_execs),
+                  frozenset(visitor.direct_func_calls))
+
+        if persistent_cache is not None:
+            persistent_cache[key] = result
+        return result
+
+    def analyze_shell(self, value):
+        """Return the external commands executed by the supplied shell code,
+        as parse_shell does, consulting the persistent cache, if one is open.
+        """
+
+        if persistent_cache is None:
+            return self.parse_shell(value)
+
+        key = cache_key("shell", value)
+        result = persistent_cache.get(key)
+        if result is None:
+            tracker = RefTracker()
+            execs = tracker.parse_shell(value)
+            result = (frozenset(execs), frozenset(tracker.funcdefs))
+            persistent_cache[key] = result
+
+        execs, funcdefs = result
+        self.execs.update(execs)
+        self.funcdefs.update(funcdefs)
+        return set(cmd for cmd in self.execs
+                       if cmd not in self.funcdefs)
+
     def parse_shell(self, value):
         """Parse the supplied shell code in a string, returning the external
         commands it executes.
@@ -186,6 +229,23 @@ class RefTracker(bbvalue.Vistor):
                        if cmd not in self.funcdefs)
         return cmds
 
+    def parse_shell_stream(self, source):
+        """Parse the shell code read from source, an iterable of strings such
+        as an open file, returning the external commands it executes.  Each
+        top-level command is processed as soon as it is parsed, so large
+        scripts, such as the run files of tasks, are analyzed in bounded
+        memory.  Syntax errors are raised as they are met, rather than after
+        lexing the whole script.
+        """
+
+        try:
+            pyshyacc.parse_stream(source, self.process_tokens)
+        except pyshlex.NeedMore:
+            raise ShellSyntaxError("Unexpected EOF")
+
+        return set(cmd for cmd in self.execs
+                       if cmd not in self.funcdefs)
+
     def process_tokens(self, tokens):
         """Process a supplied portion of the syntax tree as returned by
         pyshyacc.parse.
@@ -284,10 +344,99 @@ class RefTracker(bbvalue.Vistor):
                     self.execs.add(cmd)
                 break
 
-def references(value, metadata):
+def parse_python(code):
+    """Parse python code into an abstract syntax tree.  The trees are cached
+       by source, and shared, so they must not be modified."""
+
+    tree = parse_python.cache.get(code)
+    if tree is None:
+        tree = compile(code, "<string>", "exec", ast.PyCF_ONLY_AST)
+        parse_python.cache[code] = tree
+    return tree
+
+parse_python.cache = LRUCache(maxsize=10000)
+
+# The results of the shell and python analysis depend only upon the code
+# being analyzed, so they may be kept on disk, in a PersistentCache, to avoid
+# repeating the analysis of unchanged functions in later builds.  Bump
+# CACHE_VERSION whenever the analysis changes; changes to the pysh grammar
+# and lexer are picked up automatically.
+CACHE_VERSION = 1
+persistent_cache = None
+
+def cache_version():
+    """Return the version of the analysis results, for the persistent
+    cache.
+    """
+
+    digest = hashlib.md5()
+    digest.update("%d %d.%d" % ((CACHE_VERSION,) + sys.version_info[:2]))
+    for module in (bbvalue, pyshlex, pyshyacc, sys.modules[__name__]):
+        source = os.path.splitext(module.__file__)[0] + ".py"
+        if not os.path.exists(source):
+            source = module.__file__
+        with open(source, "rb") as sourcefile:
+            digest.update(sourcefile.read())
+    return digest.hexdigest()
+
+def cache_key(kind, code):
+    """Return the persistent cache key for the analysis of code"""
+
+    if isinstance(code, unicode):
+        code = code.encode("utf-8")
+    return "%s:%s" % (kind, hashlib.sha1(code).hexdigest())
+
+def open_cache(metadata):
+    """Open the persistent cache of analysis results, at the path given by
+    BB_REFTRACKER_CACHE in the metadata, or in TMPDIR by default.
+    """
+
+    global persistent_cache
+
+    path = metadata.getVar("BB_REFTRACKER_CACHE", True)
+    if not path:
+        path = os.path.join(metadata.getVar("TMPDIR", True), "cache",
+                            "reftracker.sqlite")
+
+    close_cache()
+    persistent_cache = PersistentCache(path, cache_version())
+    return persistent_cache
+
+def close_cache():
+    """Write out and close the persistent cache, if one is open."""
+
+    global persistent_cache
+
+    if persistent_cache is not None:
+        persistent_cache.close()
+        persistent_cache = None
+
+class Analysis(namedtuple("Analysis", "references execs calls "
+                                     "function_references")):
+    """The results of tracking a value: the variables it references, the
+    commands it executes, the python functions it calls (None if it holds no
+    python), and (name, function) pairs for those calls which could be
+    resolved.
+    """
+
+    __slots__ = ()
+
+def analyze(value, metadata):
+    """Track the references of a value in a single pass, returning all of the
+    results as an immutable Analysis.
+    """
+
     tracker = RefTracker()
     tracker.visit(value)
-    return tracker.references
+    if tracker.calls is not None:
+        calls = frozenset(tracker.calls)
+    else:
+        calls = None
+    return Analysis(frozenset(tracker.references), frozenset(tracker.execs),
+                    calls, frozenset(tracker.function_references))
+
+def references(value, metadata):
+    return set(analyze(value, metadata).references)
 
 def references_from_flags(varname, metadata):
     refs = set()
@@ -299,28 +448,21 @@ def references_from_flags(varname, metadata):
     if varrefs:
         refs.update(references(varrefs, metadata))
         patterns = str(bbvalue.bbparse(varrefs, metadata)).split()
-        for key in metadata.keys():
-            if any(fnmatchcase(key, pat) for pat in patterns):
-                refs.add(key)
+        refs.update(varindex.get(metadata).match(patterns))
 
     return refs
 
 def references_from_name(varname, metadata):
-    refs = references(bbvalue.bbvalue(varname, metadata), metadata)
-    refs |= references_from_flags(varname, metadata)
-    return refs
+    analysis = analyze(bbvalue.bbvalue(varname, metadata), metadata)
+    return analysis.references | references_from_flags(varname, metadata)
 
 def execs(value, metadata):
-    tracker = RefTracker()
-    tracker.visit(value)
-    return tracker.execs
+    return set(analyze(value, metadata).execs)
 
 def calls(value, metadata):
-    tracker = RefTracker()
-    tracker.visit(value)
-    return tracker.calls
+    calls = analyze(value, metadata).calls
+    if calls is not None:
+        return set(calls)
 
 def function_references(value, metadata):
-    tracker = RefTracker()
-    tracker.visit(value)
-    return tracker.function_references
+    return set(analyze(value, metadata).function_references)
@@ -0,0 +1,207 @@
+"""Explain the differences between two signatures: which variables were
+   added, removed or changed, and the path of references through which each
+   of them reaches the variables being signed, such as the tasks.
+
+   Signatures are compared as SignatureDumps, which hold the stable_repr of
+   each variable and the variables it references.  They are either loaded
+   from the BB_HASH_OUTPUT files which do_write_signature produces, or taken
+   from live Signature objects."""
+
+import re
+from collections import deque, namedtuple
+import signature
+
+class SignatureDump(object):
+    """The stable_repr of each variable in a signature, in data, and the
+    names of the variables in the signature which it references, in refs.
+    """
+
+    def __init__(self, data, refs):
+        self.data = data
+        self.refs = refs
+
+    def __repr__(self):
+        return "%s(<%d variables>)" % (self.__class__.__name__, len(self.data))
+
+class Change(namedtuple("Change", "key kind path")):
+    """A variable which was 'added', 'removed' or 'changed', and the path of
+    references, starting at one of the roots, through which it was reached.
+    """
+
+    __slots__ = ()
+
+# The start of a variable in a dump, 'KEY = ' followed by the stable_repr of
+# one of the values signature data holds, and the line of its references
+# which follows it.  Values may span lines, so a value ends at the line of
+# its own references.  Dumps written before those were included have
+# nothing to end a value, and continuation lines are assumed not to look
+# like the start of a variable.
+_entry = re.compile(r"^(?P<key>[^\s\[\]]+) = (?P<value>(?:[A-Z][A-Za-z]*\(|"
+                    r"u?['\"]).*)$")
+_refs_entry = re.compile(r"^(?P<key>[^\s\[\]]+)\[refs\] = (?P<refs>.*)$")
+_reference = re.compile(r"VariableRef\(\[Literal\('(?P<name>[^'$]*)'\)\]\)")
+
+def parse(lines):
+    """Build a SignatureDump from the lines of a signature dump.  Dumps
+    written before the references were included in them get the variables
+    which are referenced directly, with ${}, from the stable_repr.
+    """
+
+    lines = [line.rstrip("\n") for line in lines]
+    if any(_refs_entry.match(line) for line in lines):
+        data, refs = _parse_entries(lines)
+    else:
+        data, refs = _parse_values(lines), {}
+
+    for key, value in data.iteritems():
+        if key not in refs:
+            refs[key] = set(match.group("name")
+                            for match in _reference.finditer(value))
+    for key in refs:
+        refs[key] = frozenset(ref for ref in refs[key] if ref in data)
+    return SignatureDump(data, refs)
+
+def _parse_entries(lines):
+    """Return the values and references of the variables in a dump which
+    has the references of each variable after its value.
+    """
+
+    data = {}
+    refs = {}
+    key = None
+    value = []
+    for line in lines:
+        if key is None:
+            match = _entry.match(line)
+            if match:
+                key = match.group("key")
+                value = [match.group("value")]
+            continue
+
+        match = _refs_entry.match(line)
+        if match and match.group("key") == key:
+            data[key] = "\n".join(value)
+            refs[key] = set(match.group("refs").split())
+            key = None
+        else:
+            value.append(line)
+    if key is not None:
+        data[key] = "\n".join(value)
+    return data, refs
+
+def _parse_values(lines):
+    """Return the values of the variables in a dump without references"""
+
+    data = {}
+    key = None
+    value = []
+    for line in lines:
+        match = _entry.match(line)
+        if match:
+            if key is not None:
+                data[key] = "\n".join(value)
+            key = match.group("key")
+            value = [match.group("value")]
+        elif key is not None:
+            value.append(line)
+    if key is not None:
+        data[key] = "\n".join(value)
+    return data
+
+def load(path):
+    """Load a signature dump written by do_write_signature"""
+
+    with open(path, "r") as dumpfile:
+        return parse(dumpfile)
+
+def from_signature(sig):
+    """Build a SignatureDump from a live Signature"""
+
+    data = {}
+    refs = {}
+    for key, value in sig.data.iteritems():
+        data[key] = signature.stable_repr(value)
+        refs[key] = frozenset(sig.references(key))
+    return SignatureDump(data, refs)
+
+def write(sig, output):
+    """Write the signature dump of a live Signature to the output file, in
+    the format load reads.
+    """
+
+    for key in sorted(sig.data):
+        output.write("%s = " % key)
+        signature.write_repr(sig.data[key], output.write)
+        output.write("\n%s[refs] = %s\n" % (key,
+                                            " ".join(sorted(sig.references(key)))))
+
+def find_roots(*dumps):
+    """Return the variables in any of the dumps which no other variable
+    references, which are normally the tasks.
+    """
+
+    keys = set()
+    referenced = set()
+    for dump in dumps:
+        keys.update(dump.data)
+        for key, refs in dump.refs.iteritems():
+            referenced.update(ref for ref in refs if ref != key)
+    return keys - referenced
+
+def diff(old, new, roots = None):
+    """Return the Changes between two SignatureDumps, each with the shortest
+    path of references reaching it from the roots (default is the variables
+    no other references).  Added and changed variables are reached through
+    the references in new, removed variables through those in old.
+
+    A single breadth first search from all of the roots at once is made over
+    the references of both dumps, so the time taken is linear in the size of
+    the signatures, plus the length of the paths reported.
+    """
+
+    if roots is None:
+        roots = find_roots(old, new)
+
+    changed = {}
+    for key in set(old.data) | set(new.data):
+        if key not in old.data:
+            changed[key] = "added"
+        elif key not in new.data:
+            changed[key] = "removed"
+        elif old.data[key] != new.data[key]:
+            changed[key] = "changed"
+    if not changed:
+        return []
+
+    # Reached through the new references where possible, as that is the
+    # signature being explained, then the old, for removed variables.
+    parents = {}
+    order = []
+    for dump in (new, old):
+        queue = deque(key for key in order if key in dump.data)
+        for root in sorted(roots):
+            if root in dump.data and root not in parents:
+                parents[root] = None
+                order.append(root)
+                queue.append(root)
+
+        while queue:
+            key = queue.popleft()
+            for ref in sorted(dump.refs.get(key, ())):
+                if ref not in parents:
+                    parents[ref] = key
+                    order.append(ref)
+                    queue.append(ref)
+
+    changes = []
+    for key, kind in changed.iteritems():
+        path = []
+        if key in parents:
+            node = key
+            while node is not None:
+                path.append(node)
+                node = parents[node]
+            path.reverse()
+        changes.append(Change(key, kind, tuple(path)))
+    changes.sort(key=lambda change: (len(change.path), change.path, change.key))
+    return changes
@@ -1,28 +1,129 @@
 import hashlib
+import os
+import re
+import struct
+import sys
+import zlib
 import bbvalue
 import bb.data
 import reftracker
-from fnmatch import fnmatchcase
-from itertools import chain
+import varindex
+from base64 import urlsafe_b64encode
+from collections import namedtuple
+from fnmatch import translate
 from bb import msg, utils
+from persist import PersistentCache
 
 def stable_repr(value):
     """Produce a more stable 'repr' string for a value"""
-    if isinstance(value, dict):
-        return "{%s}" % ", ".join("%s: %s" % (stable_repr(key), stable_repr(value))
-                                  for key, value in sorted(value.iteritems()))
+    pieces = []
+    write_repr(value, pieces.append)
+    return "".join(pieces)
+
+def write_repr(value, write):
+    """Pass the stable_repr of a value to the write callable, such as the
+    update method of a hash or the write method of a file, a piece at a
+    time, without building up the whole string.
+    """
+    # Values from bbvalue make up the bulk of signature data, so they are
+    # checked first, and a Compound's components are written inline.
+    if isinstance(value, bbvalue.Literal):
+        write("Literal('%s')" % value.value)
+    elif isinstance(value, bbvalue.Compound):
+        write("%s([" % value.__class__.__name__)
+        for index, item in enumerate(value.field_components):
+            if index:
+                write(", ")
+            write_repr(item, write)
+        write("])")
+    elif isinstance(value, dict):
+        write("{")
+        for index, (key, item) in enumerate(sorted(value.iteritems())):
+            if index:
+                write(", ")
+            write_repr(key, write)
+            write(": ")
+            write_repr(item, write)
+        write("}")
     elif isinstance(value, (set, frozenset)):
-        return "%s(%s)" % (value.__class__.__name__, stable_repr(sorted(value)))
+        write("%s(" % value.__class__.__name__)
+        write_repr(sorted(value), write)
+        write(")")
     elif isinstance(value, list):
-        return "[%s]" % ", ".join(stable_repr(value) for value in value)
+        write("[")
+        for index, item in enumerate(value):
+            if index:
+                write(", ")
+            write_repr(item, write)
+        write("]")
     elif isinstance(value, tuple):
-        return "(%s)" % ", ".join(stable_repr(value) for value in value)
-    elif isinstance(value, bbvalue.Compound):
-        return "%s(%s)" % (value.__class__.__name__, 
-                           stable_repr(value.field_components))
-    elif isinstance(value, bbvalue.Literal):
-        return "Literal('%s')" % str(value)
-    return repr(value)
+        write("(")
+        for index, item in enumerate(value):
+            if index:
+                write(", ")
+            write_repr(item, write)
+        write(")")
+    else:
+        write(repr(value))
+
+class CRC32(object):
+    """A hashlib style interface to zlib.crc32.  It is far quicker than the
+    cryptographic hashes, and good enough to detect changes to the metadata
+    within a single build, but its digests must not be shared or stored.
+    """
+
+    __slots__ = ("crc",)
+
+    name = "crc32"
+    digest_size = 4
+
+    def __init__(self, data = ""):
+        self.crc = zlib.crc32(data)
+
+    def update(self, data):
+        self.crc = zlib.crc32(data, self.crc)
+
+    def digest(self):
+        return struct.pack(">I", self.crc & 0xffffffff)
+
+    def hexdigest(self):
+        return "%08x" % (self.crc & 0xffffffff)
+
+    def copy(self):
+        other = CRC32()
+        other.crc = self.crc
+        return other
+
+hash_algorithms = {
+    "md5": hashlib.md5,
+    "sha1": hashlib.sha1,
+    "sha256": hashlib.sha256,
+    "crc32": CRC32,
+}
+
+if hasattr(hashlib, "blake2b"):
+    hash_algorithms["blake2b"] = hashlib.blake2b
+else:
+    try:
+        import pyblake2
+        hash_algorithms["blake2b"] = pyblake2.blake2b
+    except ImportError:
+        pass
+
+try:
+    import xxhash
+    hash_algorithms["xxh64"] = xxhash.xxh64
+except ImportError:
+    pass
+
+def hash_algorithm(name):
+    """Return the constructor for the named hash algorithm"""
+
+    try:
+        return hash_algorithms[name]
+    except KeyError:
+        raise ValueError("Unknown hash algorithm '%s', expected one of: %s" %
+                         (name, ", ".join(sorted(hash_algorithms))))
 
 class Signature(object):
     """A signature is produced uniquely identifying part of the BitBake metadata.
@@ -30,21 +131,29 @@ class Signature(object):
     keys is the list of variable names to include in the signature (default is
     all current tasks).  blacklist is a list of globs which identify variables
     which should not be included at all, even when referenced by other
-    variables.
+    variables.  algorithm names the entry in hash_algorithms to use (default is
+    BB_HASH_ALGORITHM, or md5).
     """
 
-    def __init__(self, metadata, keys = None, blacklist = None):
-        self._md5 = None
-        self._data = None
+    def __init__(self, metadata, keys = None, blacklist = None,
+                 algorithm = None):
+        self._digest = None
         self._data_string = None
         self.metadata = metadata
 
+        self._explicit_algorithm = bool(algorithm)
+        if not algorithm:
+            algorithm = metadata.getVar("BB_HASH_ALGORITHM", True) or "md5"
+        self.algorithm = algorithm
+        self._hash = hash_algorithm(algorithm)
+
+        self._explicit_keys = bool(keys)
         if keys:
             self.keys = keys
         else:
-            self.keys = [key for key in self.metadata.keys()
-                         if metadata.getVarFlag(key, "task")]
+            self.keys = self.task_keys()
 
+        self._explicit_blacklist = bool(blacklist)
         if blacklist:
             self.blacklist = blacklist
         else:
@@ -53,6 +162,7 @@ class Signature(object):
                 self.blacklist = blacklist.split()
             else:
                 self.blacklist = None
+        self.compile_blacklist()
 
         self.build_signature()
 
@@ -63,13 +173,49 @@ class Signature(object):
         return hash((id(self.metadata), self.keys, self.blacklist))
 
     def __str__(self):
-        from base64 import urlsafe_b64encode
-
-        return urlsafe_b64encode(self.md5.digest()).rstrip("=")
+        return urlsafe_b64encode(self.digest.digest()).rstrip("=")
 
     def hash(self):
         """Return an integer version of the signature"""
-        return int(self.md5.hexdigest(), 16)
+        return int(self.digest.hexdigest(), 16)
+
+    @property
+    def digest(self):
+        """The hash object of the signature, derived from the digests of the
+        keys, each of which covers everything that key references.
+        """
+
+        if self._digest is None:
+            keys = [key for key in self.keys if key in self.data]
+            self._merkle(keys)
+            self._digest = combine_digests(self._hash, dict(
+                (key, self._digests[key]) for key in keys))
+        return self._digest.copy()
+
+    # The name from when md5 was the only algorithm
+    md5 = digest
+
+    @property
+    def data_string(self):
+        """The stable_repr of all of the data in the signature, for debugging.
+        It is only produced when asked for, as the digests do not need it.
+        """
+
+        if self._data_string is None:
+            self._data_string = stable_repr(self.data)
+        return self._data_string
+
+    def compile_blacklist(self):
+        """Compile the blacklist globs into a single regular expression, and
+        reset the memo of the names checked against it.
+        """
+
+        self._blacklisted = {}
+        if self.blacklist:
+            pattern = "|".join("(?:%s)" % translate(bl) for bl in self.blacklist)
+            self._blacklist_match = re.compile(pattern).match
+        else:
+            self._blacklist_match = None
 
     def is_blacklisted(self, item):
         """Determine if the supplied item is blacklisted"""
@@ -84,9 +230,14 @@ class Signature(object):
         else:
             return
 
-        for bl in self.blacklist:
-            if fnmatchcase(valstr, bl):
-                return "${%s}" % valstr
+        try:
+            blacklisted = self._blacklisted[valstr]
+        except KeyError:
+            blacklisted = self._blacklist_match(valstr) is not None
+            self._blacklisted[valstr] = blacklisted
+
+        if blacklisted:
+            return "${%s}" % valstr
 
     def transform_blacklisted(self, item):
         """Transform the supplied item tree, changing all blacklisted objects
@@ -107,35 +258,773 @@ class Signature(object):
         return item
 
     def build_signature(self):
-        def data_for_hash(key, seen):
-            """Returns an iterator over the variable names and their values, including references"""
+        """Build the signature from scratch"""
 
-            if key in seen:
+        self._entries = {}
+        self._value_digests = {}
+        self._walk()
+
+    def update(self, changed):
+        """Recompute the signature after the variables named in changed have
+        been altered in the metadata, whether their values or their flags.
+        Only those variables, any inline python, and the ones whose signature
+        data depends upon the expansion of them, are analyzed again.
+        """
+
+        if not self._explicit_algorithm:
+            algorithm = self.metadata.getVar("BB_HASH_ALGORITHM", True) or "md5"
+            if algorithm != self.algorithm:
+                self.algorithm = algorithm
+                self._hash = hash_algorithm(algorithm)
+                self._value_digests = {}
+
+        if not self._explicit_blacklist:
+            blacklist = self.metadata.getVar("BB_HASH_BLACKLIST", True)
+            blacklist = blacklist and blacklist.split() or None
+            if blacklist != self.blacklist:
+                self.blacklist = blacklist
+                self.compile_blacklist()
+                self.build_signature()
                 return
-            seen.add(key)
-            if self.is_blacklisted(key):
+
+        if not self._explicit_keys:
+            self.keys = self.task_keys()
+
+        for key in self._dirty(set(changed)):
+            self._entries.pop(key, None)
+            self._value_digests.pop(key, None)
+        self._walk()
+
+    def closure(self, key):
+        """Return the names of the variables whose data the signature of key,
+        one of the variables in the signature, covers.
+        """
+
+        if key not in self.data:
+            raise KeyError(key)
+
+        seen = set([key])
+        pending = [key]
+        while pending:
+            for ref in self._refs(pending.pop()):
+                if ref not in seen:
+                    seen.add(ref)
+                    pending.append(ref)
+        return seen
+
+    def references(self, key):
+        """Return the names of the variables in the signature which key, one
+        of the variables in the signature, references directly.
+        """
+
+        if key not in self.data:
+            raise KeyError(key)
+        return set(self._refs(key))
+
+    def signatures(self, keys=None):
+        """Return a dict of the hex digest identifying each of keys (default
+        is the keys of this signature) along with everything it references.
+
+        Each variable is hashed once, from its own data and the digests of
+        the variables it references, so the digests of variables shared
+        between tasks are reused.  Variables which reference each other are
+        hashed together.
+        """
+
+        if keys is None:
+            keys = self.keys
+
+        for key in keys:
+            if key not in self.data:
+                raise KeyError(key)
+        self._merkle(keys)
+        return dict((key, self._digests[key].encode("hex")) for key in keys)
+
+    def inputs(self, key):
+        """Return the names of the variables whose unexpanded values and flags
+        determine the signature of key, one of the variables in the
+        signature, along with whether shell code is involved, whose
+        references also depend upon which variables are exported and which
+        are shell functions.  Returns None if the signature of key depends on
+        the results of inline python, or on the variables which varrefs globs
+        match, as those can change while the values stay the same.
+        """
+
+        if key not in self.data:
+            raise KeyError(key)
+
+        entries = self._entries
+        shell = False
+        seen = set([key])
+        pending = [key]
+        while pending:
+            entry = entries.get(pending.pop())
+            if entry is None:
+                continue
+            elif entry.python or entry.varrefs:
                 return
 
-            valstr = self.metadata.getVar(key, False)
-            if valstr is not None:
-                try:
-                    value = self.transform_blacklisted(
-                        bbvalue.bbvalue(key, self.metadata))
-                except (SyntaxError, NotImplementedError,
-                        bbvalue.PythonExpansionError, 
-                        bbvalue.RecursionError), exc:
-                    msg.error(None, "Unable to parse %s, excluding from signature: %s" %
-                                 (key, exc))
+            if isinstance(entry.value, bbvalue.ShellSnippet):
+                shell = True
+            for ref in entry.inputs:
+                if ref not in seen and not self.is_blacklisted(ref):
+                    seen.add(ref)
+                    pending.append(ref)
+        return seen, shell
+
+    def task_keys(self):
+        """Return the names of the tasks in the metadata"""
+
+        return task_keys(self.metadata)
+
+    def _dirty(self, changed):
+        """Return the variables whose entries are invalidated by changes to
+        the variables in changed.
+        """
+
+        dependents = {}
+        shell = set()
+        python = set()
+        dirty = set(changed)
+        for key, entry in self._entries.iteritems():
+            if entry is None:
+                continue
+
+            if entry.varrefs:
+                # Glob patterns may match variables which are new
+                dirty.add(key)
+            if isinstance(entry.value, bbvalue.ShellSnippet):
+                shell.add(key)
+            if entry.python:
+                python.add(key)
+            for ref in entry.inputs:
+                dependents.setdefault(ref, []).append(key)
+
+        # Shell code references all exported variables, and any shell
+        # functions it executes.
+        index = varindex.get(self.metadata)
+        if changed & (index.exports | index.shell_functions):
+            dirty |= shell
+
+        # Inline python may read any variable, through helpers or through
+        # the expansion of what it gets, so its result may have changed too.
+        if changed:
+            changed = changed | python
+            dirty |= python
+
+        # Anything which expands a changed variable, directly or indirectly,
+        # to produce its signature data, must be redone.
+        seen = set(changed)
+        pending = list(changed)
+        while pending:
+            key = pending.pop()
+            for dependent in dependents.get(key, ()):
+                if dependent not in seen:
+                    seen.add(dependent)
+                    pending.append(dependent)
+                    if not self._entries[dependent].contained:
+                        dirty.add(dependent)
+        return dirty
+
+    def _entry(self, key):
+        """Return the _Entry for a variable, or None if the variable is not
+        included in the signature.
+        """
+
+        if self.is_blacklisted(key):
+            return
+
+        valstr = self.metadata.getVar(key, False)
+        if valstr is None:
+            return
+
+        try:
+            original = bbvalue.bbvalue(key, self.metadata)
+            value = self.transform_blacklisted(original)
+        except (SyntaxError, NotImplementedError,
+                bbvalue.PythonExpansionError,
+                bbvalue.RecursionError), exc:
+            msg.error(None, "Unable to parse %s, excluding from signature: %s" %
+                         (key, exc))
+            return
+
+        analysis = reftracker.analyze(value, self.metadata)
+        refs = analysis.references | \
+               reftracker.references_from_flags(key, self.metadata)
+
+        # Inline python has been evaluated away, but what it referenced
+        # still determines the result
+        if value is not original:
+            inputs = refs | reftracker.analyze(original, self.metadata).references
+        else:
+            inputs = refs
+
+        flags = self.metadata.getVarFlags(key) or {}
+        contained = self_contained(original) and \
+                    "dirs" not in flags and "varrefs" not in flags
+        return _Entry(value, frozenset(refs), frozenset(inputs), contained,
+                      "varrefs" in flags, value is not original and
+                                          has_inline_python(original))
+
+    def _refs(self, key):
+        """Return the variables in the signature which key references"""
+
+        entries = self._entries
+        return [ref for ref in entries[key].refs
+                if entries.get(ref) is not None]
+
+    def _value_digest(self, key):
+        """Return the digest of the data of key alone"""
+
+        try:
+            return self._value_digests[key]
+        except KeyError:
+            digest = self._hash("%s\0" % key)
+            write_repr(self._entries[key].value, digest.update)
+            digest = digest.digest()
+            self._value_digests[key] = digest
+            return digest
+
+    def _merkle(self, keys):
+        """Compute the digests of keys, and everything they reference, which
+        have not been computed yet.  The strongly connected components of the
+        reference graph are found with Tarjan's algorithm, which completes
+        each component only after those it references.
+        """
+
+        digests = self._digests
+        index = {}
+        lowlink = {}
+        stack = []
+        onstack = set()
+
+        def visit(key):
+            index[key] = lowlink[key] = len(index)
+            stack.append(key)
+            onstack.add(key)
+            work.append((key, iter(sorted(self._refs(key)))))
+
+        for root in keys:
+            if root in digests or root in index:
+                continue
+
+            work = []
+            visit(root)
+            while work:
+                key, refs = work[-1]
+                for ref in refs:
+                    if ref in digests:
+                        continue
+                    elif ref not in index:
+                        visit(ref)
+                        break
+                    elif ref in onstack:
+                        lowlink[key] = min(lowlink[key], index[ref])
                 else:
-                    yield key, value
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[key])
+
+                    if lowlink[key] == index[key]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            onstack.discard(member)
+                            component.append(member)
+                            if member == key:
+                                break
+                        self._digest_component(component)
+
+    def _digest_component(self, component):
+        """Compute the digests of the members of a strongly connected
+        component, whose external references have all been digested already.
+        """
 
-                    refs = reftracker.references(value, self.metadata)
-                    refs |= reftracker.references_from_flags(key, self.metadata)
-                    for ref in refs:
-                        for other in data_for_hash(ref, seen):
-                            yield other
+        digests = self._digests
+        members = set(component)
+        external = set()
+        digest = self._hash()
+        for member in sorted(members):
+            digest.update(self._value_digest(member))
+            external.update(self._refs(member))
 
+        for ref in sorted(external - members):
+            digest.update("%s\0%s" % (ref, digests[ref]))
+
+        if len(members) == 1:
+            digests[component[0]] = digest.digest()
+        else:
+            shared = digest.digest()
+            for member in members:
+                digests[member] = self._hash("%s\0%s" % (member, shared)).digest()
+
+    def _walk(self):
+        """Gather the signature data for every variable reachable from the
+        keys, computing any entries which are missing, dropping those which
+        are no longer reachable, and produce the signature.
+        """
+
+        entries = self._entries
+        data = {}
         seen = set()
-        self.data = dict(chain(*[data_for_hash(key, seen) for key in self.keys]))
-        self.data_string = stable_repr(self.data)
-        self.md5 = hashlib.md5(self.data_string)
+        pending = list(reversed(self.keys))
+        while pending:
+            key = pending.pop()
+            if key in seen:
+                continue
+            seen.add(key)
+
+            if key not in entries:
+                entries[key] = self._entry(key)
+            entry = entries[key]
+            if entry is not None:
+                data[key] = entry.value
+                pending.extend(entry.refs)
+
+        for key in set(entries) - seen:
+            del entries[key]
+            self._value_digests.pop(key, None)
+
+        self._digests = {}
+        self._digest = None
+        self._data_string = None
+        self.data = data
+
+def combine_digests(new, digests):
+    """Return a hash object, created by new, over the names and digests in
+    the digests dict, as the digest of a signature covering them all.
+    """
+
+    combined = new()
+    for key in sorted(digests):
+        combined.update("%s\0%s" % (key, digests[key]))
+    return combined
+
+def task_signatures(metadata, blacklist = None, algorithm = None):
+    """Return a dict of the hex digest identifying each task in the metadata,
+    analyzing the variables they share only once.
+    """
+
+    return Signature(metadata, blacklist=blacklist,
+                     algorithm=algorithm).signatures()
+
+_plain_types = (basestring, bool, int, long, float, type(None))
+
+def _plain(value):
+    """Determine if a value can be shipped to another process as is"""
+
+    if isinstance(value, (list, tuple)):
+        return all(_plain(item) for item in value)
+    return isinstance(value, _plain_types)
+
+def raw_metadata(metadata):
+    """Return the unexpanded values and the flags of the variables in the
+    metadata, as dicts which can be pickled.  Variables and flags holding
+    objects, rather than strings and the like, are left out.
+    """
+
+    values, flags = {}, {}
+    for key in metadata.keys():
+        value = metadata.getVar(key, False)
+        if not _plain(value):
+            continue
+
+        values[key] = value
+        varflags = metadata.getVarFlags(key)
+        if varflags:
+            flags[key] = dict((flag, flagvalue)
+                              for flag, flagvalue in varflags.iteritems()
+                              if _plain(flagvalue))
+    return values, flags
+
+def from_raw_metadata(values, flags):
+    """Build a datastore from the dicts produced by raw_metadata"""
+
+    metadata = bb.data.init()
+    for key, value in values.iteritems():
+        if value is not None:
+            metadata.setVar(key, value)
+        if flags.get(key):
+            metadata.setVarFlags(key, flags[key])
+    return metadata
+
+# The words of unexpanded values which may name variables.  One preceded by
+# the end of a reference or followed by the start of one may be part of a name
+# which is computed, as in ${RDEPENDS_${PN}}.
+_word = re.compile(r"(\})?([\w\-+./]+)(\$\{)?")
+
+# An innermost reference, whose expansion is unknown to raw_closure
+_innermost = re.compile(r"\$\{[^{}]*\}")
+
+def varrefs_globs(text):
+    """Return the glob patterns which an unexpanded varrefs flag may expand
+    to, with every reference replaced by a wildcard.
+    """
+
+    while True:
+        text, count = _innermost.subn("*", text)
+        if not count:
+            return text.split()
+
+def raw_closure(raw, keys):
+    """Return the part of raw metadata, a (values, flags) pair from
+    raw_metadata, which the signature of keys appears to depend upon: keys,
+    the variables whose names appear in their values and flags, and so on,
+    along with the exported variables and shell functions, which shell code
+    references.  Glob varrefs are matched against all of the variables, as the
+    ones they match need not be named anywhere else.  This errs on the side
+    of including too much, but may miss variables whose names inline python
+    computes.
+    """
+
+    values, flags = raw
+    names = set(values) | set(flags)
+    pending = [key for key in keys if key in names]
+    pending.extend(key for key in ("BB_HASH_BLACKLIST", "BB_HASH_ALGORITHM")
+                   if key in names)
+    pending.extend(key for key, varflags in flags.iteritems()
+                   if "export" in varflags or
+                      ("func" in varflags and "python" not in varflags))
+
+    globbed = {}
+    def glob(pattern):
+        if pattern not in globbed:
+            match = re.compile(translate(pattern)).match
+            globbed[pattern] = [name for name in names if match(name)]
+        return globbed[pattern]
+
+    seen = set(pending)
+    def add(found):
+        for name in found:
+            if name not in seen:
+                seen.add(name)
+                pending.append(name)
+
+    while pending:
+        key = pending.pop()
+        texts = [values.get(key)]
+        texts.extend(flags.get(key, {}).itervalues())
+        for text in texts:
+            if not isinstance(text, basestring):
+                continue
+
+            for after, word, before in _word.findall(text):
+                if after or before:
+                    add(glob("%s%s%s" % (after and "*", word, before and "*")))
+                elif word in names:
+                    add((word,))
+
+        varrefs = flags.get(key, {}).get("varrefs")
+        if isinstance(varrefs, basestring):
+            for pattern in varrefs_globs(varrefs):
+                add(glob(pattern))
+
+    return (dict((key, values[key]) for key in seen if key in values),
+            dict((key, flags[key]) for key in seen if key in flags))
+
+def _watch(metadata, sent):
+    """Record the names of the variables which are looked up in metadata but
+    were not sent, in the set returned, to which None is added if the
+    variables are listed.  Returns a function which stops the recording.
+    """
+
+    missed = set()
+    def watch(name):
+        orig = getattr(metadata, name)
+        def wrapper(var, *args, **kwargs):
+            if var not in sent:
+                missed.add(var)
+            return orig(var, *args, **kwargs)
+        setattr(metadata, name, wrapper)
+
+    for name in ("getVar", "getVarFlag", "getVarFlags"):
+        watch(name)
+    keys = metadata.keys
+    def listed():
+        missed.add(None)
+        return keys()
+    metadata.keys = listed
+
+    def stop():
+        for name in ("getVar", "getVarFlag", "getVarFlags", "keys"):
+            delattr(metadata, name)
+    return missed, stop
+
+def _sign_raw(args):
+    """Sign raw metadata in a worker process, returning the signature along
+    with the variables it looked for but was not sent, as _watch does.
+    """
+
+    (values, flags), keys, blacklist, algorithm = args
+    metadata = from_raw_metadata(values, flags)
+    # The index lists the variables once, and is then kept current
+    varindex.get(metadata)
+    missed, stop = _watch(metadata, set(values) | set(flags))
+    try:
+        return str(Signature(metadata, keys, blacklist, algorithm)), missed
+    finally:
+        stop()
+
+def sign_many(datastores, workers = None, keys = None, blacklist = None,
+              algorithm = None):
+    """Return the signatures, as str(Signature), of many datastores, in the
+    same order, computed by a pool of worker processes (default is one per
+    cpu).  Each datastore is either a metadata instance or a (values, flags)
+    pair from raw_metadata, which is what is shipped to the workers.
+
+    Each worker is only sent the raw_closure of the keys (default is every
+    task).  A datastore whose signature turns out to look up variables it
+    was not sent is signed again from all of them.
+    """
+
+    datastores = list(datastores)
+    def raw(index):
+        metadata = datastores[index]
+        if not isinstance(metadata, tuple):
+            metadata = raw_metadata(metadata)
+        return metadata
+
+    def full_jobs(indexes):
+        for index in indexes:
+            yield raw(index), keys, blacklist, algorithm
+
+    if workers == 1:
+        return [_sign_raw(job)[0]
+                for job in full_jobs(xrange(len(datastores)))]
+
+    try:
+        from multiprocessing import Pool
+        pool = Pool(workers)
+    except (OSError, ImportError):
+        # No process pool here, such as without a working /dev/shm
+        return sign_many(datastores, 1, keys, blacklist, algorithm)
+
+    names = []
+    def closure_jobs():
+        for index in xrange(len(datastores)):
+            values, flags = raw(index)
+            names.append(frozenset(values) | frozenset(flags))
+            signed = keys or [key for key, varflags in flags.iteritems()
+                              if varflags.get("task")]
+            yield (raw_closure((values, flags), signed), signed, blacklist,
+                   algorithm)
+
+    try:
+        results = pool.map(_sign_raw, closure_jobs())
+        retry = [index for index, (_, missed) in enumerate(results)
+                 if None in missed or missed & names[index]]
+        if retry:
+            for index, result in zip(retry,
+                                     pool.map(_sign_raw, full_jobs(retry))):
+                results[index] = result
+    finally:
+        # Every result is in once map returns, so the workers can go
+        pool.terminate()
+        pool.join()
+    return [signature for signature, _ in results]
+
+def task_keys(metadata):
+    """Return the names of the tasks in the metadata"""
+
+    return [key for key in metadata.keys() if metadata.getVarFlag(key, "task")]
+
+# Signatures may be kept on disk, in a PersistentCache, along with the
+# variables they were computed from and fingerprints of the unexpanded values
+# and flags of those variables, so that a later build whose fingerprints
+# match can skip the analysis.  Bump CACHE_VERSION whenever the signature
+# data changes; changes to the parsing and analysis code are picked up
+# automatically.
+CACHE_VERSION = 1
+persistent_cache = None
+
+# The number of sets of inputs remembered for a task, as a task name and
+# value may be shared by several recipes, or variants of a recipe.
+cache_candidates = 4
+
+def cache_version():
+    """Return the version of the signatures, for the persistent cache"""
+
+    digest = hashlib.md5()
+    digest.update("%d %s" % (CACHE_VERSION, reftracker.cache_version()))
+    for module in (bbvalue, reftracker, varindex, sys.modules[__name__]):
+        source = os.path.splitext(module.__file__)[0] + ".py"
+        if not os.path.exists(source):
+            source = module.__file__
+        with open(source, "rb") as sourcefile:
+            digest.update(sourcefile.read())
+    return digest.hexdigest()
+
+def open_cache(metadata):
+    """Open the persistent cache of signatures, at the path given by
+    BB_SIGNATURE_CACHE in the metadata, or in TMPDIR by default.
+    """
+
+    global persistent_cache
+
+    path = metadata.getVar("BB_SIGNATURE_CACHE", True)
+    if not path:
+        path = os.path.join(metadata.getVar("TMPDIR", True), "cache",
+                            "signatures.sqlite")
+
+    close_cache()
+    persistent_cache = PersistentCache(path, cache_version())
+    return persistent_cache
+
+def close_cache():
+    """Write out and close the persistent cache, if one is open."""
+
+    global persistent_cache
+
+    if persistent_cache is not None:
+        persistent_cache.close()
+        persistent_cache = None
+
+def fingerprint(metadata, key):
+    """Return a digest of the unexpanded value and the flags of a variable, or
+    None if it doesn't exist.
+    """
+
+    value = metadata.getVar(key, False)
+    flags = metadata.getVarFlags(key)
+    if value is None and not flags:
+        return None
+
+    digest = hashlib.md5(repr(value))
+    if flags:
+        write_repr(dict((flag, flagvalue)
+                        for flag, flagvalue in flags.iteritems()
+                        if _plain(flagvalue)), digest.update)
+    return digest.hexdigest()
+
+def _shell_fingerprint(metadata):
+    """Return a digest of the names of the exported variables and the shell
+    functions in the metadata, which shell code references.
+    """
+
+    index = varindex.get(metadata)
+    return hashlib.md5("%s\0%s" % (" ".join(sorted(index.exports)),
+                                   " ".join(sorted(index.shell_functions)))
+                      ).hexdigest()
+
+def cached_signatures(metadata, keys = None, blacklist = None,
+                      algorithm = None):
+    """Return a dict of the hex digest identifying each of keys (default is
+    every task), as Signature.signatures does, using the persistent cache, if
+    one is open.  Only keys whose inputs have changed since they were cached,
+    or which depend on inline python, are analyzed.  Keys which are not
+    included in the signature are left out.
+    """
+
+    if not keys:
+        keys = task_keys(metadata)
+    if not blacklist:
+        blacklist = metadata.getVar("BB_HASH_BLACKLIST", True)
+        blacklist = blacklist and blacklist.split() or None
+    if not algorithm:
+        algorithm = metadata.getVar("BB_HASH_ALGORITHM", True) or "md5"
+
+    cache = persistent_cache
+    if cache is None:
+        sig = Signature(metadata, keys, blacklist, algorithm)
+        return sig.signatures([key for key in keys if key in sig.data])
+
+    settings = "%s\0%s" % (" ".join(blacklist or ()), algorithm)
+    shell = []
+    def matches(inputs, shell_fingerprint):
+        if shell_fingerprint is not None:
+            if not shell:
+                shell.append(_shell_fingerprint(metadata))
+            if shell[0] != shell_fingerprint:
+                return False
+        return all(fingerprint(metadata, name) == value
+                   for name, value in inputs)
+
+    digests = {}
+    cachekeys = {}
+    for key in keys:
+        cachekey = cachekeys[key] = "%s:%s" % (key, hashlib.md5("%s\0%s" % (
+                                        settings, fingerprint(metadata, key))
+                                    ).hexdigest())
+        for inputs, shell_fingerprint, digest in cache.get(cachekey, ()):
+            if matches(inputs, shell_fingerprint):
+                digests[key] = digest
+                break
+
+    missing = [key for key in keys if key not in digests]
+    if missing:
+        sig = Signature(metadata, missing, blacklist, algorithm)
+        missing = [key for key in missing if key in sig.data]
+        digests.update(sig.signatures(missing))
+        for key in missing:
+            inputs = sig.inputs(key)
+            if inputs is None:
+                continue
+
+            names, involves_shell = inputs
+            if involves_shell:
+                if not shell:
+                    shell.append(_shell_fingerprint(metadata))
+                shell_fingerprint = shell[0]
+            else:
+                shell_fingerprint = None
+
+            record = (tuple((name, fingerprint(metadata, name))
+                            for name in sorted(names)),
+                      shell_fingerprint, digests[key])
+            candidates = cache.get(cachekeys[key], [])
+            cache[cachekeys[key]] = [record] + \
+                                    candidates[:cache_candidates - 1]
+    return digests
+
+def cached_signature(metadata, keys = None, blacklist = None,
+                     algorithm = None):
+    """Return the signature of the metadata as str(Signature) does, built
+    from cached_signatures.
+    """
+
+    if not algorithm:
+        algorithm = metadata.getVar("BB_HASH_ALGORITHM", True) or "md5"
+
+    digests = cached_signatures(metadata, keys, blacklist, algorithm)
+    combined = combine_digests(hash_algorithm(algorithm), dict(
+                   (key, digest.decode("hex"))
+                   for key, digest in digests.iteritems()))
+    return urlsafe_b64encode(combined.digest()).rstrip("=")
+
+class _Entry(namedtuple("_Entry", "value refs inputs contained varrefs "
+                                 "python")):
+    """The signature data for a variable: its value, with blacklisted
+    references and inline python transformed away, and the variables it
+    references.  inputs holds those references along with any consulted by
+    the inline python.  contained is True if the data was obtained without
+    expanding any other variable, varrefs if the variable has glob varrefs,
+    which new variables may match, and python if inline python was evaluated.
+    """
+
+    __slots__ = ()
+
+def has_inline_python(value):
+    """Determine if a value contains inline python, ${@...}"""
+
+    if isinstance(value, bbvalue.PythonValue):
+        return True
+    elif isinstance(value, bbvalue.Compound):
+        return any(has_inline_python(c) for c in value.field_components)
+    return False
+
+def self_contained(value):
+    """Determine if the signature data for a value, its transformed form and
+    its references, can be obtained without expanding any other variable.
+    """
+
+    if isinstance(value, (bbvalue.ShellSnippet, bbvalue.PythonSnippet,
+                          bbvalue.PythonValue, bbvalue.LazyCompound,
+                          bbvalue.Conditional)):
+        return False
+    elif isinstance(value, bbvalue.VariableRef):
+        return all(isinstance(c, bbvalue.Literal)
+                   for c in value.field_components)
+    elif isinstance(value, bbvalue.Compound):
+        return all(self_contained(c) for c in value.field_components)
+    return True
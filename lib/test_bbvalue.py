@@ -45,6 +45,12 @@ class TestSimpleExpansions(unittest.TestCase):
         val = bbvalue.bbparse("${@d.getVar('foo', True) + ' ${bar}'}", self.d)
         self.assertEqual(str(val), "value of foo value of bar")
 
+    def test_python_snippet_compiled_once(self):
+        val = bbvalue.bbparse("${@5*12}", self.d)
+        self.assertEqual(str(val), "60")
+        codeobj = bbvalue.compile_expression("5*12")
+        self.assertTrue(bbvalue.compile_expression.cache.get("5*12") is codeobj)
+
     def test_python_snippet_syntax_error(self):
         self.d.setVar("FOO", "${@foo = 5}")
         val = bbvalue.bbvalue("FOO", self.d)
@@ -87,6 +93,34 @@ class TestSimpleExpansions(unittest.TestCase):
         value = bbvalue.bbvalue("FOO", self.d)
         self.assertRaises(bbvalue.RecursionError, str, value)
 
+    def test_recursion_path(self):
+        self.d.setVar("FOO", "${BAR}")
+        self.d.setVar("BAR", "${BAZ}")
+        self.d.setVar("BAZ", "${FOO}")
+        value = bbvalue.bbvalue("FOO", self.d)
+        try:
+            str(value)
+        except bbvalue.RecursionError, exc:
+            self.assertEqual(exc.path, ["BAR", "BAZ", "FOO", "BAR"])
+        else:
+            self.fail("RecursionError not raised")
+
+    def test_recursion_not_sticky(self):
+        self.d.setVar("FOO", "${BAR}")
+        self.d.setVar("BAR", "${FOO}")
+        value = bbvalue.bbvalue("FOO", self.d)
+        self.assertRaises(bbvalue.RecursionError, str, value)
+        self.d.setVar("BAR", "bar")
+        self.assertEqual(str(value), "bar")
+
+    def test_long_chain(self):
+        length = sys.getrecursionlimit()
+        for i in xrange(length):
+            self.d.setVar("CHAIN%d" % i, "${CHAIN%d}" % (i + 1))
+        self.d.setVar("CHAIN%d" % length, "end")
+        value = bbvalue.bbvalue("CHAIN0", self.d)
+        self.assertEqual(str(value), "end")
+
     def test_recursion_exception(self):
         self.d.setVar("FOO", "${BAR}")
         self.d.setVar("BAR", "${${@'FOO'}}")
@@ -174,6 +208,101 @@ class TestMemoize(unittest.TestCase):
         self.assertEqual(bbvalue.bbvalue("foo", d),
                          bbvalue.bbvalue("bar", d))
 
+    def test_bounded(self):
+        d = bb.data.init()
+        memory = bbvalue.bbvalue.memory
+        bbvalue.bbvalue.memory = bbvalue.MetadataCache(maxsize=2)
+        try:
+            for var in ("FOO", "BAR", "BAZ"):
+                d.setVar(var, var.lower())
+                bbvalue.bbvalue(var, d)
+            self.assertEqual(len(bbvalue.bbvalue.memory), 2)
+            self.assertEqual(bbvalue.bbvalue.memory.evictions, 1)
+        finally:
+            bbvalue.bbvalue.memory = memory
+
+class TestResolveMemoize(unittest.TestCase):
+    def setUp(self):
+        self.d = bb.data.init()
+        self.d.setVar("FOO", "-${BAR}-")
+        self.d.setVar("BAR", "+${BAZ}+")
+        self.d.setVar("BAZ", "alpha")
+
+    def cached(self, varname):
+        return bbvalue.VariableRef.memory.lookup(self.d, varname)
+
+    def test_memoized(self):
+        self.assertEqual(str(bbvalue.bbparse("${FOO}", self.d)), "-+alpha+-")
+        value, deps = self.cached("FOO")
+        self.assertEqual(value, "-+alpha+-")
+        self.assertEqual(set(deps), set(["FOO", "BAR", "BAZ"]))
+
+    def test_transitive_change(self):
+        self.assertEqual(str(bbvalue.bbparse("${FOO}", self.d)), "-+alpha+-")
+        self.d.setVar("BAZ", "beta")
+        self.assertEqual(str(bbvalue.bbparse("${FOO}", self.d)), "-+beta+-")
+
+    def test_defined_later(self):
+        self.assertEqual(str(bbvalue.bbparse("${QUX}", self.d)), "${QUX}")
+        self.d.setVar("QUX", "qux")
+        self.assertEqual(str(bbvalue.bbparse("${QUX}", self.d)), "qux")
+
+    def test_python_not_memoized(self):
+        self.d.setVar("BAZ", "${@'alpha'}")
+        self.assertEqual(str(bbvalue.bbparse("${FOO}", self.d)), "-+alpha+-")
+        self.assertEqual(self.cached("FOO"), None)
+        self.assertEqual(self.cached("BAZ"), None)
+
+class TestParseCache(unittest.TestCase):
+    def test_skeleton(self):
+        skeleton = bbvalue.parse_skeleton("${D}${bindir} ${@'x'} ${")
+        self.assertEqual(skeleton, ((bbvalue.VariableRef, ("D",)),
+                                    (bbvalue.VariableRef, ("bindir",)),
+                                    " ",
+                                    (bbvalue.PythonValue, ("'x'",)),
+                                    " ${"))
+
+    def test_shared_across_metadata(self):
+        d1 = bb.data.init()
+        d2 = bb.data.init()
+        d1.setVar("bindir", "/usr/bin")
+        d2.setVar("bindir", "/bin")
+        val1 = bbvalue.bbparse("${bindir}/foo", d1)
+        val2 = bbvalue.bbparse("${bindir}/foo", d2)
+        self.assertTrue(val1.field_components[0].metadata is d1)
+        self.assertTrue(val2.field_components[0].metadata is d2)
+        self.assertEqual(str(val1), "/usr/bin/foo")
+        self.assertEqual(str(val2), "/bin/foo")
+
+    def test_uncached(self):
+        d = bb.data.init()
+        cache = bbvalue.bbparse.cache
+        bbvalue.bbparse.cache = None
+        try:
+            self.assertEqual(bbvalue.bbparse("${foo}", d),
+                             bbvalue.bind(bbvalue.parse_skeleton("${foo}"), d))
+        finally:
+            bbvalue.bbparse.cache = cache
+
+class TestCompact(unittest.TestCase):
+    def test_no_dict(self):
+        d = bb.data.init()
+        value = bbvalue.bbparse("foo ${bar} ${@'baz'}", d)
+        nodes = [value] + value.field_components
+        for node in nodes:
+            self.assertFalse(hasattr(node, "__dict__"), repr(node))
+
+    def test_pickle(self):
+        import pickle
+        value = bbvalue.LazyCompound(None,
+                                     [bbvalue.Literal(None, "foo"),
+                                      bbvalue.VariableRef(None, [bbvalue.Literal(None, "bar")])],
+                                     [bbvalue.Literal(None, "baz")])
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            copied = pickle.loads(pickle.dumps(value, protocol))
+            self.assertEqual(copied, value)
+            self.assertEqual(repr(copied), repr(value))
+
 class TestLazy(unittest.TestCase):
     def setUp(self):
         self.metadata = bb.data.init()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python
+
+import unittest
+import sys
+import os
+
+basedir = os.path.dirname(os.path.abspath(os.path.dirname(__file__)))
+oedir = os.path.dirname(basedir)
+searchpath = [os.path.join(basedir, "lib"),
+              os.path.join(oedir, "openembedded", "lib"),
+              os.path.join(oedir, "bitbake", "lib")]
+sys.path[0:0] = searchpath
+
+import gc
+import shutil
+import tempfile
+import weakref
+import cache
+import persist
+
+class Metadata(object):
+    """Stand-in for a datastore, which only needs to be weakly referenced"""
+
+class TestLRUCache(unittest.TestCase):
+    def test_get(self):
+        lru = cache.LRUCache(maxsize=2)
+        lru["foo"] = 1
+        self.assertEqual(lru.get("foo"), 1)
+        self.assertEqual(lru.get("bar"), None)
+        self.assertEqual((lru.hits, lru.misses), (1, 1))
+
+    def test_evicts_least_recent(self):
+        lru = cache.LRUCache(maxsize=2)
+        lru["foo"] = 1
+        lru["bar"] = 2
+        lru.get("foo")
+        lru["baz"] = 3
+        self.assertTrue("foo" in lru)
+        self.assertFalse("bar" in lru)
+        self.assertTrue("baz" in lru)
+        self.assertEqual(lru.evictions, 1)
+
+    def test_byte_budget(self):
+        lru = cache.LRUCache(maxbytes=10, sizeof=lambda k, v: len(v))
+        lru["foo"] = "x" * 6
+        lru["bar"] = "x" * 4
+        self.assertEqual(lru.bytes, 10)
+        lru["baz"] = "x"
+        self.assertEqual(len(lru), 2)
+        self.assertFalse("foo" in lru)
+        self.assertEqual(lru.bytes, 5)
+
+    def test_byte_budget_requires_sizeof(self):
+        self.assertRaises(ValueError, cache.LRUCache, maxbytes=10)
+
+    def test_replace(self):
+        lru = cache.LRUCache(maxbytes=10, sizeof=lambda k, v: len(v))
+        lru["foo"] = "x" * 6
+        lru["foo"] = "x" * 2
+        self.assertEqual(lru.bytes, 2)
+        self.assertEqual(lru["foo"], "xx")
+
+    def test_resize(self):
+        lru = cache.LRUCache()
+        for i in range(10):
+            lru[i] = i
+        lru.resize(maxsize=3)
+        self.assertEqual(sorted(lru._map), [7, 8, 9])
+        self.assertEqual(lru.stats()["evictions"], 7)
+
+    def test_threads(self):
+        import threading
+
+        lru = cache.LRUCache(maxsize=50)
+        def churn(offset):
+            for i in xrange(2000):
+                lru[offset + i % 100] = i
+                lru.get(offset + (i * 7) % 100)
+
+        interval = sys.getcheckinterval()
+        sys.setcheckinterval(1)
+        try:
+            threads = [threading.Thread(target=churn, args=(offset,))
+                       for offset in xrange(0, 800, 100)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setcheckinterval(interval)
+
+        self.assertEqual(len(lru), 50)
+        count = 0
+        link = lru._root[1]
+        while link is not lru._root:
+            count += 1
+            link = link[1]
+        self.assertEqual(count, 50)
+
+class TestMetadataCache(unittest.TestCase):
+    def test_per_metadata(self):
+        mcache = cache.MetadataCache()
+        d1, d2 = Metadata(), Metadata()
+        mcache.store(d1, "FOO", 1)
+        self.assertEqual(mcache.lookup(d1, "FOO"), 1)
+        self.assertEqual(mcache.lookup(d2, "FOO"), None)
+
+    def test_collected(self):
+        mcache = cache.MetadataCache()
+        d = Metadata()
+        mcache.store(d, "FOO", 1)
+        mcache.store(d, "BAR", 2)
+        del d
+        gc.collect()
+        self.assertEqual(len(mcache), 0)
+
+    def test_forget(self):
+        mcache = cache.MetadataCache()
+        d1, d2 = Metadata(), Metadata()
+        mcache.store(d1, "FOO", 1)
+        mcache.store(d2, "FOO", 2)
+        mcache.forget(d1)
+        self.assertEqual(mcache.lookup(d1, "FOO"), None)
+        self.assertEqual(mcache.lookup(d2, "FOO"), 2)
+        self.assertEqual(mcache._keys.keys(), [id(d2)])
+
+    def test_values_collected(self):
+        import bb.data
+        import bbvalue
+
+        memory = bbvalue.bbvalue.memory
+        bbvalue.bbvalue.memory = cache.MetadataCache()
+        try:
+            refs = []
+            for index in xrange(20):
+                d = bb.data.init()
+                d.setVar("FOO", "${BAR}/foo%d" % index)
+                d.setVar("BAR", "bar")
+                d.setVar("do_foo", "echo ${FOO}")
+                d.setVarFlag("do_foo", "func", True)
+                value = bbvalue.bbvalue("do_foo", d)
+                self.assertEqual(str(value), "echo bar/foo%d" % index)
+                refs.append(weakref.ref(d))
+            del d, value
+            gc.collect()
+            self.assertEqual([ref for ref in refs if ref() is not None], [])
+            self.assertEqual(len(bbvalue.bbvalue.memory), 0)
+        finally:
+            bbvalue.bbvalue.memory = memory
+
+class TestPersistentCache(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tempdir, "cache", "test.sqlite")
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def test_persists(self):
+        pcache = persist.PersistentCache(self.path, 1)
+        pcache["foo"] = set(["bar"])
+        pcache.close()
+        pcache = persist.PersistentCache(self.path, 1)
+        self.assertEqual(pcache.get("foo"), set(["bar"]))
+        self.assertEqual(pcache.get("bar"), None)
+        self.assertEqual(pcache.stats(), {"hits": 1, "misses": 1})
+        pcache.close()
+
+    def test_version_change(self):
+        pcache = persist.PersistentCache(self.path, 1)
+        pcache["foo"] = "bar"
+        pcache.close()
+        pcache = persist.PersistentCache(self.path, 2)
+        self.assertEqual(pcache.get("foo"), None)
+        self.assertEqual(len(pcache), 0)
+        pcache.close()
+
+if __name__ == "__main__":
+    unittest.main()
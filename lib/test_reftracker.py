@@ -20,17 +20,17 @@ class TestRefTracking(unittest.TestCase):
         self.d = bb.data.init()
 
     def assertReferences(self, value, refs):
-        self.assertEqual(reftracker.references(value, self.d), refs)
+        self.assertEqual(reftracker.analyze(value, self.d).references, refs)
 
     def assertExecs(self, value, execs):
-        self.assertEqual(reftracker.execs(value, self.d), execs)
+        self.assertEqual(reftracker.analyze(value, self.d).execs, execs)
 
     def assertCalls(self, value, calls):
-        self.assertEqual(reftracker.calls(value, self.d), calls)
+        self.assertEqual(reftracker.analyze(value, self.d).calls, calls)
 
     def assertFunctionReferences(self, value, refs):
         self.assertEqual(
-            reftracker.function_references(value, self.d), refs)
+            reftracker.analyze(value, self.d).function_references, refs)
 
 class TestShell(TestRefTracking):
     def setUp(self):
@@ -128,6 +128,165 @@ END
         self.assertRaises(reftracker.ShellSyntaxError, reftracker.execs,
                           bbvalue.shparse("cp foo`", self.d), self.d)
 
+    def test_shipped_tables(self):
+        from pysh import pyshyacc, pyshtables
+
+        self.assertEqual(pyshtables._grammar_signature,
+                         pyshyacc.grammar_signature())
+
+    def test_lexer_incremental(self):
+        from pysh import pyshlex
+
+        script = ("a=\"${B}\" # c\nfor x in $(ls '$y'); do cat <<-EOF >f\n"
+                  "\tz \\${q}\n\tEOF\ndone\n")
+        tokens, remaining = pyshlex.get_tokens(script)
+        self.assertEqual(remaining, "")
+        self.assertTrue(("$(ls '$y')", "TOKEN") in tokens)
+        self.assertTrue(("z \\${q}\n", "TOKEN") in tokens)
+
+        lexer = pyshlex.PLYLexer()
+        for c in script:
+            try:
+                lexer.add(c)
+            except pyshlex.NeedMore:
+                pass
+        self.assertEqual(lexer.add("", True), "")
+        self.assertEqual([(t.value, t.type) for t in lexer._tokens], tokens)
+
+    def test_wordtree_cache(self):
+        from pysh import pyshlex
+
+        token = '"$(ls ${S})"'
+        expected = ['', ['"', ['$(', 'ls ', ['${', 'S', '}'], ')'], '"'], '']
+        first = pyshlex.make_wordtree(token)
+        self.assertEqual(first, expected)
+        first[1][1][:] = []
+        self.assertEqual(pyshlex.make_wordtree(token), expected)
+        self.assertEqual(pyshlex.make_wordtree(token, True),
+                         ['', '"', ['$(', 'ls ', ['${', 'S', '}'], ')'], '"',
+                          ''])
+
+        plain = pyshlex.make_wordtree("install")
+        plain.append("foo")
+        self.assertEqual(pyshlex.make_wordtree("install"),
+                         ['', 'install', ''])
+
+        size = pyshlex.wordtree_cache_size
+        pyshlex.wordtree_cache_size = 8
+        try:
+            for index in xrange(20):
+                pyshlex.make_wordtree("word%d" % index)
+                self.assertTrue(len(pyshlex._wordtrees) <= 8)
+        finally:
+            pyshlex.wordtree_cache_size = size
+
+    def test_trailing_comment(self):
+        self.assertExecs("install -d ${D} # no newline", set(["install"]))
+
+    def test_parse_stream(self):
+        from pysh import pyshyacc
+
+        script = ("do_install() {\n\tinstall -d ${D}\n}\n"
+                  "cat <<END | sed -e s,a,b, > out\nfoo\nEND\n"
+                  "for f in *.patch; do patch -p1 < $f; done\n"
+                  "do_install # the last line\n")
+        for size in (1, 7, len(script)):
+            chunks = [script[i:i + size]
+                      for i in xrange(0, len(script), size)]
+            commands = []
+            pyshyacc.parse_stream(chunks, commands.append)
+            self.assertEqual(len(commands), 4)
+
+            tracker = reftracker.RefTracker()
+            self.assertEqual(tracker.parse_shell_stream(chunks),
+                             set(["install", "cat", "sed", "patch"]))
+            self.assertEqual(tracker.funcdefs, set(["do_install"]))
+
+        self.assertRaises(reftracker.ShellSyntaxError,
+                          reftracker.RefTracker().parse_shell_stream,
+                          ["echo 'foo\n", "bar\n"])
+        self.assertRaises(reftracker.ShellSyntaxError,
+                          reftracker.RefTracker().parse_shell_stream,
+                          ["fi\n", "echo 'foo\n"])
+
+    def test_parse_stream_long_token(self):
+        from pysh import pyshlex, pyshyacc
+
+        # The sublexers resume where they stopped, rather than scanning a
+        # here-document or quoted string again each time a line is read
+        scanned = [0]
+        def counting(parse):
+            def wrapper(self, data, pos=0, eof=False):
+                scanned[0] += len(data) - pos
+                return parse(self, data, pos, eof)
+            return wrapper
+
+        lexers = (pyshlex.WordLexer, pyshlex.HereDocLexer)
+        saved = [lexer.__dict__["parse"] for lexer in lexers]
+        for lexer, parse in zip(lexers, saved):
+            lexer.parse = counting(parse)
+        try:
+            body = ["line %d of ${FOO}\n" % i for i in xrange(4000)]
+            size = len("".join(body))
+            for lines in (["cat <<EOF\n"] + body + ["EOF\n"],
+                          ["cat <<-EOF\n"] + body + ["\tEOF\n"],
+                          ['echo "\n'] + body + ['"\n'],
+                          ["echo '\n"] + body + ["'\n"]):
+                scanned[0] = 0
+                commands = []
+                pyshyacc.parse_stream(lines, commands.append)
+                self.assertEqual(len(commands), 1)
+                self.assertTrue(scanned[0] < 3 * size)
+        finally:
+            for lexer, parse in zip(lexers, saved):
+                lexer.parse = parse
+
+    def test_threads(self):
+        import threading
+
+        results = {}
+        errors = {}
+        def parse(first):
+            for index in xrange(first, first + 50):
+                tracker = reftracker.RefTracker()
+                script = "cmd%d foo; if true; then other%d; fi" % (index, index)
+                results[index] = tracker.parse_shell(script)
+                try:
+                    tracker.parse_shell("fi foo%d bar" % index)
+                except reftracker.ShellSyntaxError, exc:
+                    errors[index] = str(exc)
+
+        # Switch threads as often as possible, to interleave the parses
+        interval = sys.getcheckinterval()
+        sys.setcheckinterval(1)
+        try:
+            threads = [threading.Thread(target=parse, args=(first,))
+                       for first in xrange(0, 400, 50)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setcheckinterval(interval)
+
+        self.assertEqual(len(results), 400)
+        self.assertEqual(len(errors), 400)
+        for index, error in errors.iteritems():
+            self.assertTrue("'foo%d'" % index in error)
+        for index, execs in results.iteritems():
+            self.assertEqual(execs, set(["cmd%d" % index, "other%d" % index,
+                                         "true"]))
+
+    def test_syntax_error_context(self):
+        tracker = reftracker.RefTracker()
+        try:
+            tracker.parse_shell("fi foo bar")
+        except reftracker.ShellSyntaxError, exc:
+            self.assertTrue("followed by" in str(exc))
+            self.assertTrue("foo" in str(exc))
+        else:
+            self.fail("ShellSyntaxError not raised")
+
     def test_rogue_dollarsign(self):
         self.d.setVar("D", "/tmp")
         shstr = "install -d ${D}$"
@@ -150,6 +309,23 @@ class TestBasic(TestRefTracking):
     def test_python_reference(self):
         self.assertReferences("${@bb.data.getVar('BAR', d, True) + 'foo'}", set(["BAR"]))
 
+    def test_analysis(self):
+        self.d.setVar("do_foo", "echo ${BAR}")
+        self.d.setVarFlag("do_foo", "func", True)
+        analysis = reftracker.analyze(bbvalue.bbvalue("do_foo", self.d), self.d)
+        self.assertEqual(analysis.references, set(["BAR"]))
+        self.assertEqual(analysis.execs, set(["echo"]))
+        self.assertEqual(analysis.calls, None)
+        self.assertEqual(analysis.function_references, set())
+        self.assertRaises(AttributeError, setattr, analysis, "execs", set())
+
+    def test_convenience_functions(self):
+        value = bbvalue.bbparse("${@len('${FOO}')}", self.d)
+        self.assertEqual(reftracker.references(value, self.d), set(["FOO"]))
+        self.assertEqual(reftracker.calls(value, self.d), set(["len"]))
+        self.assertEqual(reftracker.function_references(value, self.d),
+                         set([("len", len)]))
+
 
 class TestContentsTracking(TestRefTracking):
     def setUp(self):
@@ -254,6 +430,41 @@ class TestContentsTracking(TestRefTracking):
         self.assertEqual(reftracker.references_from_name("FOO", self.d),
                          set(["oe_libinstall"]))
 
+class TestPersistentCache(TestRefTracking):
+    def setUp(self):
+        super(TestPersistentCache, self).setUp()
+        import tempfile
+        self.tempdir = tempfile.mkdtemp()
+        self.d.setVar("TMPDIR", self.tempdir)
+        self.d.setVar("do_foo", "bar\nbaz\nbar() { :\n}")
+        self.d.setVarFlag("do_foo", "func", True)
+        self.d.setVar("do_pyfoo", "  bb.data.getVar('FOO', d, True)\n  foo()")
+        self.d.setVarFlags("do_pyfoo", {"func": True, "python": True})
+        self.d.setVar("bar", "true")
+        self.d.setVarFlag("bar", "func", True)
+        reftracker.open_cache(self.d)
+
+    def tearDown(self):
+        import shutil
+        reftracker.close_cache()
+        shutil.rmtree(self.tempdir)
+
+    def assertAnalysis(self):
+        shell = bbvalue.bbvalue("do_foo", self.d)
+        python = bbvalue.bbvalue("do_pyfoo", self.d)
+        self.assertExecs(shell, set(["baz", ":"]))
+        self.assertReferences(shell, set())
+        self.assertReferences(python, set(["FOO"]))
+        self.assertCalls(python, set(["foo"]))
+
+    def test_cold_and_warm(self):
+        self.assertAnalysis()
+        self.assertEqual(reftracker.persistent_cache.misses, 2)
+        reftracker.close_cache()
+        reftracker.open_cache(self.d)
+        self.assertAnalysis()
+        self.assertEqual(reftracker.persistent_cache.misses, 0)
+
 class TestPython(TestRefTracking):
     def setUp(self):
         super(TestPython, self).setUp()
@@ -346,6 +557,14 @@ class TestPython(TestRefTracking):
             set([("testget", self.context["testget"])]))
         del self.context["testget"]
 
+    def test_ast_reused(self):
+        pystr = "bb.data.getVar('foo', d, True)"
+        self.assertReferences(pystr, set(["foo"]))
+        code = reftracker.RefTracker.correct_indent(self.indent(pystr))
+        first = reftracker.parse_python(code)
+        self.assertTrue(reftracker.parse_python(code) is first)
+        self.assertReferences(pystr, set(["foo"]))
+
 
 if __name__ == "__main__":
     unittest.main()
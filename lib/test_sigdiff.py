@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+
+import unittest
+import sys
+import os
+
+basedir = os.path.dirname(os.path.abspath(os.path.dirname(__file__)))
+oedir = os.path.dirname(basedir)
+searchpath = [os.path.join(basedir, "lib"),
+              os.path.join(oedir, "openembedded", "lib"),
+              os.path.join(oedir, "bitbake", "lib")]
+sys.path[0:0] = searchpath
+
+from StringIO import StringIO
+import bb.data
+import signature
+import sigdiff
+
+class TestSigDiff(unittest.TestCase):
+    def setUp(self):
+        self.d = bb.data.init()
+        self.d.setVar("CFLAGS", "-O2 ${DEBUG}")
+        self.d.setVar("DEBUG", "-g")
+        self.d.setVar("do_compile", "\n    ${CC} ${CFLAGS}\n    helper\n")
+        self.d.setVarFlags("do_compile", {"func": True, "task": True})
+        self.d.setVar("helper", "true")
+        self.d.setVarFlag("helper", "func", True)
+        self.d.setVar("CC", "gcc")
+
+    def dump(self):
+        output = StringIO()
+        sigdiff.write(signature.Signature(self.d), output)
+        return sigdiff.parse(StringIO(output.getvalue()))
+
+    def test_round_trip(self):
+        sig = signature.Signature(self.d)
+        dump = self.dump()
+        live = sigdiff.from_signature(sig)
+        self.assertEqual(dump.data, live.data)
+        self.assertEqual(dump.refs, live.refs)
+        self.assertEqual(dump.refs["do_compile"],
+                         frozenset(["CC", "CFLAGS", "helper"]))
+
+    def test_entry_like_lines(self):
+        # Lines of a value which look like the start of a variable, or like
+        # the references of another one
+        self.d.setVar("CFLAGS", "-O2 ${DEBUG}\nCC = 'cc'\nCC[refs] = DEBUG")
+        sig = signature.Signature(self.d)
+        dump = self.dump()
+        live = sigdiff.from_signature(sig)
+        self.assertEqual(dump.data, live.data)
+        self.assertEqual(dump.refs, live.refs)
+        self.assertEqual(dump.refs["CC"], frozenset())
+
+    def test_old_format(self):
+        lines = ["do_foo = Compound([Literal('echo '), "
+                 "VariableRef([Literal('FOO')])])\n",
+                 "FOO = Compound([Literal('multi\n",
+                 "BAR = line')])\n"]
+        dump = sigdiff.parse(lines)
+        self.assertEqual(sorted(dump.data), ["FOO", "do_foo"])
+        self.assertEqual(dump.data["FOO"],
+                         "Compound([Literal('multi\nBAR = line')])")
+        self.assertEqual(dump.refs["do_foo"], frozenset(["FOO"]))
+
+    def test_changes(self):
+        old = self.dump()
+        self.d.setVar("DEBUG", "-g3")
+        self.d.setVar("helper", "true; other")
+        self.d.setVar("other", "false")
+        self.d.setVarFlag("other", "func", True)
+        self.d.delVar("CC")
+        new = self.dump()
+        changes = sigdiff.diff(old, new)
+        self.assertEqual(changes, [
+            sigdiff.Change("CC", "removed", ("do_compile", "CC")),
+            sigdiff.Change("helper", "changed", ("do_compile", "helper")),
+            sigdiff.Change("DEBUG", "changed",
+                           ("do_compile", "CFLAGS", "DEBUG")),
+            sigdiff.Change("other", "added",
+                           ("do_compile", "helper", "other")),
+        ])
+
+    def test_unchanged(self):
+        self.assertEqual(sigdiff.diff(self.dump(), self.dump()), [])
+
+    def test_linear(self):
+        visited = []
+        class Refs(dict):
+            def get(self, key, default=None):
+                visited.append(key)
+                return dict.get(self, key, default)
+
+        def chain(length, last):
+            data = {}
+            refs = Refs()
+            for index in xrange(length):
+                data["V%d" % index] = "value"
+                refs["V%d" % index] = frozenset(["V%d" % (index + 1)])
+            data["V%d" % length] = last
+            refs["V%d" % length] = frozenset()
+            return sigdiff.SignatureDump(data, refs)
+
+        changes = sigdiff.diff(chain(50000, "old"), chain(50000, "new"))
+        self.assertEqual(len(changes), 1)
+        self.assertEqual(len(changes[0].path), 50001)
+        # Each variable is visited once in each of the dumps
+        self.assertEqual(len(visited), 2 * 50001)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -15,6 +15,34 @@ import bb.data
 import bbvalue
 import signature
 
+class TestStableRepr(unittest.TestCase):
+    def test_containers(self):
+        value = {"b": set(["y", "x"]), "a": [1, (2,), frozenset([3])]}
+        self.assertEqual(signature.stable_repr(value),
+                         "{'a': [1, (2), frozenset([3])], 'b': set(['x', 'y'])}")
+
+    def test_values(self):
+        d = bb.data.init()
+        d.setVar("FOO", "foo ${BAR} ${@'baz'}")
+        value = bbvalue.bbvalue("FOO", d)
+        self.assertEqual(signature.stable_repr(value),
+                         "Compound([Literal('foo '), VariableRef([Literal('BAR')]), Literal(' '), PythonValue([Literal(''baz'')])])")
+
+    def test_streamed(self):
+        import hashlib
+
+        d = bb.data.init()
+        d.setVar("FOO", "foo ${BAR}")
+        value = {"FOO": bbvalue.bbvalue("FOO", d), "BAR": ("bar", None)}
+        pieces = []
+        digest = hashlib.md5()
+        signature.write_repr(value, pieces.append)
+        signature.write_repr(value, digest.update)
+        self.assertTrue(len(pieces) > 1)
+        self.assertEqual("".join(pieces), signature.stable_repr(value))
+        self.assertEqual(digest.digest(),
+                         hashlib.md5(signature.stable_repr(value)).digest())
+
 class TestSignatureGeneration(unittest.TestCase):
     def setUp(self):
         self.d = bb.data.init()
@@ -36,6 +64,19 @@ class TestSignatureGeneration(unittest.TestCase):
         sig = signature.Signature(self.d, keys=["testbl"])
         self.assertEqual(sig.data_string, "{'testbl': Compound([Literal('5'), Literal(' foo '), VariableRef([Literal('blacklistedvar')]), Literal(' bar')])}")
 
+    def test_blacklist_globs(self):
+        sig = signature.Signature(self.d, keys=["none"],
+                                  blacklist=["*DIR", "PATH", "FOO_?", "[AB]Z"])
+        self.assertTrue(sig.is_blacklisted("WORKDIR"))
+        self.assertTrue(sig.is_blacklisted("PATH"))
+        self.assertTrue(sig.is_blacklisted("FOO_x"))
+        self.assertTrue(sig.is_blacklisted("BZ"))
+        self.assertFalse(sig.is_blacklisted("WORKDIR_foo"))
+        self.assertFalse(sig.is_blacklisted("PATHS"))
+        self.assertFalse(sig.is_blacklisted("FOO_xy"))
+        self.assertFalse(sig.is_blacklisted("CZ"))
+        self.assertEqual(sig.is_blacklisted("PATH"), "${PATH}")
+
     def test_signature_only_blacklisted(self):
         self.d["anotherval"] = "${blacklistedvar}"
         sig = signature.Signature(self.d, keys=["anotherval"])
@@ -74,7 +115,7 @@ class TestSignatureGeneration(unittest.TestCase):
         self.d.setVar("TERMCMD", "${GNOME_TERMCMD}")
         sig = signature.Signature(self.d, keys=["do_devshell"])
         self.assertEquals(sig.md5.digest(),
-                          'x\xa3\xa6-\x11H:#\x1c\xe9\x82\xc2q\x19\xab\x9f')
+                          '\x9f\x06\xf7\x91\x913\x13\xa7\xc1\xab\xf9 \x83{\xf7\xbe')
 
     def test_reference_to_reference(self):
         self.d.setVar("FOO", "-${BAR}-")
@@ -101,6 +142,371 @@ class TestSignatureGeneration(unittest.TestCase):
         self.assertEquals(set(sig.data), set(["alpha", "foo5"]))
 
 
+class TestIncremental(unittest.TestCase):
+    def setUp(self):
+        self.d = bb.data.init()
+        self.d.setVar("FOO", "-${BAR}- ${ALPHA}")
+        self.d.setVar("BAR", "+${BAZ}+")
+        self.d.setVar("BAZ", "alpha")
+        self.d.setVar("ALPHA", "${@'${BAZ}'.upper()}")
+        self.d.setVar("do_foo", "echo ${FOO}; bar")
+        self.d.setVarFlags("do_foo", {"func": True, "task": True})
+
+    def assertUpdated(self, sig, changed):
+        computed = []
+        entry = sig._entry
+        def _entry(key):
+            computed.append(key)
+            return entry(key)
+        sig._entry = _entry
+        sig.update(changed)
+        fresh = signature.Signature(self.d)
+        self.assertEqual(sig.data_string, fresh.data_string)
+        self.assertEqual(sig.md5.digest(), fresh.md5.digest())
+        return set(computed)
+
+    def test_leaf_change(self):
+        sig = signature.Signature(self.d)
+        self.d.setVar("BAZ", "beta")
+        computed = self.assertUpdated(sig, ["BAZ"])
+        # FOO and BAR only reference others, so their data is unchanged
+        self.assertEqual(computed, set(["BAZ", "ALPHA", "do_foo"]))
+
+    def test_python_change(self):
+        sig = signature.Signature(self.d)
+        data = sig.data_string
+        self.d.setVar("BAZ", "beta")
+        self.assertUpdated(sig, ["BAZ"])
+        self.assertNotEqual(sig.data_string, data)
+
+    def test_python_reads_unreferenced(self):
+        # Nothing references A, it is only read by expanding what the python
+        # gets
+        self.d.setVar("D", "${A}")
+        self.d.setVar("A", "a")
+        self.d.setVar("do_bar", "echo ${@d.getVar('D', True)}")
+        self.d.setVarFlags("do_bar", {"func": True, "task": True})
+        sig = signature.Signature(self.d)
+        self.d.setVar("A", "b")
+        self.assertUpdated(sig, ["A"])
+
+    def test_new_reference(self):
+        sig = signature.Signature(self.d)
+        self.d.setVar("BAR", "+${QUX}+")
+        self.d.setVar("QUX", "qux")
+        self.assertUpdated(sig, ["BAR", "QUX"])
+        self.assertTrue("QUX" in sig.data)
+        self.assertFalse("BAZ" in sig.data)
+
+    def test_new_shell_function(self):
+        sig = signature.Signature(self.d)
+        self.d.setVar("bar", "true")
+        self.d.setVarFlag("bar", "func", True)
+        self.assertUpdated(sig, ["bar"])
+        self.assertTrue("bar" in sig.data)
+
+    def test_blacklist_change(self):
+        sig = signature.Signature(self.d)
+        self.d.setVar("BB_HASH_BLACKLIST", "BA*")
+        self.assertUpdated(sig, ["BB_HASH_BLACKLIST"])
+        self.assertFalse("BAR" in sig.data)
+
+class TestTaskSignatures(unittest.TestCase):
+    def setUp(self):
+        self.d = bb.data.init()
+        self.d.setVar("SHARED", "shared ${SHAREDDEP}")
+        self.d.setVar("SHAREDDEP", "dep")
+        self.d.setVar("ONLYA", "a")
+        self.d.setVar("do_a", "echo ${SHARED} ${ONLYA}")
+        self.d.setVarFlags("do_a", {"func": True, "task": True})
+        self.d.setVar("do_b", "echo ${SHARED}")
+        self.d.setVarFlags("do_b", {"func": True, "task": True})
+
+    def test_closure(self):
+        sig = signature.Signature(self.d)
+        self.assertEqual(sig.closure("do_a"),
+                         set(["do_a", "SHARED", "SHAREDDEP", "ONLYA"]))
+        self.assertEqual(sig.closure("do_b"),
+                         set(["do_b", "SHARED", "SHAREDDEP"]))
+        self.assertRaises(KeyError, sig.closure, "do_c")
+
+    def test_independent(self):
+        before = signature.task_signatures(self.d)
+        self.assertEqual(set(before), set(["do_a", "do_b"]))
+        self.d.setVar("ONLYA", "changed")
+        after = signature.task_signatures(self.d)
+        self.assertNotEqual(before["do_a"], after["do_a"])
+        self.assertEqual(before["do_b"], after["do_b"])
+
+        self.d.setVar("SHAREDDEP", "changed")
+        final = signature.task_signatures(self.d)
+        self.assertNotEqual(after["do_a"], final["do_a"])
+        self.assertNotEqual(after["do_b"], final["do_b"])
+
+    def test_matches_single_task(self):
+        sig = signature.Signature(self.d)
+        single = signature.Signature(self.d, keys=["do_b"])
+        self.assertEqual(sig.signatures(["do_b"]), single.signatures())
+
+    def test_digest_without_repr(self):
+        sig = signature.Signature(self.d)
+        sig.md5
+        self.assertEqual(sig._data_string, None)
+        sig.data_string
+        self.assertNotEqual(sig._data_string, None)
+
+    def test_shared_digests(self):
+        sig = signature.Signature(self.d)
+        sig.signatures()
+        self.assertTrue("SHAREDDEP" in sig._digests)
+        self.d.setVar("ONLYA", "changed")
+        sig.update(["ONLYA"])
+        self.assertEqual(sig.md5.digest(),
+                         signature.Signature(self.d).md5.digest())
+
+    def test_cycle(self):
+        self.d.setVar("ping", "pong")
+        self.d.setVarFlag("ping", "func", True)
+        self.d.setVar("pong", "ping")
+        self.d.setVarFlag("pong", "func", True)
+        self.d.setVar("do_b", "ping")
+        sig = signature.Signature(self.d)
+        digests = sig.signatures(["do_b", "ping", "pong"])
+        self.assertNotEqual(digests["ping"], digests["pong"])
+
+        self.d.setVar("pong", "ping; true")
+        sig.update(["pong"])
+        updated = sig.signatures(["do_b", "ping", "pong"])
+        for key in digests:
+            self.assertNotEqual(digests[key], updated[key])
+        self.assertEqual(updated, signature.Signature(self.d).signatures(
+                                      ["do_b", "ping", "pong"]))
+
+class TestHashAlgorithms(unittest.TestCase):
+    def setUp(self):
+        self.d = bb.data.init()
+        self.d.setVar("FOO", "foo ${BAR}")
+        self.d.setVar("BAR", "bar")
+
+    def test_default(self):
+        sig = signature.Signature(self.d, keys=["FOO"])
+        self.assertEqual(sig.algorithm, "md5")
+        self.assertEqual(len(sig.digest.digest()), 16)
+
+    def test_variable(self):
+        self.d.setVar("BB_HASH_ALGORITHM", "sha256")
+        sig = signature.Signature(self.d, keys=["FOO"])
+        self.assertEqual(sig.algorithm, "sha256")
+        self.assertEqual(len(sig.digest.digest()), 32)
+        self.assertEqual(len(sig.signatures()["FOO"]), 64)
+
+    def test_explicit(self):
+        self.d.setVar("BB_HASH_ALGORITHM", "sha256")
+        sig = signature.Signature(self.d, keys=["FOO"], algorithm="crc32")
+        self.assertEqual(len(sig.digest.digest()), 4)
+        self.assertNotEqual(str(sig), "")
+
+    def test_unknown(self):
+        self.assertRaises(ValueError, signature.Signature, self.d,
+                          keys=["FOO"], algorithm="rot13")
+
+    def test_crc32(self):
+        import zlib
+
+        crc = signature.CRC32("foo")
+        copy = crc.copy()
+        crc.update("bar")
+        self.assertEqual(crc.hexdigest(), "%08x" % (zlib.crc32("foobar") & 0xffffffff))
+        self.assertEqual(copy.hexdigest(), "%08x" % (zlib.crc32("foo") & 0xffffffff))
+
+    def test_update(self):
+        sig = signature.Signature(self.d, keys=["FOO"])
+        self.d.setVar("BB_HASH_ALGORITHM", "sha1")
+        sig.update(["BB_HASH_ALGORITHM"])
+        fresh = signature.Signature(self.d, keys=["FOO"])
+        self.assertEqual(sig.digest.digest(), fresh.digest.digest())
+        self.assertEqual(len(sig.digest.digest()), 20)
+
+class TestSignMany(unittest.TestCase):
+    def datastore(self, value):
+        d = bb.data.init()
+        d.setVar("FOO", value)
+        d.setVar("do_foo", "echo ${FOO}")
+        d.setVarFlags("do_foo", {"func": True, "task": True})
+        d.setVar("__RECIPEDATA", d)
+        return d
+
+    def test_raw_metadata(self):
+        d = self.datastore("foo")
+        values, flags = signature.raw_metadata(d)
+        self.assertFalse("__RECIPEDATA" in values)
+        self.assertEqual(values["FOO"], "foo")
+        self.assertEqual(flags["do_foo"], {"func": True, "task": True})
+        copy = signature.from_raw_metadata(values, flags)
+        self.assertEqual(str(signature.Signature(copy)),
+                         str(signature.Signature(d)))
+
+    def test_in_order(self):
+        datastores = [self.datastore(value) for value in ("a", "b", "c", "a")]
+        expected = [str(signature.Signature(d)) for d in datastores]
+        self.assertEqual(signature.sign_many(datastores, workers=1), expected)
+        self.assertEqual(signature.sign_many(datastores, workers=2), expected)
+        self.assertEqual(expected[0], expected[3])
+        self.assertNotEqual(expected[0], expected[1])
+
+    def test_closure(self):
+        d = self.datastore("${BAR_${PN}}")
+        d.setVar("PN", "foo")
+        d.setVar("BAR_foo", "bar")
+        d.setVar("PATH", "/bin")
+        d.setVarFlag("PATH", "export", True)
+        d.setVar("UNUSED", "${FOO}")
+        values, flags = signature.raw_closure(signature.raw_metadata(d),
+                                              ["do_foo"])
+        self.assertEqual(sorted(values),
+                         ["BAR_foo", "FOO", "PATH", "PN", "do_foo"])
+        self.assertEqual(flags["do_foo"], {"func": True, "task": True})
+
+    def test_missed(self):
+        # The name of BAR is computed, so it is not in the closure, and the
+        # datastore is signed again with all of its variables
+        d = self.datastore("${@d.getVar('B' + 'AR', True)}")
+        d.setVar("BAR", "bar")
+        raw = signature.raw_metadata(d)
+        job = (signature.raw_closure(raw, ["do_foo"]), ["do_foo"], None, None)
+        self.assertTrue("BAR" in signature._sign_raw(job)[1])
+        self.assertEqual(signature.sign_many([d, d], workers=2),
+                         [str(signature.Signature(d))] * 2)
+
+    def test_glob_varrefs(self):
+        # Nothing names FOO_bar but the glob
+        datastores = []
+        for value in ("a", "b"):
+            d = self.datastore("true")
+            d.setVarFlag("do_foo", "varrefs", "FOO_* ${PN}_*")
+            d.setVar("FOO_bar", value)
+            datastores.append(d)
+        values, flags = signature.raw_closure(
+                            signature.raw_metadata(datastores[0]), ["do_foo"])
+        self.assertTrue("FOO_bar" in values)
+        signatures = signature.sign_many(datastores, workers=2)
+        self.assertEqual(signatures, signature.sign_many(datastores, workers=1))
+        self.assertNotEqual(signatures[0], signatures[1])
+
+    def test_no_pool(self):
+        import multiprocessing
+
+        def Pool(workers):
+            raise OSError("no /dev/shm")
+
+        datastores = [self.datastore(value) for value in ("a", "b")]
+        orig = multiprocessing.Pool
+        multiprocessing.Pool = Pool
+        try:
+            self.assertEqual(signature.sign_many(datastores, workers=2),
+                             [str(signature.Signature(d)) for d in datastores])
+        finally:
+            multiprocessing.Pool = orig
+
+class TestSignatureCache(unittest.TestCase):
+    def setUp(self):
+        import tempfile
+
+        self.tempdir = tempfile.mkdtemp()
+        self.d = bb.data.init()
+        self.d.setVar("BB_SIGNATURE_CACHE",
+                      os.path.join(self.tempdir, "signatures.sqlite"))
+        self.d.setVar("FOO", "foo ${BAR}")
+        self.d.setVar("BAR", "bar")
+        self.d.setVar("do_foo", "echo ${FOO}")
+        self.d.setVarFlags("do_foo", {"func": True, "task": True})
+        self.d.setVar("DAY", "today")
+        self.d.setVar("DATE", "${@d.getVar('DAY', True).title()}")
+        self.d.setVar("do_date", "echo ${DATE}")
+        self.d.setVarFlags("do_date", {"func": True, "task": True})
+        signature.open_cache(self.d)
+
+    def tearDown(self):
+        import shutil
+
+        signature.close_cache()
+        shutil.rmtree(self.tempdir)
+
+    def analyzed(self):
+        """Return the keys analyzed by cached_signatures, along with its
+        result, which is checked against a fresh signature.
+        """
+
+        analyzed = []
+        orig = signature.Signature
+        def Signature(metadata, keys, *args):
+            analyzed.extend(keys)
+            return orig(metadata, keys, *args)
+
+        signature.Signature = Signature
+        try:
+            digests = signature.cached_signatures(self.d)
+        finally:
+            signature.Signature = orig
+        self.assertEqual(digests, signature.task_signatures(self.d))
+        return set(analyzed)
+
+    def test_cached(self):
+        self.assertEqual(self.analyzed(), set(["do_foo", "do_date"]))
+        # Inline python may give a different result each time
+        self.assertEqual(self.analyzed(), set(["do_date"]))
+
+    def test_persists(self):
+        self.analyzed()
+        signature.close_cache()
+        signature.open_cache(self.d)
+        self.assertEqual(self.analyzed(), set(["do_date"]))
+
+    def test_input_changed(self):
+        self.analyzed()
+        self.d.setVar("BAR", "baz")
+        self.assertEqual(self.analyzed(), set(["do_foo", "do_date"]))
+        self.d.setVar("BAR", "bar")
+        self.assertEqual(self.analyzed(), set(["do_date"]))
+
+    def test_inline_python(self):
+        # Python reads variables through helpers, and expands what it gets,
+        # so its result is not cached
+        self.d.setVar("DISTRO_FEATURES", "x11")
+        self.d.setVar("do_foo", "${@bb.utils.contains('DISTRO_FEATURES', "
+                                "'x11', 'x', 'y', d)}")
+        self.d.setVar("A", "a")
+        self.d.setVar("D", "${A}")
+        self.d.setVar("DAY", "${@d.getVar('D', True)}")
+        self.assertEqual(self.analyzed(), set(["do_foo", "do_date"]))
+        self.d.setVar("DISTRO_FEATURES", "wayland")
+        self.d.setVar("A", "b")
+        self.assertEqual(self.analyzed(), set(["do_foo", "do_date"]))
+
+    def test_flag_changed(self):
+        self.analyzed()
+        self.d.setVarFlag("FOO", "varrefs", "BAR")
+        self.assertEqual(self.analyzed(), set(["do_foo", "do_date"]))
+
+    def test_new_reference(self):
+        self.d.setVar("FOO", "foo ${BAR} ${NEW}")
+        self.analyzed()
+        self.d.setVar("NEW", "new")
+        self.assertEqual(self.analyzed(), set(["do_foo", "do_date"]))
+
+    def test_new_export(self):
+        self.analyzed()
+        self.d.setVar("EXPORTED", "value")
+        self.d.setVarFlag("EXPORTED", "export", True)
+        self.assertEqual(self.analyzed(), set(["do_foo", "do_date"]))
+
+    def test_cached_signature(self):
+        self.d.delVar("do_date")
+        self.assertEqual(signature.cached_signature(self.d),
+                         str(signature.Signature(self.d)))
+        self.assertEqual(signature.cached_signature(self.d),
+                         str(signature.Signature(self.d)))
+
 class TestOEData(unittest.TestCase):
     import pickle
 
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+
+import unittest
+import sys
+import os
+
+basedir = os.path.dirname(os.path.abspath(os.path.dirname(__file__)))
+oedir = os.path.dirname(basedir)
+searchpath = [os.path.join(basedir, "lib"),
+              os.path.join(oedir, "openembedded", "lib"),
+              os.path.join(oedir, "bitbake", "lib")]
+sys.path[0:0] = searchpath
+
+import gc
+import weakref
+import bb.data
+import varindex
+
+class TestFlagIndex(unittest.TestCase):
+    def setUp(self):
+        self.d = bb.data.init()
+        self.d.setVar("PATH", "/bin")
+        self.d.setVarFlag("PATH", "export", True)
+        self.d.setVar("do_shell", "true")
+        self.d.setVarFlag("do_shell", "func", True)
+        self.d.setVar("do_python", "pass")
+        self.d.setVarFlags("do_python", {"func": True, "python": True})
+
+    def test_built(self):
+        index = varindex.get(self.d)
+        self.assertEqual(index.exports, set(["PATH"]))
+        self.assertEqual(index.shell_functions, set(["do_shell"]))
+        self.assertTrue(varindex.get(self.d) is index)
+
+    def test_set_flag(self):
+        index = varindex.get(self.d)
+        self.d.setVarFlag("CC", "export", True)
+        self.d.setVarFlag("do_other", "func", True)
+        self.assertEqual(index.exports, set(["PATH", "CC"]))
+        self.assertEqual(index.shell_functions, set(["do_shell", "do_other"]))
+
+    def test_set_flags(self):
+        index = varindex.get(self.d)
+        self.d.setVarFlags("do_shell", {"python": True})
+        self.assertEqual(index.shell_functions, set())
+
+    def test_delete(self):
+        index = varindex.get(self.d)
+        self.d.delVarFlag("PATH", "export")
+        self.d.delVar("do_shell")
+        self.assertEqual(index.exports, set())
+        self.assertEqual(index.shell_functions, set())
+
+    def test_collected(self):
+        varindex.get(self.d)
+        count = len(varindex._indexes)
+        del self.d
+        gc.collect()
+        self.assertEqual(len(varindex._indexes), count - 1)
+
+    def test_no_cycle(self):
+        varindex.get(self.d)
+        ref = weakref.ref(self.d)
+        gc.disable()
+        try:
+            del self.d
+            self.assertEqual(ref(), None)
+        finally:
+            gc.enable()
+
+class TestGlobIndex(unittest.TestCase):
+    def setUp(self):
+        self.d = bb.data.init()
+        for var in ("FOO", "FOO_bar", "FOO_baz", "FOOD", "BAR_foo", "oe_foo"):
+            self.d.setVar(var, "value")
+
+    def assertMatches(self, patterns):
+        from fnmatch import fnmatchcase
+        expected = set(key for key in self.d.keys()
+                       if any(fnmatchcase(key, pat) for pat in patterns))
+        self.assertEqual(varindex.get(self.d).match(patterns), expected)
+
+    def test_plain(self):
+        self.assertMatches(["FOO", "MISSING"])
+
+    def test_prefix(self):
+        self.assertMatches(["FOO_*"])
+        self.assertMatches(["FOO*"])
+
+    def test_other(self):
+        self.assertMatches(["*_foo", "FOO_ba?", "[BF]*"])
+
+    def test_added(self):
+        self.assertMatches(["FOO_*", "*_foo", "NEW"])
+        self.d.setVar("FOO_new", "value")
+        self.d.setVarFlag("NEW", "varrefs", "")
+        self.d.setVar("oe_bar_foo", "value")
+        self.assertMatches(["FOO_*", "*_foo", "NEW"])
+
+    def test_removed(self):
+        self.assertMatches(["FOO_*", "*_foo"])
+        self.d.delVar("FOO_bar")
+        self.d.delVar("BAR_foo")
+        self.assertMatches(["FOO_*", "*_foo"])
+
+if __name__ == "__main__":
+    unittest.main()
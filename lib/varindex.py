@@ -0,0 +1,200 @@
+"""Indexes of the variables in a metadata instance, answering the questions
+   the reference tracking asks of the whole datastore without scanning every
+   variable each time.
+
+   An index is built once per metadata instance, on first use, and is kept up
+   to date by hooking the instance's methods which add and remove variables
+   and alter their flags.  Changes made behind the back of those methods, for
+   example to a datastore which a copy-on-write child was created from, are
+   not seen by the child's index; call refresh() after such changes."""
+
+import re
+import weakref
+from bisect import bisect_left, insort
+from fnmatch import translate
+
+_indexes = weakref.WeakKeyDictionary()
+
+def get(metadata):
+    """Return the VariableIndex for metadata, building it if necessary"""
+
+    try:
+        return _indexes[metadata]
+    except KeyError:
+        index = VariableIndex(metadata)
+        index.hook(metadata)
+        _indexes[metadata] = index
+        return index
+
+_magic = re.compile(r"[*?[]")
+
+class VariableIndex(object):
+    """The variable names, exported variables and shell functions of a
+    metadata instance, along with the names matching the glob patterns which
+    have been looked up.  The index holds no reference to the metadata
+    itself.
+    """
+
+    # The flags which determine membership of the index
+    flags = ("export", "func", "python")
+
+    def __init__(self, metadata):
+        self.keys = set()
+        self.exports = set()
+        self.shell_functions = set()
+        self.refresh(metadata)
+
+    def refresh(self, metadata):
+        """Rebuild the index from scratch"""
+
+        self.keys.clear()
+        self.exports.clear()
+        self.shell_functions.clear()
+        self._sorted = None
+        self._patterns = {}
+        for var in metadata.keys():
+            self.update(var, metadata.getVarFlags(var))
+
+    def add(self, var):
+        """Add a variable name to the index"""
+
+        if var in self.keys:
+            return
+
+        self.keys.add(var)
+        if self._sorted is not None:
+            insort(self._sorted, var)
+        for matcher, matches in self._patterns.itervalues():
+            if matcher(var):
+                matches.add(var)
+
+    def update(self, var, flags):
+        """Update the index for a variable whose flags are now flags"""
+
+        self.add(var)
+        if flags and "export" in flags:
+            self.exports.add(var)
+        else:
+            self.exports.discard(var)
+
+        if flags and "func" in flags and "python" not in flags:
+            self.shell_functions.add(var)
+        else:
+            self.shell_functions.discard(var)
+
+    def remove(self, var):
+        """Drop a deleted variable from the index"""
+
+        if var not in self.keys:
+            return
+
+        self.keys.discard(var)
+        self.exports.discard(var)
+        self.shell_functions.discard(var)
+        if self._sorted is not None:
+            del self._sorted[bisect_left(self._sorted, var)]
+        for _, matches in self._patterns.itervalues():
+            matches.discard(var)
+
+    def match(self, patterns):
+        """Return the set of variable names which match any of the supplied
+        glob patterns, as fnmatchcase does.
+        """
+
+        matched = set()
+        for pattern in patterns:
+            if pattern not in self._patterns:
+                self._patterns[pattern] = self._match(pattern)
+            matched.update(self._patterns[pattern][1])
+        return matched
+
+    def _match(self, pattern):
+        """Return a function which determines whether a name matches pattern,
+        and the set of names in the index which currently do.  Plain names
+        and simple prefix patterns, like FOO_*, are looked up without
+        examining every name.
+        """
+
+        if not _magic.search(pattern):
+            matcher = pattern.__eq__
+            if pattern in self.keys:
+                return matcher, set([pattern])
+            return matcher, set()
+
+        prefix = pattern[:-1]
+        if pattern.endswith("*") and not _magic.search(prefix):
+            if self._sorted is None:
+                self._sorted = sorted(self.keys)
+            matches = set()
+            for key in self._sorted[bisect_left(self._sorted, prefix):]:
+                if not key.startswith(prefix):
+                    break
+                matches.add(key)
+            return (lambda key: key.startswith(prefix)), matches
+
+        matcher = re.compile(translate(pattern)).match
+        return matcher, set(key for key in self.keys if matcher(key))
+
+    def hook(self, metadata):
+        """Wrap the methods of this metadata instance which add and remove
+        variables, or alter their flags, to keep the index current.  The
+        wrappers, which are stored on the metadata, only hold a weak reference
+        to it, so it is not kept in a reference cycle, and is freed as soon as
+        it is no longer used.
+        """
+
+        index = self
+        metadata_ref = weakref.ref(metadata)
+
+        def wrap(name, after):
+            orig = getattr(metadata, name, None)
+            if orig is None:
+                return
+
+            if getattr(orig, "im_self", None) is metadata:
+                # The bound method refers to the metadata, so the function
+                # is called instead
+                func = orig.im_func
+                def call(*args, **kwargs):
+                    return func(metadata_ref(), *args, **kwargs)
+            else:
+                call = orig
+
+            def wrapper(*args, **kwargs):
+                ret = call(*args, **kwargs)
+                after(*args, **kwargs)
+                return ret
+            wrapper.__name__ = name
+            wrapper.__doc__ = orig.__doc__
+            setattr(metadata, name, wrapper)
+
+        def flag_changed(var, flag, *args, **kwargs):
+            if flag in index.flags:
+                index.update(var, metadata_ref().getVarFlags(var))
+            else:
+                index.add(var)
+
+        def flags_changed(var, *args, **kwargs):
+            index.update(var, metadata_ref().getVarFlags(var))
+
+        def renamed(key, newkey, *args, **kwargs):
+            index.remove(key)
+            index.update(newkey, metadata_ref().getVarFlags(newkey))
+
+        def deleted(var, *args, **kwargs):
+            metadata = metadata_ref()
+            if metadata.getVar(var, False) is None and \
+               not metadata.getVarFlags(var):
+                index.remove(var)
+            else:
+                index.update(var, metadata.getVarFlags(var))
+
+        def added(var, *args, **kwargs):
+            index.add(var)
+
+        wrap("setVar", added)
+        wrap("setVarFlag", flag_changed)
+        wrap("delVarFlag", flag_changed)
+        wrap("setVarFlags", flags_changed)
+        wrap("delVar", deleted)
+        wrap("renameVar", renamed)
@@ -0,0 +1,183 @@
+#!/usr/bin/env python
+"""Compare bbparse against the original re.split and recursive descent
+   parser, which is kept here unchanged as the reference implementation.
+   Both are checked for identical ASTs on the corpus, and on a number of
+   randomly generated strings, before they're timed, with and without the
+   skeleton cache."""
+
+import sys
+import os
+import random
+import re
+import timeit
+from optparse import OptionParser
+
+basedir = os.path.dirname(os.path.abspath(os.path.dirname(__file__)))
+oedir = os.path.dirname(basedir)
+searchpath = [os.path.join(basedir, "lib"),
+              os.path.join(oedir, "openembedded", "lib"),
+              os.path.join(oedir, "bitbake", "lib")]
+sys.path[0:0] = searchpath
+
+import bbvalue
+
+# Variable values as they appear in OpenEmbedded recipes, classes and
+# configuration files.
+corpus = [
+    "${D}${bindir}",
+    "${D}${libdir}/pkgconfig/*.pc",
+    "${exec_prefix}/lib",
+    "${base_prefix}/usr",
+    "${TARGET_SYS}-",
+    "${STAGING_DIR}/${BASEPKG_HOST_SYS}",
+    "${MULTIMACH_ARCH}${TARGET_VENDOR}-${TARGET_OS}",
+    "${TMPDIR}/work/${MULTIMACH_TARGET_SYS}/${PF}",
+    "${WORKDIR}/${BPN}-${PV}",
+    "${PN}-dbg ${PN} ${PN}-doc ${PN}-dev ${PN}-static ${PN}-locale",
+    "${bindir}/* ${sbindir}/* ${libexecdir}/* ${libdir}/lib*${SOLIBS} "
+    "${sysconfdir} ${sharedstatedir} ${localstatedir} "
+    "${base_bindir}/* ${base_sbindir}/* ${base_libdir}/*${SOLIBS} "
+    "${datadir}/${BPN} ${libdir}/${BPN}/* ${datadir}/pixmaps "
+    "${datadir}/applications ${datadir}/idl ${datadir}/omf "
+    "${datadir}/sounds ${libdir}/bonobo/servers",
+    "local:${MACHINE}:${DISTRO}:${TARGET_OS}:${TARGET_ARCH}:"
+    "build-${BUILD_OS}:fail-fast:pn-${PN}",
+    "${@'${FILE_DIRNAME}/${PF}:${FILE_DIRNAME}/${P}:${FILE_DIRNAME}/${PN}:"
+    "${FILE_DIRNAME}/files:${FILE_DIRNAME}'}",
+    "http://ftp.gnu.org/gnu/${BPN}/${BPN}-${PV}.tar.bz2",
+    "${SOURCEFORGE_MIRROR}/${BPN}/${BPN}-${PV}.tar.gz "
+    "file://configure.patch file://makefile-fixes.patch",
+    "${@base_contains('DISTRO_FEATURES', 'x11', 'virtual/libx11', '', d)}",
+    "${@base_conditional('SITEINFO_ENDIANESS', 'le', '-DLITTLE', '-DBIG', d)}",
+    "${@bb.data.getVar('PN', d, 1).replace('-native', '')}",
+    "${@['', 'gettext-native virtual/gettext'][bb.data.getVar('USE_NLS', "
+    "d, 1) == 'yes']}",
+    "-isystem${STAGING_INCDIR_NATIVE} -L${STAGING_LIBDIR_NATIVE} "
+    "-Wl,-rpath-link,${STAGING_LIBDIR_NATIVE} -Wl,-O1",
+    "${TARGET_LINK_HASH_STYLE} ${@base_contains('DISTRO_FEATURES', "
+    "'largefile', '', '-Wl,--no-as-needed', d)}",
+    "${FULL_OPTIMIZATION}",
+    "-fexpensive-optimizations -fomit-frame-pointer -frename-registers -O2",
+    "\n\tinstall -d ${D}${sysconfdir}/init.d\n"
+    "\tinstall -m 0755 ${WORKDIR}/init ${D}${sysconfdir}/init.d/${BPN}\n"
+    "\tsed -i -e 's:IP{:I${:g' ${D}${libdir}/pkgconfig/*.pc\n"
+    "\tif [ \"${@base_contains('DISTRO_FEATURES', 'pam', 'pam', '', d)}\" ]; "
+    "then\n\t\tinstall -m 0644 ${WORKDIR}/pam ${D}${sysconfdir}/pam.d/${BPN}\n"
+    "\tfi\n\tfor f in ${D}${bindir}/*; do\n\t\t${STRIP} $f || true\n\tdone\n",
+    "\n\toe_runmake 'DESTDIR=${D}' install\n"
+    "\trm -f ${D}${libdir}/*.la\n"
+    "\tmv ${D}${bindir}/${BPN} ${D}${bindir}/${BPN}.${PN}\n",
+    "\n    import bb\n    pn = bb.data.getVar('PN', d, 1)\n"
+    "    if bb.data.inherits_class('native', d):\n"
+    "        bb.data.setVar('PACKAGES', '', d)\n",
+    "${@bb.utils.contains('MACHINE_FEATURES', 'alsa', 'alsa-utils', '', d)} "
+    "${@bb.utils.contains('MACHINE_FEATURES', 'usbhost', 'usbutils', '', d)}",
+    "${${VIRTUAL-RUNTIME_init_manager}_RDEPENDS}",
+    "${PREFERRED_PROVIDER_virtual/${TARGET_PREFIX}gcc}",
+    "${@${BB_NUMBER_THREADS} * 2}",
+    "echo ${",
+    "}${",
+    "${unterminated ${FOO}",
+    "DATE = ${@time.strftime('%Y%m%d',time.gmtime())}",
+]
+
+def legacy_bbparse(str, metadata):
+    """The original bbparse: a re.split tokenizer and a recursive _parse
+       building the AST directly, unchanged apart from its name."""
+
+    from bbvalue import Compound, Literal, PythonValue, VariableRef
+
+    class Tokenizer(object):
+        variable_ref = re.compile(r"(\$\{@|\$\{|\})")
+
+        def __init__(self, str):
+            self.tokens = [var for var in Tokenizer.variable_ref.split(str)
+                           if var]
+            self.i = 0
+
+        def next(self):
+            self.i += 1
+            return self
+
+        @property
+        def current(self):
+            if self.i < len(self.tokens):
+                return self.tokens[self.i]
+            else:
+                return None
+
+    def _parse(toker, parent):
+        clsmap = { '${': VariableRef, '${@': PythonValue }
+        while toker.current:
+            token = toker.current
+            if token in clsmap:
+                # Attempt to specutively parse the reference.  If the
+                # reference never closes, then revert to a literal.
+                value = _parse(toker.next(), clsmap[token](metadata))
+                if toker.current == "}":
+                    parent.append(value)
+                else:
+                    parent.extend(
+                        [Literal(metadata, token)] + value.field_components)
+            elif toker.current == "}" and \
+                 isinstance(parent, (VariableRef, PythonValue)):
+                return parent
+            else:
+                parent.append(Literal(metadata, toker.current))
+            toker.next()
+        return parent
+
+    return _parse(Tokenizer(str), Compound(metadata))
+
+def random_strings(count, seed=0):
+    rand = random.Random(seed)
+    pieces = ["${", "${@", "}", "$", "{", "@", "a", "FOO", " "]
+    for _ in xrange(count):
+        yield "".join(rand.choice(pieces)
+                      for _ in xrange(rand.randint(0, 20)))
+
+def check(strings):
+    for string in strings:
+        legacy = legacy_bbparse(string, None)
+        current = bbvalue.bbparse(string, None)
+        if legacy != current:
+            sys.exit("Mismatch for %r:\n  legacy:  %r\n  current: %r" %
+                     (string, legacy, current))
+
+def bench(func, strings, iterations):
+    def run():
+        for string in strings:
+            func(string, None)
+    # The legacy parser creates a class, which is freed by the garbage
+    # collector, on every call, so timeit must not disable it.
+    return min(timeit.repeat(run, setup="import gc; gc.enable()",
+                             number=iterations, repeat=3))
+
+def main():
+    parser = OptionParser(usage="%prog [options]")
+    parser.add_option("-n", "--iterations", type="int", default=1000,
+                      help="passes over the corpus per measurement")
+    options, args = parser.parse_args()
+
+    check(corpus)
+    check(random_strings(20000))
+
+    cache = bbvalue.bbparse.cache
+    legacy = bench(legacy_bbparse, corpus, options.iterations)
+    bbvalue.bbparse.cache = None
+    try:
+        uncached = bench(bbvalue.bbparse, corpus, options.iterations)
+    finally:
+        bbvalue.bbparse.cache = cache
+    cached = bench(bbvalue.bbparse, corpus, options.iterations)
+
+    per = 1e6 / (options.iterations * len(corpus))
+    print("corpus: %d values, %d iterations" % (len(corpus),
+                                                options.iterations))
+    print("%-10s %10s %10s" % ("", "us/value", "speedup"))
+    for name, time in (("legacy", legacy), ("uncached", uncached),
+                       ("cached", cached)):
+        print("%-10s %10.2f %9.2fx" % (name + ":", time * per, legacy / time))
+
+if __name__ == "__main__":
+    main()
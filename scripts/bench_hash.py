@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+"""Measure the throughput of each of the signature hash algorithms, both on
+   the raw stable_repr of the corpus and digesting each corpus value as
+   Signature does."""
+
+import sys
+import os
+import timeit
+from optparse import OptionParser
+
+basedir = os.path.dirname(os.path.abspath(os.path.dirname(__file__)))
+oedir = os.path.dirname(basedir)
+searchpath = [os.path.join(basedir, "lib"),
+              os.path.join(oedir, "openembedded", "lib"),
+              os.path.join(oedir, "bitbake", "lib")]
+sys.path[0:0] = searchpath
+
+import bbvalue
+import signature
+from bench_bbparse import corpus
+
+def bench(func, iterations):
+    return min(timeit.repeat(func, number=iterations, repeat=3))
+
+def main():
+    parser = OptionParser(usage="%prog [options] [algorithm...]")
+    parser.add_option("-n", "--iterations", type="int", default=1000,
+                      help="passes over the corpus per measurement")
+    options, args = parser.parse_args()
+
+    algorithms = args or sorted(signature.hash_algorithms)
+    values = [("CORPUS_%d" % index, bbvalue.bbparse(string, None))
+              for index, string in enumerate(corpus)]
+    data = "".join(signature.stable_repr(value) for _, value in values)
+
+    print("corpus: %d values, %d bytes of stable_repr, %d iterations" %
+          (len(values), len(data), options.iterations))
+    print("%-10s %12s %14s" % ("algorithm", "raw MB/s", "us/value"))
+    for name in algorithms:
+        new = signature.hash_algorithm(name)
+
+        def raw():
+            new(data).digest()
+
+        def per_value():
+            for key, value in values:
+                digest = new("%s\0" % key)
+                signature.write_repr(value, digest.update)
+                digest.digest()
+
+        raw_time = bench(raw, options.iterations)
+        value_time = bench(per_value, options.iterations)
+        print("%-10s %12.1f %14.2f" %
+              (name, len(data) * options.iterations / raw_time / 1e6,
+               value_time * 1e6 / (options.iterations * len(values))))
+
+if __name__ == "__main__":
+    main()
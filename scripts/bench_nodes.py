@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+"""Measure the memory used by bbvalue AST nodes, against equivalent nodes
+   which keep their attributes in a per-instance __dict__, as they did before
+   the node classes were given __slots__."""
+
+import sys
+import os
+from collections import defaultdict
+
+basedir = os.path.dirname(os.path.abspath(os.path.dirname(__file__)))
+oedir = os.path.dirname(basedir)
+searchpath = [os.path.join(basedir, "lib"),
+              os.path.join(oedir, "openembedded", "lib"),
+              os.path.join(oedir, "bitbake", "lib")]
+sys.path[0:0] = searchpath
+
+import bbvalue
+from bench_bbparse import corpus
+
+_legacy_classes = {}
+
+def legacy_node(node):
+    """Return a stand-in for node, holding the same attributes in a
+       __dict__."""
+
+    cls = node.__class__
+    if cls not in _legacy_classes:
+        _legacy_classes[cls] = type("Legacy" + cls.__name__, (object,), {})
+    legacy = _legacy_classes[cls]()
+    legacy.__dict__.update(node.__getstate__())
+    return legacy
+
+def node_size(node):
+    """The size of the node itself, excluding the values of its attributes,
+       which are the same either way."""
+
+    size = sys.getsizeof(node)
+    if hasattr(node, "__dict__"):
+        size += sys.getsizeof(node.__dict__)
+    return size
+
+def walk(node):
+    yield node
+    if isinstance(node, bbvalue.Compound):
+        for component in node.field_components:
+            for child in walk(component):
+                yield child
+
+def main():
+    counts = defaultdict(int)
+    sizes = defaultdict(int)
+    legacy_sizes = defaultdict(int)
+    for string in corpus:
+        for node in walk(bbvalue.bbparse(string, None)):
+            name = node.__class__.__name__
+            counts[name] += 1
+            sizes[name] += node_size(node)
+            legacy_sizes[name] += node_size(legacy_node(node))
+
+    print("%-12s %7s %12s %12s %8s" % ("node", "count", "dict bytes",
+                                       "slot bytes", "saving"))
+    for name in sorted(counts):
+        legacy = legacy_sizes[name] / counts[name]
+        current = sizes[name] / counts[name]
+        print("%-12s %7d %12d %12d %7d%%" % (name, counts[name], legacy,
+                                             current,
+                                             100 - 100 * current / legacy))
+
+    legacy = sum(legacy_sizes.values())
+    current = sum(sizes.values())
+    print("total: %d bytes with __dict__, %d bytes with __slots__ "
+          "(%d bytes/node saved)" % (legacy, current,
+                                     (legacy - current) / sum(counts.values())))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,619 @@
+#!/usr/bin/env python
+"""Compare the pysh lexer against the original one, which fed the input to
+   its state machine a character at a time out of lists, and is kept here as
+   the reference implementation.  Both are checked for identical tokens, or
+   identical errors, on the corpus of shell functions and on a number of
+   randomly generated scripts, before they're timed."""
+
+import sys
+import os
+import random
+import timeit
+from optparse import OptionParser
+
+basedir = os.path.dirname(os.path.abspath(os.path.dirname(__file__)))
+oedir = os.path.dirname(basedir)
+searchpath = [os.path.join(basedir, "lib"),
+              os.path.join(oedir, "openembedded", "lib"),
+              os.path.join(oedir, "bitbake", "lib")]
+sys.path[0:0] = searchpath
+
+from pysh import pyshlex
+from pysh.pyshlex import (NeedMore, ShellSyntaxError, HereDoc, TK_COMMENT,
+                          TK_NEWLINE, TK_OP, find_chars, is_blank,
+                          is_partial_op, normalize_wordtree,
+                          wordtree_as_string)
+
+class LegacyWordLexer(object):
+    """WordLexer parse quoted or expansion expressions and return an expression
+    tree. The input string can be any well formed sequence beginning with quoting
+    or expansion character. Embedded expressions are handled recursively. The
+    resulting tree is made of lists and strings. Lists represent quoted or
+    expansion expressions. Each list first element is the opening separator,
+    the last one the closing separator. In-between can be any number of strings
+    or lists for sub-expressions. Non quoted/expansion expression can written as
+    strings or as lists with empty strings as starting and ending delimiters.
+    """
+
+    NAME_CHARSET = 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_'
+    NAME_CHARSET = dict(zip(NAME_CHARSET, NAME_CHARSET))
+
+    SPECIAL_CHARSET = '@*#?-$!0'
+
+    #Characters which can be escaped depends on the current delimiters
+    ESCAPABLE = {
+        '`': set(['$', '\\', '`']),
+        '"': set(['$', '\\', '`', '"']),
+        "'": set(),
+    }
+
+    def __init__(self, heredoc = False):
+        # _buffer is the unprocessed input characters buffer
+        self._buffer = []
+        # _stack is empty or contains a quoted list being processed
+        # (this is the DFS path to the quoted expression being evaluated).
+        self._stack = []
+        self._escapable = None
+        # True when parsing unquoted here documents
+        self._heredoc = heredoc
+
+    def add(self, data, eof=False):
+        """Feed the lexer with more data. If the quoted expression can be
+        delimited, return a tuple (expr, remaining) containing the expression
+        tree and the unconsumed data.
+        Otherwise, raise NeedMore.
+        """
+        self._buffer += list(data)
+        self._parse(eof)
+
+        result = self._stack[0]
+        remaining = ''.join(self._buffer)
+        self._stack = []
+        self._buffer = []
+        return result, remaining
+
+    def _is_escapable(self, c, delim=None):
+        if delim is None:
+            if self._heredoc:
+                # Backslashes works as if they were double quoted in unquoted
+                # here-documents
+                delim = '"'
+            else:
+                if len(self._stack)<=1:
+                    return True
+                delim = self._stack[-2][0]
+
+        escapables = self.ESCAPABLE.get(delim, None)
+        return escapables is None or c in escapables
+
+    def _parse_squote(self, buf, result, eof):
+        if not buf:
+            raise NeedMore()
+        try:
+            pos = buf.index("'")
+        except ValueError:
+            raise NeedMore()
+        result[-1] += ''.join(buf[:pos])
+        result += ["'"]
+        return pos+1, True
+
+    def _parse_bquote(self, buf, result, eof):
+        if not buf:
+            raise NeedMore()
+
+        if buf[0]=='\n':
+            #Remove line continuations
+            result[:] = ['', '', '']
+        elif self._is_escapable(buf[0]):
+            result[-1] += buf[0]
+            result += ['']
+        else:
+            #Keep as such
+            result[:] = ['', '\\'+buf[0], '']
+
+        return 1, True
+
+    def _parse_dquote(self, buf, result, eof):
+        if not buf:
+            raise NeedMore()
+        pos, sep = find_chars(buf, '$\\`"')
+        if pos==-1:
+            raise NeedMore()
+
+        result[-1] += ''.join(buf[:pos])
+        if sep=='"':
+            result += ['"']
+            return pos+1, True
+        else:
+            #Keep everything until the separator and defer processing
+            return pos, False
+
+    def _parse_command(self, buf, result, eof):
+        if not buf:
+            raise NeedMore()
+
+        chars = '$\\`"\''
+        if result[0] == '$(':
+            chars += ')'
+        pos, sep = find_chars(buf, chars)
+        if pos == -1:
+            raise NeedMore()
+
+        result[-1] += ''.join(buf[:pos])
+        if (result[0]=='$(' and sep==')') or (result[0]=='`' and sep=='`'):
+            result += [sep]
+            return pos+1, True
+        else:
+            return pos, False
+
+    def _parse_parameter(self, buf, result, eof):
+        if not buf:
+            raise NeedMore()
+
+        pos, sep = find_chars(buf, '$\\`"\'}')
+        if pos==-1:
+            raise NeedMore()
+
+        result[-1] += ''.join(buf[:pos])
+        if sep=='}':
+            result += [sep]
+            return pos+1, True
+        else:
+            return pos, False
+
+    def _parse_dollar(self, buf, result, eof):
+        sep = result[0]
+        if sep=='$':
+            if not buf:
+                #TODO: handle empty $
+                raise NeedMore()
+            if buf[0]=='(':
+                if len(buf)==1:
+                    raise NeedMore()
+
+                if buf[1]=='(':
+                    result[0] = '$(('
+                    buf[:2] = []
+                else:
+                    result[0] = '$('
+                    buf[:1] = []
+
+            elif buf[0]=='{':
+                result[0] = '${'
+                buf[:1] = []
+            else:
+                if buf[0] in self.SPECIAL_CHARSET:
+                    result[-1] = buf[0]
+                    read = 1
+                else:
+                    for read,c in enumerate(buf):
+                        if c not in self.NAME_CHARSET:
+                            break
+                    else:
+                        if not eof:
+                            raise NeedMore()
+                        read += 1
+
+                    result[-1] += ''.join(buf[0:read])
+
+                if not result[-1]:
+                    result[:] = ['', result[0], '']
+                else:
+                    result += ['']
+                return read,True
+
+        sep = result[0]
+        if sep=='$(':
+            parsefunc = self._parse_command
+        elif sep=='${':
+            parsefunc = self._parse_parameter
+        else:
+            raise NotImplementedError()
+
+        pos, closed = parsefunc(buf, result, eof)
+        return pos, closed
+
+    def _parse(self, eof):
+        buf = self._buffer
+        stack = self._stack
+        recurse = False
+
+        while 1:
+            if not stack or recurse:
+                if not buf:
+                    raise NeedMore()
+                if buf[0] not in ('"\\`$\''):
+                    raise ShellSyntaxError('Invalid quoted string sequence')
+                stack.append([buf[0], ''])
+                buf[:1] = []
+                recurse = False
+
+            result = stack[-1]
+            if result[0]=="'":
+                parsefunc = self._parse_squote
+            elif result[0]=='\\':
+                parsefunc = self._parse_bquote
+            elif result[0]=='"':
+                parsefunc = self._parse_dquote
+            elif result[0]=='`':
+                parsefunc = self._parse_command
+            elif result[0][0]=='$':
+                parsefunc = self._parse_dollar
+            else:
+                raise NotImplementedError()
+
+            read, closed = parsefunc(buf, result, eof)
+
+            buf[:read] = []
+            if closed:
+                if len(stack)>1:
+                    #Merge in parent expression
+                    parsed = stack.pop()
+                    stack[-1] += [parsed]
+                    stack[-1] += ['']
+                else:
+                    break
+            else:
+                recurse = True
+
+def legacy_make_wordtree(token, here_document=False):
+    """Parse a delimited token and return a tree similar to the ones returned by
+    WordLexer. token may contain any combinations of expansion/quoted fields and
+    non-ones.
+    """
+    tree = ['']
+    remaining = token
+    delimiters = '\\$`'
+    if not here_document:
+        delimiters += '\'"'
+
+    while 1:
+        pos, sep = find_chars(remaining, delimiters)
+        if pos==-1:
+            tree += [remaining, '']
+            return normalize_wordtree(tree)
+        tree.append(remaining[:pos])
+        remaining = remaining[pos:]
+
+        try:
+            result, remaining = LegacyWordLexer(heredoc = here_document).add(remaining, True)
+        except NeedMore:
+            raise ShellSyntaxError('Invalid token "%s"')
+        tree.append(result)
+
+class LegacyHereDocLexer(object):
+    """HereDocLexer delimits whatever comes from the here-document starting newline
+    not included to the closing delimiter line included.
+    """
+    def __init__(self, op, delim):
+        assert op in ('<<', '<<-')
+        if not delim:
+            raise ShellSyntaxError('invalid here document delimiter %s' % str(delim))
+
+        self._op = op
+        self._delim = delim
+        self._buffer = []
+        self._token = []
+
+    def add(self, data, eof):
+        """If the here-document was delimited, return a tuple (content, remaining).
+        Raise NeedMore() otherwise.
+        """
+        self._buffer += list(data)
+        self._parse(eof)
+        token = ''.join(self._token)
+        remaining = ''.join(self._buffer)
+        self._token, self._remaining = [], []
+        return token, remaining
+
+    def _parse(self, eof):
+        while 1:
+            #Look for first unescaped newline. Quotes may be ignored
+            escaped = False
+            for i,c in enumerate(self._buffer):
+                if escaped:
+                    escaped = False
+                elif c=='\\':
+                    escaped = True
+                elif c=='\n':
+                    break
+            else:
+                i = -1
+
+            if i==-1 or self._buffer[i]!='\n':
+                if not eof:
+                    raise NeedMore()
+                #No more data, maybe the last line is closing delimiter
+                line = ''.join(self._buffer)
+                eol = ''
+                self._buffer[:] = []
+            else:
+                line = ''.join(self._buffer[:i])
+                eol = self._buffer[i]
+                self._buffer[:i+1] = []
+
+            if self._op=='<<-':
+                line = line.lstrip('\t')
+
+            if line==self._delim:
+                break
+
+            self._token += [line, eol]
+            if i==-1:
+                break
+
+class LegacyLexer(pyshlex.PLYLexer):
+    def __init__(self):
+        pyshlex.PLYLexer.__init__(self)
+        self._input = []
+        self._wordlexer = None
+        self._herelexer = None
+
+    def add(self, data, eof=False):
+        """Feed the lexer with data.
+
+        When eof is set to True, returns unconsumed data or raise if the lexer
+        is in the middle of a delimiting operation.
+        Raise NeedMore otherwise.
+        """
+        self._input += list(data)
+        self._parse(eof)
+        self._input[:self._pos] = []
+        return ''.join(self._input)
+
+    def _parse_normal(self):
+        c = self._input[self._pos]
+        if c=='\n':
+            self._push_token(c)
+            self._token = c
+            self._type = TK_NEWLINE
+            self._push_token('')
+            self._pos += 1
+        elif c in ('\\', '\'', '"', '`', '$'):
+            self._state = self.ST_QUOTED
+        elif is_partial_op(c):
+            self._push_token(c)
+
+            self._type = TK_OP
+            self._token += c
+            self._pos += 1
+            self._state = self.ST_OP
+        elif is_blank(c):
+            self._push_token(c)
+
+            #Discard blanks
+            self._pos += 1
+        elif self._token:
+            self._token += c
+            self._pos += 1
+        elif c=='#':
+            self._state = self.ST_COMMENT
+            self._type = TK_COMMENT
+            self._pos += 1
+        else:
+            self._pos += 1
+            self._token += c
+
+    def _parse_comment(self):
+        while 1:
+            if self._pos>=len(self._input):
+                # Comments ending the input used to raise NeedMore even at
+                # eof, which has since been fixed in both lexers.
+                return
+
+            c = self._input[self._pos]
+            if c=='\n':
+                #End of comment, do not consume the end of line
+                self._state = self.ST_NORMAL
+                break
+            else:
+                self._token += c
+                self._pos += 1
+
+    def _parse_quoted(self, eof):
+        """Precondition: the starting backquote/dollar is still in the input queue."""
+        if not self._wordlexer:
+            self._wordlexer = LegacyWordLexer()
+
+        if self._pos<len(self._input):
+             #Transfer input queue character into the subparser
+            input = self._input[self._pos:]
+            self._pos += len(input)
+
+        wtree, remaining = self._wordlexer.add(input, eof)
+        self._wordlexer = None
+        self._token += wordtree_as_string(wtree)
+
+        #Put unparsed character back in the input queue
+        if remaining:
+            self._input[self._pos:self._pos] = list(remaining)
+        self._state = self.ST_NORMAL
+
+    def _parse_heredoc(self, eof):
+        assert not self._token
+
+        if self._herelexer is None:
+            self._herelexer = LegacyHereDocLexer(self._heredoc.op, self._heredoc.name)
+
+        if self._pos<len(self._input):
+             #Transfer input queue character into the subparser
+            input = self._input[self._pos:]
+            self._pos += len(input)
+
+        self._token, remaining = self._herelexer.add(input, eof)
+
+        #Reset here-document state
+        self._herelexer = None
+        heredoc, self._heredoc = self._heredoc, HereDoc(None)
+        if remaining:
+            self._input[self._pos:self._pos] = list(remaining)
+        self._state = self.ST_NORMAL
+
+        #Push pending tokens
+        heredoc.pendings[:0] = [(self._token, self._type, heredoc.name)]
+        for token, type, delim in heredoc.pendings:
+            self._token = token
+            self._type = type
+            self._push_token(delim)
+
+# Shell functions as they appear in OpenEmbedded recipes and classes.
+corpus = [
+    """
+	oe_runmake 'DESTDIR=${D}' install
+	install -d ${D}${sysconfdir}/init.d
+	install -m 0755 ${WORKDIR}/init ${D}${sysconfdir}/init.d/${PN}
+	sed -i -e 's:/usr/bin:${bindir}:g' ${D}${sysconfdir}/init.d/${PN}
+""",
+    """
+	if [ -e ${S}/configure.ac ]; then
+		autoreconf -Wcross --verbose --install --force ${EXTRA_AUTORECONF} $acpaths || oefatal "autoreconf execution failed."
+	fi
+	if [ -e ${S}/configure ]; then
+		oe_runconf
+	else
+		oenote "nothing to configure"
+	fi
+""",
+    """
+	for f in ${S}/*.patch; do
+		# Apply each of the patches in turn
+		patch -p1 < "$f" || exit 1
+	done
+	cd ${B} && ${MAKE} ${PARALLEL_MAKE} CC="${CC}" CFLAGS="${CFLAGS} -DNDEBUG" \\
+		LDFLAGS="${LDFLAGS}" all
+""",
+    """
+	mkdir -p ${D}${libdir}/pkgconfig
+	cat > ${D}${libdir}/pkgconfig/${PN}.pc <<EOF
+prefix=${prefix}
+exec_prefix=\\${prefix}
+libdir=\\${exec_prefix}/lib
+includedir=\\${prefix}/include
+
+Name: ${PN}
+Version: ${PV}
+Libs: -L\\${libdir} -l${PN}
+Cflags: -I\\${includedir}
+EOF
+	chmod 0644 ${D}${libdir}/pkgconfig/${PN}.pc
+""",
+    """
+	case "${TARGET_ARCH}" in
+	arm*)	ARCH=arm ;;
+	i*86)	ARCH=i386 ;;
+	x86_64)	ARCH=x86_64 ;;
+	mips*)	ARCH=mips ;;
+	*)	echo "unknown architecture ${TARGET_ARCH}" >&2; exit 1 ;;
+	esac
+	export ARCH
+""",
+    """
+	for pkg in `ls ${PKGDEST}`; do
+		files=$(find ${PKGDEST}/$pkg -type f -name '*.so*' 2>/dev/null)
+		test -n "$files" && echo "$pkg: $files" >> ${T}/shlibs.list
+	done
+	rm -f ${T}/shlibs.list.tmp; touch ${T}/shlibs.list
+	[ -s ${T}/shlibs.list ] || true
+""",
+    """
+	install -d ${D}${base_sbindir} ${D}${mandir}/man8
+	for i in ${SBINPROGS}; do install -m 0755 $i ${D}${base_sbindir}/$i; done
+	ln -sf ${base_sbindir}/mke2fs ${D}${base_sbindir}/mkfs.ext2
+	oe_libinstall -a -C lib libext2fs ${STAGING_LIBDIR}
+	while read name mode; do
+		chmod $mode ${D}/$name
+	done <<-END
+		etc/shadow 0600
+		etc/gshadow 0600
+	END
+""",
+    """
+	export CROSS_COMPILE="${TARGET_PREFIX}"
+	KERNEL_VERSION=$(grep '^VERSION' ${S}/Makefile | sed -e 's/.*= *//')
+	echo "${KERNEL_VERSION}" > ${STAGING_KERNEL_DIR}/kernel-abiversion
+	oe_runmake ${KERNEL_IMAGETYPE} CC="${KERNEL_CC}" LD="${KERNEL_LD}" && \\
+		oe_runmake modules CC="${KERNEL_CC}" LD="${KERNEL_LD}"
+""",
+]
+
+def random_scripts(count, seed=0):
+    rand = random.Random(seed)
+    pieces = ["a", "b=", "2", " ", "\t", "\n", "'", '"', "`", "\\", "$",
+              "${", "$(", "$((", "}", ")", "(", "#", ";", "&", "|", "<", ">",
+              "<<", "<<-", "EOF", "\nEOF\n", "\n\tEOF", "for", "in", "do",
+              "done", "{", "!"]
+    for _ in xrange(count):
+        yield "".join(rand.choice(pieces)
+                      for _ in xrange(rand.randint(0, 20)))
+
+def lex(lexer, script):
+    """Return the tokens and remaining data, or the error, lexing script"""
+
+    try:
+        remaining = lexer.add(script, True)
+    except (NeedMore, ShellSyntaxError, NotImplementedError), e:
+        return e.__class__, str(e)
+    return [(t.value, t.type) for t in lexer._tokens], remaining
+
+def wordtree(make_wordtree, token, here_document):
+    try:
+        return make_wordtree(token, here_document)
+    except (NeedMore, ShellSyntaxError, NotImplementedError), e:
+        return e.__class__, str(e)
+
+def check(scripts):
+    for script in scripts:
+        try:
+            legacy = lex(LegacyLexer(), script)
+        except UnboundLocalError:
+            # Here-documents starting at the end of the input made the
+            # original lexer fail, the current one returns them empty.
+            continue
+        current = lex(pyshlex.PLYLexer(), script)
+        if legacy != current:
+            sys.exit("Mismatch for %r:\n  legacy:  %r\n  current: %r" %
+                     (script, legacy, current))
+
+        for here_document in (False, True):
+            legacy = wordtree(legacy_make_wordtree, script, here_document)
+            current = wordtree(pyshlex.make_wordtree, script, here_document)
+            if legacy != current:
+                sys.exit("Mismatch for make_wordtree(%r, %r):\n"
+                         "  legacy:  %r\n  current: %r" %
+                         (script, here_document, legacy, current))
+
+def bench(lexer, scripts, iterations):
+    def run():
+        for script in scripts:
+            lexer().add(script, True)
+    return min(timeit.repeat(run, number=iterations, repeat=3))
+
+def main():
+    parser = OptionParser(usage="%prog [options]")
+    parser.add_option("-n", "--iterations", type="int", default=100,
+                      help="passes over the corpus per measurement")
+    options, args = parser.parse_args()
+
+    check(corpus)
+    check(random_scripts(20000))
+
+    # The whole corpus as a single script shows how the time taken grows
+    # with the length of the input.
+    whole = ["".join(corpus)]
+    print("corpus: %d scripts, %d bytes, %d iterations" %
+          (len(corpus), len(whole[0]), options.iterations))
+    print("%-8s %14s %14s" % ("", "us/script", "us/corpus"))
+    times = {}
+    for name, lexer in (("legacy", LegacyLexer), ("current", pyshlex.PLYLexer)):
+        times[name] = (bench(lexer, corpus, options.iterations),
+                       bench(lexer, whole, options.iterations))
+        print("%-8s %14.2f %14.2f" %
+              (name + ":",
+               times[name][0] * 1e6 / (options.iterations * len(corpus)),
+               times[name][1] * 1e6 / options.iterations))
+    print("%-8s %13.2fx %13.2fx" %
+          ("speedup:", times["legacy"][0] / times["current"][0],
+           times["legacy"][1] / times["current"][1]))
+
+if __name__ == "__main__":
+    main()
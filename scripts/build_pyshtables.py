@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+"""Generate lib/pysh/pyshtables.py, the LALR tables for the pysh grammar,
+   which pyshyacc loads without having ply reflect upon the grammar.
+
+   ply numbers the parser states in the order it iterates over dicts and
+   sets, so the tables are generated with hash randomization disabled, which
+   makes the output the same from one run to the next."""
+
+import sys
+import os
+import tempfile
+from optparse import OptionParser
+
+basedir = os.path.dirname(os.path.abspath(os.path.dirname(__file__)))
+oedir = os.path.dirname(basedir)
+searchpath = [os.path.join(basedir, "lib"),
+              os.path.join(oedir, "openembedded", "lib"),
+              os.path.join(oedir, "bitbake", "lib")]
+sys.path[0:0] = searchpath
+
+def main():
+    parser = OptionParser(usage="%prog [options]")
+    parser.add_option("-c", "--check", action="store_true",
+                      help="only check that the tables are up to date, "
+                           "exiting non-zero if they are not")
+    parser.add_option("-o", "--output",
+                      default=os.path.join(basedir, "lib", "pysh",
+                                           "pyshtables.py"),
+                      help="where to write the tables (default is %default)")
+    options, args = parser.parse_args()
+
+    if os.environ.get("PYTHONHASHSEED") != "0":
+        os.environ["PYTHONHASHSEED"] = "0"
+        os.execv(sys.executable, [sys.executable] + sys.argv)
+
+    shipped = None
+    if os.path.exists(options.output):
+        shipped = open(options.output, "rb").read()
+
+    from pysh import pyshyacc
+
+    tables = pyshyacc.generate_tables()
+    if options.check:
+        fd, path = tempfile.mkstemp(suffix=".py")
+        os.close(fd)
+        try:
+            pyshyacc.write_tables(path, tables)
+            current = open(path, "rb").read() == shipped
+        finally:
+            os.unlink(path)
+        if not current:
+            sys.exit("%s is out of date, run %s" % (options.output,
+                                                     sys.argv[0]))
+    else:
+        pyshyacc.write_tables(options.output, tables)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+"""Explain why two signature dumps, as written by do_write_signature to
+   BB_HASH_OUTPUT, differ: list the variables which were added, removed or
+   changed, with the path of references from the task to each of them."""
+
+import sys
+import os
+from optparse import OptionParser
+
+basedir = os.path.dirname(os.path.abspath(os.path.dirname(__file__)))
+oedir = os.path.dirname(basedir)
+searchpath = [os.path.join(basedir, "lib"),
+              os.path.join(oedir, "openembedded", "lib"),
+              os.path.join(oedir, "bitbake", "lib")]
+sys.path[0:0] = searchpath
+
+import sigdiff
+
+def main():
+    parser = OptionParser(usage="%prog [options] OLD NEW")
+    parser.add_option("-t", "--task", action="append", dest="tasks",
+                      help="variable to explain the changes to (default is "
+                           "those no other variable references), may be "
+                           "given more than once")
+    parser.add_option("-v", "--verbose", action="store_true",
+                      help="show the old and new data of each variable")
+    options, args = parser.parse_args()
+    if len(args) != 2:
+        parser.error("expected two signature dumps")
+
+    old, new = sigdiff.load(args[0]), sigdiff.load(args[1])
+    changes = sigdiff.diff(old, new, options.tasks)
+    for change in changes:
+        if change.path:
+            print("%-8s %s" % (change.kind, " -> ".join(change.path)))
+        else:
+            print("%-8s %s (not reached)" % (change.kind, change.key))
+
+        if options.verbose:
+            if change.key in old.data:
+                print("  - %s" % old.data[change.key])
+            if change.key in new.data:
+                print("  + %s" % new.data[change.key])
+
+    if changes:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+"""Print the signatures of pickled datastores, computed by a pool of worker
+   processes.  Each datastore is a pair of pickle files, NAME.vars holding a
+   dict of the unexpanded variable values, and NAME.flags holding a dict of
+   their flags, as produced by signature.raw_metadata."""
+
+import sys
+import os
+import cPickle as pickle
+from optparse import OptionParser
+
+basedir = os.path.dirname(os.path.abspath(os.path.dirname(__file__)))
+oedir = os.path.dirname(basedir)
+searchpath = [os.path.join(basedir, "lib"),
+              os.path.join(oedir, "openembedded", "lib"),
+              os.path.join(oedir, "bitbake", "lib")]
+sys.path[0:0] = searchpath
+
+import signature
+
+def load(path):
+    """Load the raw metadata from NAME.vars and NAME.flags, given either"""
+
+    base = os.path.splitext(path)[0]
+    values = pickle.load(open(base + ".vars", "rb"))
+    flags = pickle.load(open(base + ".flags", "rb"))
+    return values, flags
+
+def main():
+    parser = OptionParser(usage="%prog [options] NAME.vars...")
+    parser.add_option("-j", "--workers", type="int",
+                      help="number of worker processes (default is one per "
+                           "cpu)")
+    parser.add_option("-k", "--key", action="append", dest="keys",
+                      help="variable to sign (default is every task), may "
+                           "be given more than once")
+    parser.add_option("-b", "--blacklist",
+                      help="space separated globs of variables to exclude "
+                           "(default is BB_HASH_BLACKLIST)")
+    parser.add_option("-a", "--algorithm",
+                      help="hash algorithm, one of %s (default is "
+                           "BB_HASH_ALGORITHM, or md5)" %
+                           ", ".join(sorted(signature.hash_algorithms)))
+    options, args = parser.parse_args()
+    if not args:
+        parser.error("no datastores given")
+
+    blacklist = options.blacklist and options.blacklist.split()
+    signatures = signature.sign_many((load(path) for path in args),
+                                     options.workers, options.keys,
+                                     blacklist, options.algorithm)
+    for path, value in zip(args, signatures):
+        print("%s %s" % (value, path))
+
+if __name__ == "__main__":
+    main()